@@ -1,10 +1,14 @@
 import json
 import os
 import re
+import time
 from typing import Dict, Any, Optional
 from app.adapters.llm_adapter import LLMAdapter
 from app.models.denuncia import SeveridadeDenuncia
 
+# Segundos em que o resultado de is_available() é reaproveitado
+AVAILABILITY_TTL = 300
+
 
 class OpenAIAdapter(LLMAdapter):
     """
@@ -12,22 +16,26 @@ class OpenAIAdapter(LLMAdapter):
     Implementa a interface LLMAdapter para análise de severidade.
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4-turbo"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4-turbo", http_client: Any = None):
         """
         Inicializa o adapter OpenAI.
 
         Args:
             api_key: Chave da API OpenAI (se não fornecida, busca em variável de ambiente)
             model: Modelo a ser usado (default: gpt-4-turbo)
+            http_client: Cliente httpx compartilhado (opcional); sem ele o SDK cria o seu
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         self.model = model
         self.client = None
+        self._available: Optional[bool] = None
+        self._available_checked_at = 0.0
 
         if self.api_key:
             try:
                 import openai
-                self.client = openai.OpenAI(api_key=self.api_key)
+                self.client = openai.OpenAI(
+                    api_key=self.api_key, http_client=http_client)
             except ImportError:
                 raise ImportError(
                     "Biblioteca 'openai' não encontrada. Instale com: pip install openai")
@@ -105,15 +113,23 @@ class OpenAIAdapter(LLMAdapter):
     def is_available(self) -> bool:
         """
         Verifica se o serviço OpenAI está disponível.
+        O resultado é reaproveitado por AVAILABILITY_TTL segundos, evitando
+        uma chamada à API a cada análise.
         """
         if not self.api_key or not self.client:
             return False
 
+        now = time.monotonic()
+        if self._available is not None and now - self._available_checked_at < AVAILABILITY_TTL:
+            return self._available
+
         try:
             self.client.models.list()
-            return True
+            self._available = True
         except:
-            return False
+            self._available = False
+        self._available_checked_at = now
+        return self._available
 
     def get_provider_name(self) -> str:
         """
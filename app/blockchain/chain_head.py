@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+
+class ChainHeadCache:
+    """
+    Cache of the chain head state (block number, total reports).
+    The total is only re-read when the block number advances, so every
+    request served within the same block shares a single lookup.
+
+    The heads seen over the last `confirmations` blocks are kept, so the
+    total at a confirmed depth is known without a historical eth_call.
+    """
+
+    def __init__(self, max_age: float, confirmations: int = 0):
+        """
+        Args:
+            max_age: Seconds a checked head is served without asking the node
+                for the latest block number again.
+            confirmations: Depth, in blocks, of get_confirmed_total.
+        """
+        self.max_age = max_age
+        self.confirmations = confirmations
+        self._lock = threading.Lock()
+        self._block_number: Optional[int] = None
+        self._total_reports: Optional[int] = None
+        self._checked_at = 0.0
+        # (block_number, total_reports) of the heads seen, oldest first; the
+        # first entry is the newest one at least `confirmations` deep
+        self._history: Deque[Tuple[int, int]] = deque()
+
+    def get_fresh(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the cached (block_number, total_reports) if it was checked less
+        than max_age seconds ago.
+        """
+        with self._lock:
+            if self._block_number is not None and time.monotonic() - self._checked_at <= self.max_age:
+                return self._block_number, self._total_reports
+        return None
+
+    def update(self, block_number: int, fetch_total: Callable[[int], int]) -> Tuple[int, int]:
+        """
+        Record the latest block number, calling fetch_total(block_number)
+        only if the block advanced past the cached one.
+
+        Returns:
+            The cached (block_number, total_reports) after the update.
+        """
+        with self._lock:
+            if self._block_number is not None and block_number <= self._block_number:
+                self._checked_at = time.monotonic()
+                return self._block_number, self._total_reports
+
+        total_reports = fetch_total(block_number)
+
+        with self._lock:
+            if self._block_number is None or block_number > self._block_number:
+                self._block_number = block_number
+                self._total_reports = total_reports
+                self._record(block_number, total_reports)
+            self._checked_at = time.monotonic()
+            return self._block_number, self._total_reports
+
+    def get_confirmed_total(self) -> int:
+        """
+        Get the total reports at the newest head seen at least
+        `confirmations` blocks below the current one. Reports are only ever
+        appended, so this is a lower bound of the confirmed total; it is 0
+        until the head has been followed for that many blocks.
+        """
+        with self._lock:
+            if not self._history:
+                return 0
+            block_number, total_reports = self._history[0]
+            if block_number > self._block_number - self.confirmations:
+                return 0
+            return total_reports
+
+    def _record(self, block_number: int, total_reports: int) -> None:
+        """
+        Add a head to the history, dropping those no longer needed.
+        Must be called with the lock held.
+        """
+        self._history.append((block_number, total_reports))
+        confirmed_block = block_number - self.confirmations
+        while len(self._history) > 1 and self._history[1][0] <= confirmed_block:
+            self._history.popleft()
@@ -0,0 +1,139 @@
+import math
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# ABI-encoded strings take 32-byte words, so the gas of a call only changes
+# when an argument crosses a word boundary.
+WORD_SIZE = 32
+
+
+def percentile(values: List[int], pct: float) -> int:
+    """
+    Nearest-rank percentile of a non-empty list.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class GasOracle:
+    """
+    Fee and gas-limit cache for contract transactions.
+
+    refresh() is meant to run on a background worker: it samples
+    eth_feeHistory into a rolling window of per-block priority fees and
+    estimates the gas of calls that were asked for but not cached yet.
+    get_fees() and get_gas_limit() never call the node, so submissions pay
+    no extra round-trip; until the cache is warm they return the defaults.
+    """
+
+    def __init__(
+        self,
+        fetch_fee_history: Callable[[int, List[float]], Dict[str, Any]],
+        estimators: Dict[str, Callable[[int], int]],
+        block_count: int,
+        window: int,
+        reward_percentile: float,
+        limit_margin: float,
+        default_gas_limit: int,
+        default_priority_fee: int,
+        default_max_fee: int
+    ):
+        """
+        Args:
+            fetch_fee_history: Calls eth_feeHistory with (block_count,
+                reward_percentiles) for the latest blocks.
+            estimators: Gas estimators by contract function name, called with
+                the argument length (in bytes) to estimate for.
+            block_count: Blocks requested per eth_feeHistory call.
+            window: Blocks kept in the rolling priority fee window.
+            reward_percentile: Percentile of the priority fees paid inside
+                each block, and of the per-block values across the window.
+            limit_margin: Multiplier applied to gas estimates.
+            default_gas_limit: Gas limit used while an estimate is missing.
+            default_priority_fee: maxPriorityFeePerGas (wei) used while no
+                fee history has been sampled.
+            default_max_fee: maxFeePerGas (wei) used while no fee history has
+                been sampled.
+        """
+        self._fetch_fee_history = fetch_fee_history
+        self._estimators = estimators
+        self.block_count = block_count
+        self.reward_percentile = reward_percentile
+        self.limit_margin = limit_margin
+        self.default_gas_limit = default_gas_limit
+        self.default_priority_fee = default_priority_fee
+        self.default_max_fee = default_max_fee
+        self._lock = threading.Lock()
+        self._rewards: deque = deque(maxlen=max(1, window))
+        self._next_block: Optional[int] = None
+        self._base_fee: Optional[int] = None
+        self._gas_limits: Dict[Tuple[str, int], int] = {}
+        self._wanted: Set[Tuple[str, int]] = set()
+
+    def get_fees(self) -> Tuple[int, int]:
+        """
+        Get (maxPriorityFeePerGas, maxFeePerGas) in wei. The max fee leaves
+        room for the base fee to double before the transaction is priced out.
+        """
+        with self._lock:
+            if not self._rewards or self._base_fee is None:
+                return self.default_priority_fee, self.default_max_fee
+
+            priority_fee = percentile(list(self._rewards), self.reward_percentile)
+            return priority_fee, 2 * self._base_fee + priority_fee
+
+    def get_gas_limit(self, function_name: str, arg_length: int = 0) -> int:
+        """
+        Get the cached gas limit of a call whose variable-length argument has
+        arg_length bytes. On a miss, the default is returned and the bucket is
+        estimated on the next refresh.
+        """
+        key = (function_name, arg_length // WORD_SIZE)
+        with self._lock:
+            gas_limit = self._gas_limits.get(key)
+            if gas_limit is None:
+                self._wanted.add(key)
+                return self.default_gas_limit
+            return gas_limit
+
+    def refresh(self) -> None:
+        """
+        Sample the latest fee history and estimate the wanted gas buckets.
+        """
+        self._sample_fee_history()
+        self._estimate_wanted()
+
+    def _sample_fee_history(self) -> None:
+        history = self._fetch_fee_history(
+            self.block_count, [self.reward_percentile])
+        oldest_block = int(history["oldestBlock"])
+        rewards = history.get("reward") or []
+
+        with self._lock:
+            for offset, block_rewards in enumerate(rewards):
+                block_number = oldest_block + offset
+                if self._next_block is not None and block_number < self._next_block:
+                    continue
+                self._rewards.append(int(block_rewards[0]))
+                self._next_block = block_number + 1
+
+            # The last base fee is the one of the next, not yet mined, block.
+            if history.get("baseFeePerGas"):
+                self._base_fee = int(history["baseFeePerGas"][-1])
+
+    def _estimate_wanted(self) -> None:
+        with self._lock:
+            wanted = list(self._wanted)
+
+        for function_name, bucket in wanted:
+            estimator = self._estimators.get(function_name)
+            if estimator is None:
+                continue
+
+            # Estimate for the longest argument of the bucket.
+            gas = estimator((bucket + 1) * WORD_SIZE - 1)
+            with self._lock:
+                self._gas_limits[(function_name, bucket)] = int(gas * self.limit_margin)
+                self._wanted.discard((function_name, bucket))
@@ -0,0 +1,173 @@
+import asyncio
+import bisect
+import hashlib
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Gas charged by the emulated contract calls, close to what the real
+# DenunciaAnonima contract uses: a base cost plus one storage slot per
+# 32-byte word of the string arguments.
+BASE_GAS = 50000
+GAS_PER_WORD = 20000
+LOTE_MERKLE_GAS = 95000
+GAS_PRICE_WEI = 30 * 10**9
+
+
+class LocalChainError(Exception):
+    """
+    Raised by the local chain for reverted calls and injected failures.
+    """
+    pass
+
+
+class LocalChain:
+    """
+    In-process emulation of the DenunciaAnonima contract
+    (contracts/report.sol) on an automining chain: every transaction is
+    mined in its own block right away.
+
+    Every call first waits `latency` seconds and then fails with
+    probability `failure_rate`, to benchmark and test the application
+    without a node. State lives in memory only and is shared by every
+    provider instance of the process.
+    """
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, balance_wei: int = 100 * 10**18):
+        """
+        Args:
+            latency: Seconds added to every call.
+            failure_rate: Probability (0 to 1) of a call failing.
+            balance_wei: Starting balance of the sending account.
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._lock = threading.Lock()
+        self._denuncias: List[Tuple[str, int, str]] = []
+        # Block in which each denuncia was registered, in registration order
+        self._denuncia_blocks: List[int] = []
+        self._lotes: List[Tuple[bytes, int, int]] = []
+        self._receipts: Dict[str, Dict[str, int]] = {}
+        self._block_number = 0
+        self._balance_wei = balance_wei
+
+    def simulate(self) -> None:
+        """
+        Apply the configured latency and failure injection to a sync call.
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+        self._maybe_fail()
+
+    async def simulate_async(self) -> None:
+        """
+        Apply the configured latency and failure injection to an async call.
+        """
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        self._maybe_fail()
+
+    def _maybe_fail(self) -> None:
+        if self.failure_rate > 0 and random.random() < self.failure_rate:
+            raise LocalChainError("Injected local chain failure")
+
+    @staticmethod
+    def estimate_denuncia_gas(hash_dados: str, categoria: str) -> int:
+        """
+        Gas used by registrarDenuncia with the given arguments.
+        """
+        words = (len(hash_dados.encode()) + 31) // 32 + (len(categoria.encode()) + 31) // 32
+        return BASE_GAS + GAS_PER_WORD * words
+
+    def registrar_denuncia(self, hash_dados: str, categoria: str) -> str:
+        """
+        Append a denuncia in a new block. Returns the transaction hash.
+        """
+        with self._lock:
+            block_number = self._mine()
+            self._denuncias.append((hash_dados, int(time.time()), categoria))
+            self._denuncia_blocks.append(block_number)
+            return self._record_receipt(
+                block_number, self.estimate_denuncia_gas(hash_dados, categoria),
+                f"denuncia:{len(self._denuncias) - 1}")
+
+    def registrar_lote_merkle(self, raiz: bytes, quantidade: int) -> str:
+        """
+        Append a Merkle batch root in a new block. Returns the transaction hash.
+        """
+        with self._lock:
+            block_number = self._mine()
+            self._lotes.append((raiz, quantidade, int(time.time())))
+            return self._record_receipt(
+                block_number, LOTE_MERKLE_GAS, f"lote:{len(self._lotes) - 1}")
+
+    def obter_total_denuncias(self, block_number: Optional[int] = None) -> int:
+        """
+        Get the number of denuncias, as of block_number when given.
+        """
+        with self._lock:
+            if block_number is None:
+                return len(self._denuncias)
+            return bisect.bisect_right(self._denuncia_blocks, block_number)
+
+    def obter_denuncia(self, id_denuncia: int) -> Tuple[str, int, str]:
+        """
+        Get a denuncia as (hashDados, dataHora, categoria).
+        """
+        with self._lock:
+            if id_denuncia < 0 or id_denuncia >= len(self._denuncias):
+                raise LocalChainError("execution reverted: index out of bounds")
+            return self._denuncias[id_denuncia]
+
+    def obter_denuncias(self, start: int, end: int) -> List[Tuple[str, int, str]]:
+        """
+        Get denuncias [start, end), truncated at the total.
+        """
+        with self._lock:
+            return self._denuncias[max(0, start):end]
+
+    def get_block_number(self) -> int:
+        with self._lock:
+            return self._block_number
+
+    def get_denuncia_logs(self, from_block: int, to_block: int) -> List[Tuple[int, str, int, str]]:
+        """
+        Get the DenunciaRegistrada events of a block range (inclusive).
+        """
+        with self._lock:
+            start = bisect.bisect_left(self._denuncia_blocks, from_block)
+            end = bisect.bisect_right(self._denuncia_blocks, to_block)
+            return [(report_id, *self._denuncias[report_id])
+                    for report_id in range(start, end)]
+
+    def get_receipt(self, tx_hash: str) -> Optional[Dict[str, int]]:
+        with self._lock:
+            receipt = self._receipts.get(tx_hash)
+            return dict(receipt) if receipt else None
+
+    def get_balance(self) -> int:
+        with self._lock:
+            return self._balance_wei
+
+    def _mine(self) -> int:
+        self._block_number += 1
+        return self._block_number
+
+    def _record_receipt(self, block_number: int, gas_used: int, seed: str) -> str:
+        tx_hash = "0x" + hashlib.sha256(
+            f"{block_number}:{seed}".encode()).hexdigest()
+        self._receipts[tx_hash] = {
+            "block_number": block_number,
+            "gas_used": gas_used,
+            "status": 1
+        }
+        self._balance_wei -= gas_used * GAS_PRICE_WEI
+        return tx_hash
+
+
+local_chain = LocalChain(
+    latency=settings.LOCAL_CHAIN_LATENCY_MS / 1000,
+    failure_rate=settings.LOCAL_CHAIN_FAILURE_RATE)
@@ -0,0 +1,172 @@
+import asyncio
+import heapq
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Set
+
+
+class NonceManager:
+    """
+    Hands out transaction nonces for a single sending account locally.
+
+    The next nonce is read once from the node's `pending` transaction count
+    and then incremented in memory, so concurrent submissions never share a
+    nonce and don't pay a get_transaction_count round-trip each.
+
+    A failed submission leaves a gap that keeps the node from mining the
+    nonces after it, so its nonce is handed out again. New allocations wait
+    until the reservations already handed out have finished, then sync:
+    failed nonces the node's pending count shows as still missing are
+    reused first. The counter itself never moves back, since the nonces
+    after a gap may already be broadcast.
+    """
+
+    def __init__(self, fetch_pending_count: Callable[[], int]):
+        """
+        Args:
+            fetch_pending_count: Returns the account's transaction count,
+                including pending transactions.
+        """
+        self._fetch_pending_count = fetch_pending_count
+        self._lock = threading.Lock()
+        # Notified when the last outstanding reservation is released
+        self._drained = threading.Condition(self._lock)
+        self._sync_lock = threading.Lock()
+        self._next_nonce: Optional[int] = None
+        # Nonces handed out by reserve() whose submission hasn't finished
+        self._outstanding = 0
+        # Nonces of failed submissions, and those confirmed missing on the
+        # node and waiting to be handed out again
+        self._failed: Set[int] = set()
+        self._free: List[int] = []
+        # A submission failed: sync before handing out another nonce
+        self._stale = False
+
+    def sync(self) -> int:
+        """
+        Re-read the pending transaction count from the node.
+
+        Returns:
+            The next new nonce that will be handed out.
+        """
+        with self._sync_lock:
+            pending_count = self._fetch_pending_count()
+            with self._lock:
+                self._apply_pending_count(pending_count)
+                return self._next_nonce
+
+    def invalidate(self) -> None:
+        """
+        Mark the local counter stale, forcing a sync on the next allocation
+        once no reservation is outstanding.
+        """
+        with self._lock:
+            self._stale = True
+
+    def allocate(self) -> int:
+        """
+        Get the next nonce, syncing from the node first if needed.
+        """
+        return self._allocate(reserve=False)
+
+    async def allocate_async(self) -> int:
+        """
+        Asyncio variant of allocate. A sync with the node runs in a worker
+        thread, so the event loop is never blocked on the RPC call.
+        """
+        return await self._allocate_async(reserve=False)
+
+    @contextmanager
+    def reserve(self) -> Iterator[int]:
+        """
+        Allocate a nonce for one submission. If the block raises, the nonce
+        is recorded as failed and the counter resyncs before it is reused.
+        """
+        nonce = self._allocate(reserve=True)
+        try:
+            yield nonce
+        except Exception:
+            self._fail(nonce)
+            raise
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def reserve_async(self) -> AsyncIterator[int]:
+        """
+        Asyncio variant of reserve.
+        """
+        nonce = await self._allocate_async(reserve=True)
+        try:
+            yield nonce
+        except Exception:
+            self._fail(nonce)
+            raise
+        finally:
+            self._release()
+
+    def _take(self, reserve: bool) -> Optional[int]:
+        """
+        Hand out the next nonce, or None if the counter needs a sync.
+        """
+        with self._lock:
+            if self._next_nonce is None or self._stale:
+                return None
+            if self._free:
+                nonce = heapq.heappop(self._free)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            if reserve:
+                self._outstanding += 1
+            return nonce
+
+    def _allocate(self, reserve: bool) -> int:
+        while True:
+            nonce = self._take(reserve)
+            if nonce is not None:
+                return nonce
+
+            with self._sync_lock:
+                with self._lock:
+                    while self._stale and self._outstanding:
+                        self._drained.wait()
+                    needs_sync = self._next_nonce is None or self._stale
+                if needs_sync:
+                    pending_count = self._fetch_pending_count()
+                    with self._lock:
+                        self._apply_pending_count(pending_count)
+
+    async def _allocate_async(self, reserve: bool) -> int:
+        nonce = self._take(reserve)
+        if nonce is not None:
+            return nonce
+        return await asyncio.to_thread(self._allocate, reserve)
+
+    def _apply_pending_count(self, pending_count: int) -> None:
+        """
+        Move the counter up to the node's pending count. With no reservation
+        outstanding, failed nonces the node still lacks are queued to be
+        handed out again. Must be called with the lock held.
+        """
+        if self._next_nonce is None:
+            self._next_nonce = pending_count
+            return
+
+        self._next_nonce = max(self._next_nonce, pending_count)
+        if not self._outstanding:
+            self._free = sorted(
+                nonce for nonce in self._failed.union(self._free) if nonce >= pending_count)
+            self._failed.clear()
+            self._stale = False
+
+    def _fail(self, nonce: int) -> None:
+        with self._lock:
+            self._failed.add(nonce)
+            self._stale = True
+
+    def _release(self) -> None:
+        with self._lock:
+            self._outstanding -= 1
+            if not self._outstanding:
+                self._drained.notify_all()
@@ -1,33 +1,82 @@
-from web3 import Web3
+from web3 import Web3, AsyncWeb3
 import json
 import os
+from app.blockchain.chain_head import ChainHeadCache
+from app.blockchain.gas_oracle import GasOracle
+from app.blockchain.nonce_manager import NonceManager
+from app.blockchain.report_cache import ReportFileCache
+from app.blockchain.rpc_pool import AsyncPooledHTTPProvider, PooledHTTPProvider, RpcPool
 from app.core.config import settings
+from app.core.providers import providers
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 ABI_PATH = os.path.join(BASE_DIR, "contracts", "report_abi.json")
 with open(ABI_PATH, "r") as f:
     ABI_CONTRATO = json.load(f)
 
-w3 = Web3(Web3.HTTPProvider(settings.POLYGON_RPC))
+rpc_pool = RpcPool(
+    settings.POLYGON_RPC_URLS,
+    alpha=settings.RPC_POOL_EWMA_ALPHA,
+    eject_after=settings.RPC_POOL_EJECT_AFTER,
+    max_error_rate=settings.RPC_POOL_MAX_ERROR_RATE,
+)
+rpc_provider = PooledHTTPProvider(
+    rpc_pool,
+    session=providers.get_http_session(),
+    request_kwargs={"timeout": settings.HTTP_TIMEOUT},
+)
+
+w3 = Web3(rpc_provider)
 contract = w3.eth.contract(address=settings.CONTRACT_ADDRESS, abi=ABI_CONTRATO)
 
+async_w3 = AsyncWeb3(AsyncPooledHTTPProvider(rpc_pool))
+async_contract = async_w3.eth.contract(address=settings.CONTRACT_ADDRESS, abi=ABI_CONTRATO)
+
+chain_head = ChainHeadCache(
+    settings.CHAIN_HEAD_MAX_AGE, settings.REPORT_CACHE_CONFIRMATIONS)
+
+nonce_manager = NonceManager(
+    lambda: w3.eth.get_transaction_count(settings.PUBLIC_ADDRESS, "pending"))
+
+gas_oracle = GasOracle(
+    fetch_fee_history=lambda block_count, percentiles: w3.eth.fee_history(
+        block_count, "latest", percentiles),
+    estimators={
+        "registrarDenuncia": lambda length: contract.functions.registrarDenuncia(
+            "0" * 64, "x" * length).estimate_gas({'from': settings.PUBLIC_ADDRESS}),
+        "registrarLoteMerkle": lambda length: contract.functions.registrarLoteMerkle(
+            b"\x00" * 32, 1).estimate_gas({'from': settings.PUBLIC_ADDRESS}),
+    },
+    block_count=settings.GAS_ORACLE_BLOCKS,
+    window=settings.GAS_ORACLE_WINDOW,
+    reward_percentile=settings.GAS_ORACLE_PERCENTILE,
+    limit_margin=settings.GAS_LIMIT_MARGIN,
+    default_gas_limit=300000,
+    default_priority_fee=w3.to_wei('25', 'gwei'),
+    default_max_fee=w3.to_wei('50', 'gwei'),
+)
+
+report_cache = ReportFileCache(os.path.join(
+    settings.REPORT_CACHE_DIR, f"reports-{settings.CONTRACT_ADDRESS}.bin")) if settings.REPORT_CACHE_ENABLED else None
+
 def registrar_denuncia(hash_dados: str, categoria: str) -> str:
     """
     Envia transação para registrar denúncia na blockchain
     Retorna o tx_hash.
     """
-    nonce = w3.eth.get_transaction_count(settings.PUBLIC_ADDRESS)
-
-    txn = contract.functions.registrarDenuncia(hash_dados, categoria).build_transaction({
-        'nonce': nonce,
-        'gas': 300000,
-        'maxPriorityFeePerGas': w3.to_wei('25', 'gwei'),  
-        'maxFeePerGas': w3.to_wei('50', 'gwei'),  
-    })
-
-    signed_txn = w3.eth.account.sign_transaction(txn, private_key=settings.PRIVATE_KEY)
-    
-    tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+    max_priority_fee, max_fee = gas_oracle.get_fees()
+
+    with nonce_manager.reserve() as nonce:
+        txn = contract.functions.registrarDenuncia(hash_dados, categoria).build_transaction({
+            'nonce': nonce,
+            'gas': gas_oracle.get_gas_limit("registrarDenuncia", len(categoria.encode())),
+            'maxPriorityFeePerGas': max_priority_fee,
+            'maxFeePerGas': max_fee,
+        })
+
+        signed_txn = w3.eth.account.sign_transaction(txn, private_key=settings.PRIVATE_KEY)
+        
+        tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
 
     return w3.to_hex(tx_hash)
 
@@ -0,0 +1,237 @@
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking
+    fcntl = None
+
+MAGIC = b"DNRC"
+VERSION = 1
+HEADER = struct.Struct("<4sI8x")
+# hashDados as 32 raw bytes, dataHora as uint64, categoria as a dictionary id
+# and flags; files written before flags existed have zero padding there
+RECORD = struct.Struct("<32sQII")
+HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+# hashDados is not 64 lowercase hex digits and is kept in the '.hashes' sidecar
+FLAG_RAW_HASH = 1
+
+
+class ReportFileCache:
+    """
+    Append-only, fixed-record file cache of on-chain reports.
+
+    Record i holds report i of the contract, so the cache is always a
+    contiguous prefix of the denuncias array. Reads go through a shared
+    memory map; appends take an exclusive file lock, so the cache can be
+    shared by every uvicorn worker and survives restarts. Categories are
+    dictionary-encoded in a JSON-lines sidecar file. registrarDenuncia
+    accepts any string, so a hashDados that doesn't fit in 32 raw bytes is
+    stored as-is in a second sidecar file and its record is flagged.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path of the records file. The category dictionary and
+                the hashes that aren't 32 bytes of hex are stored next to it
+                with '.categories' and '.hashes' suffixes.
+        """
+        self.path = path
+        self.categories_path = path + ".categories"
+        self.raw_hashes_path = path + ".hashes"
+        self._lock = threading.RLock()
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._categories: List[str] = []
+        self._category_ids: Dict[str, int] = {}
+        self._raw_hashes: Dict[int, str] = {}
+        self._raw_hashes_size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._open()
+            return self._count(os.fstat(self._file.fileno()).st_size)
+
+    def get(self, report_id: int) -> Optional[Tuple[str, int, str]]:
+        """
+        Get a cached report, or None if it is past the cached tail.
+        """
+        reports = self.get_range(report_id, report_id + 1)
+        return reports[0] if reports else None
+
+    def get_range(self, start: int, end: int) -> List[Tuple[str, int, str]]:
+        """
+        Get cached reports [start, end), truncated at the cached tail.
+        """
+        with self._lock:
+            self._open()
+            end = min(end, self._remap())
+            if start < 0 or start >= end:
+                return []
+
+            reports = []
+            with memoryview(self._mm) as view:
+                for report_id in range(start, end):
+                    offset = HEADER.size + report_id * RECORD.size
+                    _, data_hora, category_id, flags = RECORD.unpack_from(view, offset)
+                    if flags & FLAG_RAW_HASH:
+                        hash_dados = self._get_raw_hash(report_id)
+                    else:
+                        hash_dados = view[offset:offset + 32].hex()
+                    reports.append(
+                        (hash_dados, data_hora, self._get_category(category_id)))
+            return reports
+
+    def append(self, start_id: int, reports: List[Tuple[str, int, str]]) -> int:
+        """
+        Append reports starting at start_id. Reports already cached are
+        skipped; nothing is written if start_id is past the cached tail.
+
+        Returns:
+            The number of records written.
+        """
+        with self._lock:
+            self._open()
+            self._flock(True)
+            try:
+                count = self._count(os.fstat(self._file.fileno()).st_size)
+                if start_id > count:
+                    return 0
+
+                records = []
+                for report_id, (hash_dados, data_hora, categoria) in enumerate(
+                        reports[count - start_id:], count):
+                    if HASH_PATTERN.match(hash_dados):
+                        raw_hash, flags = bytes.fromhex(hash_dados), 0
+                    else:
+                        self._add_raw_hash(report_id, hash_dados)
+                        raw_hash, flags = bytes(32), FLAG_RAW_HASH
+                    records.append(RECORD.pack(
+                        raw_hash, data_hora, self._get_category_id(categoria), flags))
+
+                if records:
+                    # Drop a torn record left by an interrupted append.
+                    self._file.truncate(HEADER.size + count * RECORD.size)
+                    self._file.seek(0, os.SEEK_END)
+                    self._file.write(b"".join(records))
+                    self._file.flush()
+                return len(records)
+            finally:
+                self._flock(False)
+
+    def _open(self) -> None:
+        if self._file is not None:
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "a+b")
+        self._flock(True)
+        try:
+            self._file.seek(0)
+            header = self._file.read(HEADER.size)
+            if not header:
+                self._file.write(HEADER.pack(MAGIC, VERSION))
+                self._file.flush()
+            elif HEADER.unpack(header) != (MAGIC, VERSION):
+                raise ValueError(f"Invalid report cache file: {self.path}")
+        finally:
+            self._flock(False)
+
+    def _remap(self) -> int:
+        """
+        Map the file again if other writers made it grow. Returns the count.
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        if self._mm is None or len(self._mm) != size:
+            if self._mm is not None:
+                self._mm.close()
+            self._mm = mmap.mmap(self._file.fileno(), size,
+                                 access=mmap.ACCESS_READ)
+        return self._count(size)
+
+    @staticmethod
+    def _count(size: int) -> int:
+        return max(0, (size - HEADER.size) // RECORD.size)
+
+    def _flock(self, exclusive: bool) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(),
+                        fcntl.LOCK_EX if exclusive else fcntl.LOCK_UN)
+
+    def _load_categories(self) -> None:
+        if not os.path.exists(self.categories_path):
+            return
+
+        with open(self.categories_path, "r", encoding="utf-8") as f:
+            lines = f.read().split("\n")
+
+        # The last line is either empty or a partially written entry.
+        for line in lines[len(self._categories):-1]:
+            categoria = json.loads(line)
+            self._category_ids.setdefault(categoria, len(self._categories))
+            self._categories.append(categoria)
+
+    def _get_category(self, category_id: int) -> str:
+        if category_id >= len(self._categories):
+            self._load_categories()
+        return self._categories[category_id]
+
+    def _get_category_id(self, categoria: str) -> int:
+        """
+        Get the dictionary id of a category, adding it if needed.
+        Must be called with the file lock held.
+        """
+        self._load_categories()
+        if categoria not in self._category_ids:
+            self._append_line(self.categories_path, categoria)
+            self._category_ids[categoria] = len(self._categories)
+            self._categories.append(categoria)
+        return self._category_ids[categoria]
+
+    def _load_raw_hashes(self) -> None:
+        if not os.path.exists(self.raw_hashes_path):
+            return
+
+        with open(self.raw_hashes_path, "rb") as f:
+            f.seek(self._raw_hashes_size)
+            data = f.read()
+
+        # Only complete lines; the last one may be partially written.
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.decode("utf-8").splitlines():
+            report_id, hash_dados = json.loads(line)
+            self._raw_hashes[report_id] = hash_dados
+        self._raw_hashes_size += len(complete)
+
+    def _get_raw_hash(self, report_id: int) -> str:
+        if report_id not in self._raw_hashes:
+            self._load_raw_hashes()
+        return self._raw_hashes[report_id]
+
+    def _add_raw_hash(self, report_id: int, hash_dados: str) -> None:
+        """
+        Store the hash of a flagged record. Written before the record, so a
+        flagged record always has its entry. Must be called with the file
+        lock held.
+        """
+        self._append_line(self.raw_hashes_path, [report_id, hash_dados])
+        self._raw_hashes[report_id] = hash_dados
+
+    @staticmethod
+    def _append_line(path: str, value) -> None:
+        """
+        Append a JSON line to a sidecar file, dropping a torn entry left by
+        an interrupted write first.
+        """
+        with open(path, "a+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(0)
+                f.truncate(f.read().rfind(b"\n") + 1)
+            f.write((json.dumps(value) + "\n").encode("utf-8"))
@@ -0,0 +1,310 @@
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+import aiohttp
+import requests
+from eth_utils import keccak
+from urllib3.exceptions import ConnectTimeoutError
+from web3 import AsyncHTTPProvider, HTTPProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.providers.base import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+T = TypeVar("T")
+
+# Sent to the primary endpoint first. The pending transaction count is
+# routed with the writes, so nonces are synced from the node that
+# receives the transactions.
+WRITE_METHODS = {
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+    "eth_getTransactionCount",
+}
+
+# Writes that broadcast a transaction. Once the request may have reached a
+# node, sending it to another one could double-submit it, so these only
+# fail over on errors raised while connecting.
+SUBMIT_METHODS = {
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+}
+
+# Error messages of nodes that already hold the exact signed transaction
+ALREADY_KNOWN_ERRORS = ("already known", "known transaction", "alreadyknown")
+
+
+def is_unsent_error(error: Exception) -> bool:
+    """
+    Whether a request failed before it was sent, i.e. while the connection
+    to the endpoint was being opened.
+    """
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", error.args[0]) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectTimeout) or isinstance(
+            reason, ConnectTimeoutError)
+    return False
+
+
+def resolve_already_known(method: str, params: Any, response: RPCResponse) -> RPCResponse:
+    """
+    Turn an "already known" reply to eth_sendRawTransaction into a success
+    carrying the transaction hash: the node already holds this exact signed
+    transaction, so it was broadcast by an earlier attempt.
+    """
+    if method != "eth_sendRawTransaction" or not isinstance(response, dict):
+        return response
+
+    error = response.get("error")
+    message = str(error.get("message", "") if isinstance(error, dict) else error or "").lower()
+    if not any(known in message for known in ALREADY_KNOWN_ERRORS):
+        return response
+
+    raw_transaction = params[0]
+    if isinstance(raw_transaction, str):
+        raw_transaction = bytes.fromhex(raw_transaction.removeprefix("0x"))
+    return {"jsonrpc": response.get("jsonrpc", "2.0"), "id": response.get("id"),
+            "result": "0x" + keccak(raw_transaction).hex()}
+
+
+class RpcEndpoint:
+    """
+    Health and routing statistics of one JSON-RPC endpoint.
+    """
+
+    def __init__(self, uri: str, primary: bool):
+        self.uri = uri
+        self.primary = primary
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.healthy = True
+        self.reads = 0
+        self.writes = 0
+        self.failures = 0
+        self.failovers = 0
+        self.ejections = 0
+
+
+class RpcPool:
+    """
+    Pool of JSON-RPC endpoints with latency-aware routing.
+
+    Each endpoint keeps an exponentially weighted moving average (EWMA) of
+    its latency and error rate. Reads go to the healthy endpoint with the
+    lowest latency; writes go to the primary (the first URL) and fall back
+    to the others on transport errors, except that transaction submissions
+    only fall back when the request could not be sent at all. An endpoint is ejected after
+    `eject_after` consecutive failures or when its error rate passes
+    `max_error_rate`, and comes back once a probe succeeds.
+    """
+
+    def __init__(self, uris: List[str], alpha: float, eject_after: int, max_error_rate: float):
+        """
+        Args:
+            uris: Endpoint URLs; the first one is the primary.
+            alpha: EWMA weight of the newest sample (0 to 1).
+            eject_after: Consecutive failures that eject an endpoint.
+            max_error_rate: EWMA error rate that ejects an endpoint.
+        """
+        if not uris:
+            raise ValueError("RPC pool needs at least one endpoint")
+
+        self.endpoints = [RpcEndpoint(uri, i == 0) for i, uri in enumerate(uris)]
+        self.alpha = alpha
+        self.eject_after = eject_after
+        self.max_error_rate = max_error_rate
+        self._lock = threading.Lock()
+
+    def route(self, method: str) -> List[RpcEndpoint]:
+        """
+        Get the endpoints to try for a method, in order. Healthy endpoints
+        come first, fastest first, with the primary ahead of them for writes;
+        ejected ones are only tried when nothing else is left.
+        """
+        write = method in WRITE_METHODS
+        with self._lock:
+            return sorted(
+                self.endpoints,
+                key=lambda endpoint: (not endpoint.healthy,
+                                      not (write and endpoint.primary),
+                                      endpoint.latency or 0.0))
+
+    def execute(self, method: str, send: Callable[[RpcEndpoint], T]) -> T:
+        """
+        Send a request through the pool, failing over on exceptions.
+        Transaction submissions only fail over on errors raised before the
+        request was sent (see SUBMIT_METHODS).
+        """
+        last_error: Optional[Exception] = None
+        for attempt, endpoint in enumerate(self.route(method)):
+            started = time.monotonic()
+            try:
+                result = send(endpoint)
+            except Exception as e:
+                self.record(endpoint, time.monotonic() - started, False)
+                if method in SUBMIT_METHODS and not is_unsent_error(e):
+                    raise
+                last_error = e
+                continue
+
+            self.record(endpoint, time.monotonic() - started, True,
+                        write=method in WRITE_METHODS, failover=attempt > 0)
+            return result
+        raise last_error
+
+    async def execute_async(self, method: str, send: Callable[[RpcEndpoint], Awaitable[T]]) -> T:
+        """
+        Asyncio variant of execute.
+        """
+        last_error: Optional[Exception] = None
+        for attempt, endpoint in enumerate(self.route(method)):
+            started = time.monotonic()
+            try:
+                result = await send(endpoint)
+            except Exception as e:
+                self.record(endpoint, time.monotonic() - started, False)
+                if method in SUBMIT_METHODS and not is_unsent_error(e):
+                    raise
+                last_error = e
+                continue
+
+            self.record(endpoint, time.monotonic() - started, True,
+                        write=method in WRITE_METHODS, failover=attempt > 0)
+            return result
+        raise last_error
+
+    def record(self, endpoint: RpcEndpoint, latency: float, ok: bool,
+               write: bool = False, failover: bool = False) -> None:
+        """
+        Update the statistics of an endpoint after a request or probe.
+        """
+        with self._lock:
+            endpoint.error_rate = (self.alpha * (0.0 if ok else 1.0)
+                                   + (1 - self.alpha) * endpoint.error_rate)
+            if ok:
+                endpoint.latency = latency if endpoint.latency is None else (
+                    self.alpha * latency + (1 - self.alpha) * endpoint.latency)
+                endpoint.consecutive_failures = 0
+                endpoint.healthy = True
+                if write:
+                    endpoint.writes += 1
+                else:
+                    endpoint.reads += 1
+                if failover:
+                    endpoint.failovers += 1
+                return
+
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.healthy and (endpoint.consecutive_failures >= self.eject_after
+                                     or endpoint.error_rate > self.max_error_rate):
+                endpoint.healthy = False
+                endpoint.ejections += 1
+                print(f"RPC pool: endpoint {endpoint.uri} removido após falhas")
+
+    def get_ejected(self) -> List[RpcEndpoint]:
+        with self._lock:
+            return [endpoint for endpoint in self.endpoints if not endpoint.healthy]
+
+    def get_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Get the health and routing counters of every endpoint.
+        """
+        with self._lock:
+            return [
+                {
+                    "uri": endpoint.uri,
+                    "primary": endpoint.primary,
+                    "healthy": endpoint.healthy,
+                    "latency_ms": round(endpoint.latency * 1000, 2) if endpoint.latency is not None else None,
+                    "error_rate": round(endpoint.error_rate, 4),
+                    "reads": endpoint.reads,
+                    "writes": endpoint.writes,
+                    "failures": endpoint.failures,
+                    "failovers": endpoint.failovers,
+                    "ejections": endpoint.ejections
+                }
+                for endpoint in self.endpoints
+            ]
+
+
+class PooledHTTPProvider(JSONBaseProvider):
+    """
+    Web3 provider that spreads requests over an RpcPool of HTTP endpoints.
+    """
+
+    def __init__(self, pool: RpcPool, session: Optional[Any] = None,
+                 request_kwargs: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        """
+        Args:
+            pool: The endpoint pool to route requests through.
+            session: requests.Session shared by every endpoint, so all
+                threads reuse one connection pool.
+            request_kwargs: Extra arguments of each HTTP request (timeout).
+        """
+        super().__init__(**kwargs)
+        self.pool = pool
+        # The pool fails over to the next endpoint instead of retrying.
+        self._providers = {
+            endpoint.uri: HTTPProvider(
+                endpoint.uri, request_kwargs=request_kwargs, session=session,
+                exception_retry_configuration=None)
+            for endpoint in pool.endpoints}
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return resolve_already_known(method, params, self.pool.execute(
+            method, lambda endpoint: self._providers[endpoint.uri].make_request(method, params)))
+
+    def make_batch_request(self, batch_requests: List[Any]) -> Any:
+        methods = {method for method, _ in batch_requests}
+        method = next(iter(methods & WRITE_METHODS), "batch")
+        return self.pool.execute(
+            method, lambda endpoint: self._providers[endpoint.uri].make_batch_request(batch_requests))
+
+    def probe(self) -> None:
+        """
+        Send eth_blockNumber to every ejected endpoint; those that answer
+        are put back into rotation.
+        """
+        for endpoint in self.pool.get_ejected():
+            started = time.monotonic()
+            try:
+                response = self._providers[endpoint.uri].make_request(
+                    RPCEndpoint("eth_blockNumber"), [])
+                ok = "error" not in response
+            except Exception:
+                ok = False
+            self.pool.record(endpoint, time.monotonic() - started, ok)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(provider.is_connected(show_traceback)
+                   for provider in self._providers.values())
+
+
+class AsyncPooledHTTPProvider(AsyncJSONBaseProvider):
+    """
+    Asyncio counterpart of PooledHTTPProvider, sharing the same RpcPool.
+    """
+
+    def __init__(self, pool: RpcPool, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.pool = pool
+        self._providers = {endpoint.uri: AsyncHTTPProvider(endpoint.uri, exception_retry_configuration=None)
+                           for endpoint in pool.endpoints}
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return resolve_already_known(method, params, await self.pool.execute_async(
+            method, lambda endpoint: self._providers[endpoint.uri].make_request(method, params)))
+
+    async def make_batch_request(self, batch_requests: List[Any]) -> Any:
+        return await self.pool.execute_async(
+            "batch", lambda endpoint: self._providers[endpoint.uri].make_batch_request(batch_requests))
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        for provider in self._providers.values():
+            if await provider.is_connected(show_traceback):
+                return True
+        return False
@@ -1,44 +1,42 @@
+from datetime import datetime, timezone
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from app.core.deps import get_current_admin, get_db
+from app.core.deps import get_current_admin, get_db, get_llm_adapter
+from app.adapters.llm_adapter import LLMAdapter
 from app.models.user import User
 from sqlalchemy.orm import Session
 from app.services.analysis_service import AnalysisService
+from app.services.severity_analysis_service import SeverityAnalysisService
 
 router = APIRouter()
 
+# Format of Denuncia.datetime, as in the API examples (UTC)
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
-@router.get("/reliability/{user_uuid}")
-def get_user_reliability(
-    user_uuid: str,
-    _: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
-    """
-    Obtém a análise de confiabilidade de um usuário específico baseada
-    no histórico de status das suas denúncias.
 
-    Requer privilégios de administrador.
-
-    Args:
-        user_uuid: UUID do usuário para análise
-
-    Returns:
-        Métricas de confiabilidade incluindo:
-        - Score de confiabilidade
-        - Porcentagem de confiabilidade  
-        - Nível de confiabilidade
-        - Breakdown por status das denúncias
-        - Taxas de verificação e rejeição
+def _normalize_datetime(value: Optional[str], name: str) -> Optional[str]:
+    """
+    Convert an ISO 8601 date or date-time into the stored format, so it can
+    be compared with the datetime column as text. A date means midnight and
+    a value without offset is taken as UTC. Other formats are rejected with
+    422.
     """
+    if value is None:
+        return None
+
     try:
-        service = AnalysisService(db)
-        result = service.get_user_reliability(user_uuid)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=422,
+            detail=f"{name} deve estar no formato ISO 8601, ex.: 2024-01-15 ou 2024-01-15T10:30:00Z")
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime(DATETIME_FORMAT)
 
 
+# Declared before /reliability/{user_uuid}, which would also match "ranking"
 @router.get("/reliability/ranking")
 def get_users_reliability_ranking(
     limit: Optional[int] = Query(
@@ -48,7 +46,7 @@ def get_users_reliability_ranking(
 ):
     """
     Obtém um ranking dos usuários mais confiáveis baseado no histórico
-    de suas denúncias.
+    de suas denúncias, calculado em uma única consulta.
 
     Requer privilégios de administrador.
 
@@ -75,6 +73,37 @@ def get_users_reliability_ranking(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/reliability/{user_uuid}")
+def get_user_reliability(
+    user_uuid: str,
+    _: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Obtém a análise de confiabilidade de um usuário específico baseada
+    no histórico de status das suas denúncias.
+
+    Requer privilégios de administrador.
+
+    Args:
+        user_uuid: UUID do usuário para análise
+
+    Returns:
+        Métricas de confiabilidade incluindo:
+        - Score de confiabilidade
+        - Porcentagem de confiabilidade  
+        - Nível de confiabilidade
+        - Breakdown por status das denúncias
+        - Taxas de verificação e rejeição
+    """
+    try:
+        service = AnalysisService(db)
+        result = service.get_user_reliability(user_uuid)
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/stats/overview")
 def get_analysis_overview(
     _: User = Depends(get_current_admin),
@@ -93,45 +122,51 @@ def get_analysis_overview(
     """
     try:
         service = AnalysisService(db)
+        return service.get_reliability_overview()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/stats/severity")
+def get_severity_statistics(
+    inicio: Optional[str] = Query(
+        None, description="Início do período [inicio, fim), incluído (ISO 8601, ex.: 2024-01-15T10:30:00Z)"),
+    fim: Optional[str] = Query(
+        None, description="Fim do período [inicio, fim), excluído (ISO 8601; uma data sem hora é a meia-noite desse dia)"),
+    por_categoria: bool = Query(
+        False, description="Inclui a distribuição de cada categoria"),
+    por_status: bool = Query(
+        False, description="Inclui a distribuição de cada status"),
+    _: User = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+    llm_adapter: LLMAdapter = Depends(get_llm_adapter)
+):
+    """
+    Obtém a distribuição de severidade das denúncias, calculada com
+    consultas agregadas.
 
-        all_users_data = service.get_users_reliability_ranking(limit=None)
-
-        if not all_users_data["ranking"]:
-            return {
-                "message": "Nenhum dado disponível para análise",
-                "total_users": 0,
-                "reliability_distribution": {}
-            }
-
-        reliability_distribution = {
-            "MUITO_CONFIAVEL": 0,
-            "CONFIAVEL": 0,
-            "MODERADA": 0,
-            "BAIXA": 0,
-            "MUITO_BAIXA": 0
-        }
-
-        total_denuncias = 0
-        total_verified = 0
-        total_rejected = 0
-
-        for user_data in all_users_data["ranking"]:
-            reliability_level = user_data["reliability_level"]
-            reliability_distribution[reliability_level] += 1
-            total_denuncias += user_data["total_denuncias"]
-            total_verified += user_data["verified"]
-            total_rejected += user_data["rejected"]
-
-        return {
-            "total_users_with_denuncias": all_users_data["total_users"],
-            "reliability_distribution": reliability_distribution,
-            "system_stats": {
-                "total_denuncias": total_denuncias,
-                "total_verified": total_verified,
-                "total_rejected": total_rejected,
-                "global_verification_rate": f"{(total_verified / max(1, total_verified + total_rejected) * 100):.2f}%" if (total_verified + total_rejected) > 0 else "N/A",
-                "global_rejection_rate": f"{(total_rejected / max(1, total_verified + total_rejected) * 100):.2f}%" if (total_verified + total_rejected) > 0 else "N/A"
-            }
-        }
+    O período é semiaberto, [inicio, fim): fim=2024-01-04 inclui o dia 3
+    inteiro e nada do dia 4. Datas e horas são convertidas para o formato
+    armazenado (2024-01-15T10:30:00Z, UTC); outros formatos retornam 422.
+
+    Requer privilégios de administrador.
+
+    Args:
+        inicio: Considera apenas denúncias com datetime >= inicio
+        fim: Considera apenas denúncias com datetime < fim
+        por_categoria: Inclui a distribuição de cada categoria
+        por_status: Inclui a distribuição de cada status
+
+    Returns:
+        Contagens e percentuais por nível de severidade, prioridade
+        crítica e taxa de cobertura da análise
+    """
+    inicio = _normalize_datetime(inicio, "inicio")
+    fim = _normalize_datetime(fim, "fim")
+
+    try:
+        service = SeverityAnalysisService(db, llm_adapter=llm_adapter)
+        return service.get_severity_statistics(
+            inicio, fim, por_categoria, por_status)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,16 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.schemas.auth import UserLogin, UserRegister, Token, UserResponse
+from app.services.async_auth_service import AsyncAuthService
 from app.services.auth_service import AuthService
 from app.services.blockchain_service import BlockchainService
-from app.core.deps import get_db, get_auth_service, get_current_admin, get_current_active_user
+from app.services.wallet_metrics_service import WalletMetricsService
+from app.core.deps import (
+    get_db, get_auth_service, get_async_auth_service, get_blockchain_service, get_current_admin,
+    get_current_active_user)
 from app.models.user import User
 
 router = APIRouter()
 
 
-def get_blockchain_service() -> BlockchainService:
-    return BlockchainService()
+def get_wallet_metrics_service(
+    blockchain_service: BlockchainService = Depends(get_blockchain_service)
+) -> WalletMetricsService:
+    return WalletMetricsService(blockchain_service)
 
 
 @router.post("/register", response_model=UserResponse)
@@ -37,14 +43,14 @@ def register(
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     user_data: UserLogin,
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AsyncAuthService = Depends(get_async_auth_service)
 ):
     """
     Login with username and password.
     """
-    user = auth_service.authenticate_user(
+    user = await auth_service.authenticate_user(
         user_data.username, user_data.password)
     if not user:
         raise HTTPException(
@@ -64,7 +70,7 @@ def login(
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(
+async def get_current_user_info(
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -76,29 +82,42 @@ def get_current_user_info(
 @router.get("/admin/status")
 def get_system_status(
     _: User = Depends(get_current_admin),
-    blockchain_service: BlockchainService = Depends(get_blockchain_service)
+    wallet_metrics_service: WalletMetricsService = Depends(get_wallet_metrics_service)
 ):
     """
     Returns the status of the blockchain account, including balance and
     estimated number of remaining reports.
+    Served from a cache refreshed in the background every
+    WALLET_METRICS_INTERVAL seconds; updated_at tells when it was read and
+    stale_after when it should no longer be trusted.
     Only accessible by admin users.
     """
     try:
-        balance = blockchain_service.get_balance()
-        cost_per_report = blockchain_service.estimate_report_cost()
-
-        if cost_per_report > 0:
-            remaining_reports = int(balance / cost_per_report)
-        else:
-            remaining_reports = float('inf')
-
-        return {
-            "account_balance_matic": balance,
-            "estimated_cost_per_report_matic": cost_per_report,
-            "estimated_remaining_reports": remaining_reports
-        }
+        system_status = wallet_metrics_service.get_status()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred: {str(e)}"
         )
+
+    if system_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Wallet metrics have not been loaded yet"
+        )
+
+    return system_status
+
+
+@router.get("/admin/rpc-pool")
+def get_rpc_pool_metrics(
+    _: User = Depends(get_current_admin),
+    blockchain_service: BlockchainService = Depends(get_blockchain_service)
+):
+    """
+    Returns the health of each blockchain RPC endpoint: average latency
+    and error rate, whether it is in rotation, and how many reads and
+    writes were routed to it.
+    Only accessible by admin users.
+    """
+    return {"endpoints": blockchain_service.get_rpc_metrics()}
@@ -1,12 +1,21 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
 from app.db.config import SessionLocal
 from app.models.denuncia import StatusDenuncia, SeveridadeDenuncia
-from app.schemas.denuncia import Denuncia, DenunciaStatusUpdate
-from app.core.deps import get_current_admin
+from app.models.reconciliation import ReconciliationIssueKind
+from app.schemas.denuncia import Denuncia, DenunciaStatusBatchUpdate, DenunciaStatusUpdate
+from app.adapters.llm_adapter import LLMAdapter
+from app.core.deps import (
+    get_async_blockchain_service, get_async_db, get_blockchain_service, get_current_admin,
+    get_llm_adapter)
 from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.services.async_blockchain_service import AsyncBlockchainService
+from app.services.async_denuncia_service import AsyncDenunciaService
+from app.services.blockchain_service import BlockchainService
 from app.services.denuncia_service import DenunciaService
+from app.services.reconciliation_service import ReconciliationService, run_reconciliation
 from app.utils.rate_limiter import limiter
 
 router = APIRouter()
@@ -20,6 +29,39 @@ def get_db():
         db.close()
 
 
+def get_denuncia_service(
+    db: Session = Depends(get_db),
+    blockchain_service: BlockchainService = Depends(get_blockchain_service),
+    async_blockchain_service: AsyncBlockchainService = Depends(get_async_blockchain_service),
+    llm_adapter: LLMAdapter = Depends(get_llm_adapter)
+) -> DenunciaService:
+    return DenunciaService(
+        db,
+        blockchain_service=blockchain_service,
+        async_blockchain_service=async_blockchain_service,
+        llm_adapter=llm_adapter)
+
+
+async def get_async_denuncia_service(
+    db: AsyncSession = Depends(get_async_db),
+    blockchain_service: BlockchainService = Depends(get_blockchain_service),
+    async_blockchain_service: AsyncBlockchainService = Depends(get_async_blockchain_service),
+    llm_adapter: LLMAdapter = Depends(get_llm_adapter)
+) -> AsyncDenunciaService:
+    return AsyncDenunciaService(
+        db,
+        blockchain_service=blockchain_service,
+        async_blockchain_service=async_blockchain_service,
+        llm_adapter=llm_adapter)
+
+
+def get_reconciliation_service(
+    db: Session = Depends(get_db),
+    blockchain_service: BlockchainService = Depends(get_blockchain_service)
+) -> ReconciliationService:
+    return ReconciliationService(db, blockchain_service)
+
+
 @router.get("/")
 def hello_world():
     """
@@ -30,39 +72,99 @@ def hello_world():
 
 @router.post("/denuncia")
 @limiter.limit("5/minute")
-def criar_denuncia(
+async def criar_denuncia(
     request: Request,
+    response: Response,
     denuncia: Denuncia,
-    db: Session = Depends(get_db)
+    service: AsyncDenunciaService = Depends(get_async_denuncia_service)
 ):
     """
     Registra uma nova denúncia:
     1. Gera um hash dos dados.
     2. Envia o hash na blockchain via registrarDenuncia().
 
+    Com ANCHOR_MODE=queue, o envio fica a cargo de um worker e a resposta
+    é 202 com status ANCHOR_PENDING; o tx_hash pode ser consultado em
+    GET /denuncia/{denuncia_id}/anchor.
+
     Requer autenticação de usuário.
     """
     try:
-        service = DenunciaService(db)
-        result = service.create_denuncia(denuncia)
+        result = await service.create_denuncia(denuncia)
+
+        if "tx_hash" in result:
+            print(
+                f"denuncia {denuncia.datetime} registrada com sucesso na blockchain. tx_hash: {result['tx_hash']}")
+        else:
+            print(
+                f"denuncia {denuncia.datetime} enfileirada para registro na blockchain. id: {result['denuncia_id']}")
+            response.status_code = 202
+
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/denuncia/{denuncia_id}/anchor")
+def obter_status_ancoragem(
+    denuncia_id: int,
+    service: DenunciaService = Depends(get_denuncia_service)
+):
+    """
+    Retorna o estado do registro na blockchain de uma denúncia enfileirada
+    (ANCHOR_PENDING, ANCHOR_SUBMITTING, ANCHORED ou ANCHOR_FAILED) e o
+    tx_hash, quando já enviado.
+    """
+    try:
+        result = service.get_anchor_status(denuncia_id)
 
-        print(
-            f"denuncia {denuncia.datetime} registrada com sucesso na blockchain. tx_hash: {result['tx_hash']}")
+        if result is None:
+            raise HTTPException(
+                status_code=404, detail="Denúncia não encontrada na fila de registro.")
 
         return result
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/denuncia/{denuncia_id}/proof")
+def obter_prova_merkle(
+    denuncia_id: int,
+    service: DenunciaService = Depends(get_denuncia_service)
+):
+    """
+    Retorna a prova de inclusão Merkle de uma denúncia registrada em lote
+    (ANCHOR_MODE=batch). Qualquer pessoa pode verificá-la contra a raiz
+    registrada em registrarLoteMerkle: a folha é keccak256(hash_dados) e cada
+    nível é keccak256 do par de nós ordenado.
+    """
+    try:
+        result = service.get_merkle_proof(denuncia_id)
+
+        if result is None:
+            raise HTTPException(
+                status_code=404, detail="Prova Merkle não encontrada para a denúncia.")
+
+        return result
+    except HTTPException as he:
+        raise he
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/denuncias")
-def listar_denuncias(
+async def listar_denuncias(
     _: User = Depends(get_current_admin),
-    db: Session = Depends(get_db),
+    service: AsyncDenunciaService = Depends(get_async_denuncia_service),
     status: Optional[StatusDenuncia] = None,
     categoria: Optional[str] = None,
     user_uuid: Optional[str] = None,
     severidade: Optional[SeveridadeDenuncia] = None,
     blockchain_offset: Optional[int] = 0,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
 ):
     """
     Retorna todas as denúncias com filtros opcionais.
@@ -73,29 +175,134 @@ def listar_denuncias(
     - user_uuid: UUID do usuário para análise administrativa
     - severidade: Severidade da denúncia (BAIXA, MEDIA, ALTA, CRITICA)
     - blockchain_offset: Offset para paginação blockchain
+    - limit: Número máximo de denúncias por página
+    - cursor: Valor de next_cursor da página anterior
+
+    Denúncias registradas em lote Merkle (ANCHOR_MODE=batch) vêm após as
+    da lista de denúncias do contrato, com anchor_type MERKLE, blockchain_id
+    nulo e a prova de inclusão em merkle_proof.
+
+    Retorna {"denuncias": [...], "next_cursor": ...}; next_cursor é null na
+    última página.
     """
     try:
-        service = DenunciaService(db)
-        results = service.get_all_denuncias(
-            status, categoria, blockchain_offset, user_uuid, severidade)
+        results = await service.get_all_denuncias(
+            status, categoria, blockchain_offset, user_uuid, severidade, limit, cursor)
         return results
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/denuncias/reconcile", status_code=202)
+def iniciar_reconciliacao(
+    background_tasks: BackgroundTasks,
+    _: User = Depends(get_current_admin),
+    service: ReconciliationService = Depends(get_reconciliation_service)
+):
+    """
+    Inicia uma reconciliação entre a tabela de denúncias e a blockchain,
+    executada em segundo plano. Acompanhe o resultado em
+    GET /denuncias/reconcile/{run_id}.
+    Requer privilégios de administrador.
+    """
+    try:
+        run = service.start()
+        background_tasks.add_task(run_reconciliation, run.id)
+        return service.get_run(run.id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/denuncias/reconcile")
+def obter_ultima_reconciliacao(
+    _: User = Depends(get_current_admin),
+    service: ReconciliationService = Depends(get_reconciliation_service)
+):
+    """
+    Retorna o resumo da reconciliação mais recente.
+    Requer privilégios de administrador.
+    """
+    result = service.get_run()
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail="Nenhuma reconciliação executada.")
+    return result
+
+
+@router.get("/denuncias/reconcile/{run_id}")
+def obter_reconciliacao(
+    run_id: int,
+    _: User = Depends(get_current_admin),
+    service: ReconciliationService = Depends(get_reconciliation_service),
+    kind: Optional[ReconciliationIssueKind] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+):
+    """
+    Retorna o resumo de uma reconciliação e uma página das divergências
+    encontradas:
+    - MISSING: denúncia local cujo hash não está na blockchain
+    - ORPHANED: denúncia da blockchain sem registro local
+    - DUPLICATE: hash registrado mais de uma vez (source indica onde)
+
+    Suporta filtro por kind e paginação por cursor (next_cursor).
+    Requer privilégios de administrador.
+    """
+    result = service.get_run(run_id)
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail="Reconciliação não encontrada.")
+
+    try:
+        result.update(service.get_issues(run_id, kind, limit, cursor))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return result
+
+
+@router.put("/denuncias/status:batch")
+def atualizar_status_denuncias_em_lote(
+    batch: DenunciaStatusBatchUpdate,
+    _: User = Depends(get_current_admin),
+    service: DenunciaService = Depends(get_denuncia_service)
+):
+    """
+    Atualiza o status de várias denúncias em uma única transação.
+    Recebe uma lista de pares (id, status) e retorna o resultado de cada
+    um: UPDATED, UNCHANGED (já tinha esse status) ou NOT_FOUND.
+    O tamanho máximo do lote é definido por STATUS_BATCH_MAX_SIZE.
+    Apenas administradores podem alterar o status.
+    """
+    try:
+        results = service.update_denuncia_statuses(
+            [(item.id, item.status) for item in batch.updates])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    updated = sum(1 for result in results if result["outcome"] == "UPDATED")
+    return {
+        "message": f"{updated} de {len(results)} denúncias atualizadas",
+        "updated": updated,
+        "results": results
+    }
+
+
 @router.put("/denuncias/{denuncia_id}/status")
 def atualizar_status_denuncia(
     denuncia_id: int,
     status_update: DenunciaStatusUpdate,
     _: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    service: DenunciaService = Depends(get_denuncia_service)
 ):
     """
     Atualiza o status de uma denúncia.
     Apenas administradores podem alterar o status.
     """
     try:
-        service = DenunciaService(db)
         result = service.update_denuncia_status(
             denuncia_id, status_update.status)
 
@@ -113,10 +320,36 @@ def atualizar_status_denuncia(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/denuncias/merkle/{denuncia_id}")
+def obter_denuncia_merkle(
+    denuncia_id: int,
+    service: DenunciaService = Depends(get_denuncia_service),
+    _: User = Depends(get_current_admin)
+):
+    """
+    Retorna uma denúncia registrada em lote Merkle (ANCHOR_MODE=batch) pelo
+    seu ID local, com a prova de inclusão. Essas denúncias não têm ID na
+    blockchain, pois só a raiz do lote é registrada.
+    Requer privilégios de administrador.
+    """
+    try:
+        result = service.get_merkle_anchored_denuncia(denuncia_id)
+
+        if result is None:
+            raise HTTPException(
+                status_code=404, detail="Denúncia não encontrada em lote Merkle registrado.")
+
+        return result
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/denuncias/{denuncia_id}")
-def obter_denuncia_por_id(
+async def obter_denuncia_por_id(
     denuncia_id: int,
-    db: Session = Depends(get_db),
+    service: DenunciaService = Depends(get_denuncia_service),
     _: User = Depends(get_current_admin)
 ):
     """
@@ -124,8 +357,7 @@ def obter_denuncia_por_id(
     Requer privilégios de administrador.
     """
     try:
-        service = DenunciaService(db)
-        denuncia = service.get_denuncia_by_blockchain_id(denuncia_id)
+        denuncia = await service.get_denuncia_by_blockchain_id_async(denuncia_id)
 
         if denuncia is None:
             raise HTTPException(
@@ -6,13 +6,95 @@ load_dotenv()
 
 
 class Settings:
+    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./database.db")
+    SQLITE_BUSY_TIMEOUT: int = int(os.getenv("SQLITE_BUSY_TIMEOUT", 5000))
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", 65536))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", 268435456))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    LOCK_DIR: str = os.getenv("LOCK_DIR", "./data/locks")
+    LEADER_ELECTION_INTERVAL: float = float(
+        os.getenv("LEADER_ELECTION_INTERVAL", 5))
     POLYGON_RPC: str = os.getenv("POLYGON_RPC", "")
+    # Comma-separated endpoints for the RPC pool; the first one is the primary
+    POLYGON_RPC_URLS: list = [
+        url.strip() for url in os.getenv("POLYGON_RPC_URLS", "").split(",")
+        if url.strip()] or [POLYGON_RPC]
+    RPC_POOL_EWMA_ALPHA: float = float(os.getenv("RPC_POOL_EWMA_ALPHA", 0.3))
+    RPC_POOL_EJECT_AFTER: int = int(os.getenv("RPC_POOL_EJECT_AFTER", 3))
+    RPC_POOL_MAX_ERROR_RATE: float = float(
+        os.getenv("RPC_POOL_MAX_ERROR_RATE", 0.5))
+    RPC_POOL_PROBE_INTERVAL: float = float(
+        os.getenv("RPC_POOL_PROBE_INTERVAL", 10))
     PRIVATE_KEY: str = os.getenv("PRIVATE_KEY", "")
     SECRET_KEY: str = os.getenv("SECRET_KEY", "")
+    # Left empty when unset, so the local provider runs without them
     PUBLIC_ADDRESS: str = Web3.to_checksum_address(
-        os.getenv("PUBLIC_ADDRESS", ""))
+        os.getenv("PUBLIC_ADDRESS")) if os.getenv("PUBLIC_ADDRESS") else ""
     CONTRACT_ADDRESS: str = Web3.to_checksum_address(
-        os.getenv("CONTRACT_ADDRESS", ""))
+        os.getenv("CONTRACT_ADDRESS")) if os.getenv("CONTRACT_ADDRESS") else ""
+    BLOCKCHAIN_PROVIDER: str = os.getenv("BLOCKCHAIN_PROVIDER", "polygon")
+    LOCAL_CHAIN_LATENCY_MS: float = float(
+        os.getenv("LOCAL_CHAIN_LATENCY_MS", 0))
+    LOCAL_CHAIN_FAILURE_RATE: float = float(
+        os.getenv("LOCAL_CHAIN_FAILURE_RATE", 0))
+    BLOCKCHAIN_BATCH_SIZE: int = int(os.getenv("BLOCKCHAIN_BATCH_SIZE", 100))
+    BLOCKCHAIN_MAX_CONCURRENCY: int = int(
+        os.getenv("BLOCKCHAIN_MAX_CONCURRENCY", 10))
+    CHAIN_HEAD_POLL_INTERVAL: float = float(
+        os.getenv("CHAIN_HEAD_POLL_INTERVAL", 1))
+    CHAIN_HEAD_MAX_AGE: float = float(os.getenv("CHAIN_HEAD_MAX_AGE", 2))
+    REPORT_CACHE_ENABLED: bool = os.getenv(
+        "REPORT_CACHE_ENABLED", "true").lower() == "true"
+    REPORT_CACHE_DIR: str = os.getenv("REPORT_CACHE_DIR", "./data/report_cache")
+    REPORT_CACHE_CONFIRMATIONS: int = int(
+        os.getenv("REPORT_CACHE_CONFIRMATIONS", 128))
+    CHAIN_INDEXER_ENABLED: bool = os.getenv(
+        "CHAIN_INDEXER_ENABLED", "true").lower() == "true"
+    CHAIN_INDEXER_INTERVAL: float = float(
+        os.getenv("CHAIN_INDEXER_INTERVAL", 5))
+    CHAIN_INDEXER_CHUNK_SIZE: int = int(
+        os.getenv("CHAIN_INDEXER_CHUNK_SIZE", 500))
+    CHAIN_INDEXER_SOURCE: str = os.getenv("CHAIN_INDEXER_SOURCE", "array")
+    CONTRACT_DEPLOY_BLOCK: int = int(os.getenv("CONTRACT_DEPLOY_BLOCK", 0))
+    LOGS_BLOCK_WINDOW: int = int(os.getenv("LOGS_BLOCK_WINDOW", 2000))
+    ANCHOR_MODE: str = os.getenv("ANCHOR_MODE", "sync")
+    ANCHOR_QUEUE_INTERVAL: float = float(
+        os.getenv("ANCHOR_QUEUE_INTERVAL", 1))
+    ANCHOR_QUEUE_BATCH_SIZE: int = int(
+        os.getenv("ANCHOR_QUEUE_BATCH_SIZE", 20))
+    ANCHOR_MAX_ATTEMPTS: int = int(os.getenv("ANCHOR_MAX_ATTEMPTS", 5))
+    ANCHOR_CLAIM_TIMEOUT: int = int(os.getenv("ANCHOR_CLAIM_TIMEOUT", 300))
+    ANCHOR_BATCH_SIZE: int = int(os.getenv("ANCHOR_BATCH_SIZE", 256))
+    ANCHOR_BATCH_WINDOW: float = float(os.getenv("ANCHOR_BATCH_WINDOW", 60))
+    RECEIPT_TRACKER_ENABLED: bool = os.getenv(
+        "RECEIPT_TRACKER_ENABLED", "true").lower() == "true"
+    RECEIPT_TRACKER_INTERVAL: float = float(
+        os.getenv("RECEIPT_TRACKER_INTERVAL", 1))
+    RECEIPT_TRACKER_BATCH_SIZE: int = int(
+        os.getenv("RECEIPT_TRACKER_BATCH_SIZE", 500))
+    TX_CONFIRMATIONS: int = int(os.getenv("TX_CONFIRMATIONS", 32))
+    TX_DROP_TIMEOUT: int = int(os.getenv("TX_DROP_TIMEOUT", 1800))
+    GAS_ORACLE_ENABLED: bool = os.getenv(
+        "GAS_ORACLE_ENABLED", "true").lower() == "true"
+    GAS_ORACLE_INTERVAL: float = float(os.getenv("GAS_ORACLE_INTERVAL", 5))
+    GAS_ORACLE_BLOCKS: int = int(os.getenv("GAS_ORACLE_BLOCKS", 20))
+    GAS_ORACLE_WINDOW: int = int(os.getenv("GAS_ORACLE_WINDOW", 200))
+    GAS_ORACLE_PERCENTILE: float = float(
+        os.getenv("GAS_ORACLE_PERCENTILE", 60))
+    GAS_LIMIT_MARGIN: float = float(os.getenv("GAS_LIMIT_MARGIN", 1.2))
+    RECONCILE_CHUNK_SIZE: int = int(os.getenv("RECONCILE_CHUNK_SIZE", 1000))
+    STATUS_BATCH_MAX_SIZE: int = int(os.getenv("STATUS_BATCH_MAX_SIZE", 500))
+    WALLET_METRICS_INTERVAL: float = float(
+        os.getenv("WALLET_METRICS_INTERVAL", 60))
+    WALLET_METRICS_MAX_AGE: float = float(
+        os.getenv("WALLET_METRICS_MAX_AGE", 300))
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", 20))
+    HTTP_TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", 30))
+    HTTP_KEEPALIVE_EXPIRY: float = float(
+        os.getenv("HTTP_KEEPALIVE_EXPIRY", 60))
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", 6379))
 
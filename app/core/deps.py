@@ -1,9 +1,16 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.config import SessionLocal
+from app.adapters.llm_adapter import LLMAdapter
+from app.db.config import AsyncSessionLocal, SessionLocal
 from app.core.config import settings
+from app.core.providers import providers
+from app.factories.llm_factory import create_mock_adapter, create_openai_adapter
+from app.services.async_auth_service import AsyncAuthService
+from app.services.async_blockchain_service import AsyncBlockchainService
 from app.services.auth_service import AuthService
+from app.services.blockchain_service import BlockchainService
 from app.models.user import User, UserRole
 
 security = HTTPBearer()
@@ -17,13 +24,56 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency to get an AsyncSession, for handlers that await the database
+    on the event loop instead of holding a threadpool thread
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
     return AuthService(db, settings.SECRET_KEY)
 
 
+async def get_async_auth_service(db: AsyncSession = Depends(get_async_db)) -> AsyncAuthService:
+    return AsyncAuthService(db, settings.SECRET_KEY)
+
+
+def get_blockchain_service() -> BlockchainService:
+    """
+    Dependency to get the process-wide blockchain service
+    """
+    return providers.get("blockchain_service", BlockchainService)
+
+
+def get_async_blockchain_service() -> AsyncBlockchainService:
+    """
+    Dependency to get the process-wide async blockchain service
+    """
+    return providers.get("async_blockchain_service", AsyncBlockchainService)
+
+
+def get_llm_adapter() -> LLMAdapter:
+    """
+    Dependency to get the shared LLM adapter for severity analysis: OpenAI
+    while it is available, mock otherwise
+    """
+    try:
+        adapter = providers.get("openai_adapter", lambda: create_openai_adapter(
+            http_client=providers.get_httpx_client() if settings.OPENAI_API_KEY else None))
+        if adapter.is_available():
+            return adapter
+    except Exception as e:
+        print(f"Provedor 'openai' não disponível: {str(e)}")
+
+    return providers.get("mock_llm_adapter", create_mock_adapter)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AsyncAuthService = Depends(get_async_auth_service)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,7 +81,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    user = auth_service.get_current_user(credentials.credentials)
+    user = await auth_service.get_current_user(credentials.credentials)
     if user is None:
         raise credentials_exception
 
@@ -0,0 +1,91 @@
+import threading
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class ProviderRegistry:
+    """
+    Process-wide instances shared by every request: the blockchain services,
+    the LLM adapter and the HTTP connection pools they send requests through.
+
+    Instances are created on first use (or warmed up in the application
+    lifespan) and reused afterwards, so the request path builds no clients
+    and reuses kept-alive connections instead of opening new TLS sessions.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._instances: Dict[str, Any] = {}
+        self._http_session: Optional[requests.Session] = None
+        self._httpx_client = None
+
+    def get(self, name: str, factory: Callable[[], T]) -> T:
+        """
+        Get the shared instance registered under name, creating it with
+        factory on first use.
+
+        The factory runs outside the lock, since it may itself ask the
+        registry for the shared HTTP clients; when two threads race, the
+        first instance stored wins and the other one is dropped.
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        instance = factory()
+        with self._lock:
+            return self._instances.setdefault(name, instance)
+
+    def get_http_session(self) -> requests.Session:
+        """
+        Get the shared requests session, with a connection pool of
+        HTTP_POOL_SIZE kept-alive connections per host.
+        """
+        with self._lock:
+            if self._http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=settings.HTTP_POOL_SIZE,
+                    pool_maxsize=settings.HTTP_POOL_SIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._http_session = session
+            return self._http_session
+
+    def get_httpx_client(self):
+        """
+        Get the shared httpx client, with the same pool size and timeout as
+        the requests session.
+        """
+        with self._lock:
+            if self._httpx_client is None:
+                import httpx
+                self._httpx_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=settings.HTTP_POOL_SIZE,
+                        max_keepalive_connections=settings.HTTP_POOL_SIZE,
+                        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY),
+                    timeout=httpx.Timeout(settings.HTTP_TIMEOUT))
+            return self._httpx_client
+
+    def close(self) -> None:
+        """
+        Drop the shared instances and close the HTTP connection pools.
+        """
+        with self._lock:
+            self._instances.clear()
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+            if self._httpx_client is not None:
+                self._httpx_client.close()
+                self._httpx_client = None
+
+
+providers = ProviderRegistry()
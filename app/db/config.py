@@ -1,12 +1,89 @@
 # app/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./database.db"
+from app.core.config import settings
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+
+# asyncio drivers of the backends supported by the async engine
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune every new SQLite connection. WAL lets readers run while a writer
+    holds the database, and busy_timeout makes concurrent writers (threads
+    or uvicorn workers) wait for the lock instead of failing at once.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT}")
+    # Negative values are in KiB instead of pages
+    cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+
+def build_engine(url: str = SQLALCHEMY_DATABASE_URL):
+    """
+    Create the engine for a database URL: SQLite gets the pragmas above,
+    any other backend (PostgreSQL) a connection pool sized by DB_POOL_*.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        sqlite_engine = create_engine(
+            url, connect_args={"check_same_thread": False})
+        event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+        return sqlite_engine
+
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
+
+
+def build_async_engine(url: str = SQLALCHEMY_DATABASE_URL):
+    """
+    Create the asyncio engine for the same database as build_engine, with
+    the driver of ASYNC_DRIVERS and the same SQLite pragmas or pool sizes.
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    url = url.set(drivername=ASYNC_DRIVERS[backend])
+
+    if backend == "sqlite":
+        sqlite_engine = create_async_engine(url)
+        event.listen(sqlite_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        return sqlite_engine
+
+    return create_async_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
+
+
+engine = build_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = build_async_engine()
+# Attributes stay loaded after commit: an expired attribute cannot be lazily
+# reloaded outside an await
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
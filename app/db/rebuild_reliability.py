@@ -0,0 +1,31 @@
+import sys
+
+from app.db.config import Base, SessionLocal, engine
+from app.db.upgrade import upgrade_schema
+from app.repositories.user_reliability import UserReliabilityRepository
+
+
+def rebuild_reliability() -> int:
+    """
+    Recompute the user_reliability counters from the denuncias table, to
+    repair them after denuncias were changed outside the repositories.
+    Returns the process exit code.
+    """
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+
+    db = SessionLocal()
+    try:
+        users = UserReliabilityRepository(db).rebuild()
+    except Exception as e:
+        print("Erro ao recalcular a confiabilidade:", e)
+        return 1
+    finally:
+        db.close()
+
+    print(f"Confiabilidade recalculada para {users} usuários")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(rebuild_reliability())
@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from app.db.config import Base, SessionLocal, engine
+from app.db.upgrade import upgrade_schema
+from app.services.blockchain_service import BlockchainService
+from app.services.reconciliation_service import ReconciliationService
+
+
+def reconcile(chunk_size: int = None) -> int:
+    """
+    Compare the denuncias table with the reports on chain and print the
+    summary of the run. Returns the process exit code: 0 when no issue was
+    found, 1 otherwise.
+    """
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+
+    db = SessionLocal()
+    try:
+        summary = ReconciliationService(db, BlockchainService()).run(chunk_size=chunk_size)
+    except Exception as e:
+        print("Erro na reconciliação:", e)
+        return 1
+    finally:
+        db.close()
+
+    print(f"Reconciliação {summary['run_id']} concluída: "
+          f"{summary['chain_total']} denúncias na blockchain, "
+          f"{summary['missing']} ausentes, {summary['orphaned']} órfãs, "
+          f"{summary['duplicates']} duplicadas")
+    return 0 if not (summary['missing'] or summary['orphaned'] or summary['duplicates']) else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Reconcilia a tabela denuncias com a blockchain")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Denúncias lidas da blockchain por etapa (padrão: RECONCILE_CHUNK_SIZE)")
+    args = parser.parse_args()
+    sys.exit(reconcile(args.chunk_size))
@@ -0,0 +1,111 @@
+import time
+
+from sqlalchemy import bindparam, exists, func, inspect, select, text, update
+from sqlalchemy.engine import Connection, Engine
+
+from app.db.config import Base, engine as default_engine
+from app.models.anchor_job import AnchorJob
+from app.models.denuncia import Denuncia, normalize_categoria
+from app.models.user_reliability import UserReliability
+from app.repositories.user_reliability import rebuild_statements
+
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def upgrade_schema(engine: Engine = default_engine) -> None:
+    """
+    Bring tables created by an older version up to date with the models.
+
+    create_all only creates missing tables, so columns and indexes added to
+    an existing model later are created here. New columns are added as
+    nullable, since rows already in the table have no value for them, and
+    derived columns are then backfilled.
+    """
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} "
+                    f"{column.type.compile(dialect=engine.dialect)}"))
+                print(f"Coluna {table.name}.{column.name} adicionada")
+
+            indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in indexes:
+                    continue
+                index.create(conn)
+                print(f"Índice {index.name} criado")
+
+        if inspector.has_table(Denuncia.__tablename__):
+            _backfill_categoria_norm(conn)
+            _backfill_user_reliability(conn)
+
+        if inspector.has_table(AnchorJob.__tablename__):
+            _backfill_enqueued_at(conn)
+
+
+def _backfill_categoria_norm(conn: Connection) -> None:
+    """
+    Fill categoria_norm of denuncias created before the column existed.
+    """
+    table = Denuncia.__table__
+    statement = update(table).where(table.c.id == bindparam("row_id")).values(
+        categoria_norm=bindparam("norm"))
+
+    filled = 0
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.categoria).where(
+                table.c.categoria_norm.is_(None)
+            ).limit(BACKFILL_CHUNK_SIZE)).all()
+        if not rows:
+            break
+
+        conn.execute(statement, [
+            {"row_id": row_id, "norm": normalize_categoria(categoria)}
+            for row_id, categoria in rows
+        ])
+        filled += len(rows)
+
+    if filled:
+        print(f"categoria_norm preenchida em {filled} denúncias")
+
+
+def _backfill_user_reliability(conn: Connection) -> None:
+    """
+    Fill the user_reliability counters the first time they are used with
+    a database that already has denuncias.
+    """
+    if conn.scalar(select(exists().select_from(UserReliability))):
+        return
+    if not conn.scalar(select(exists().where(Denuncia.user_uuid.isnot(None)))):
+        return
+
+    for statement in rebuild_statements():
+        conn.execute(statement)
+    print("Contadores de confiabilidade calculados a partir das denúncias")
+
+
+def _backfill_enqueued_at(conn: Connection) -> None:
+    """
+    Fill enqueued_at of anchor jobs queued before the column existed, with
+    their last claim time or now, so the batch time window counts them.
+    """
+    table = AnchorJob.__table__
+    filled = conn.execute(
+        update(table).where(table.c.enqueued_at.is_(None)).values(
+            enqueued_at=func.coalesce(table.c.claimed_at, int(time.time())))
+    ).rowcount
+
+    if filled:
+        print(f"enqueued_at preenchido em {filled} jobs da fila de ancoragem")
@@ -1,7 +1,11 @@
 from typing import Dict, Type
 
 from app.blockchain.polygon import w3 as polygon_w3
+from app.strategies.async_blockchain_provider import AsyncBlockchainProvider
+from app.strategies.async_local_provider import AsyncLocalProvider
+from app.strategies.async_polygon_provider import AsyncPolygonProvider
 from app.strategies.blockchain_provider import BlockchainProvider
+from app.strategies.local_provider import LocalProvider
 from app.strategies.polygon_provider import PolygonProvider
 
 
@@ -10,7 +14,12 @@ class BlockchainFactory:
     Factory for creating blockchain provider instances.
     """
     _providers: Dict[str, Type[BlockchainProvider]] = {
-        "polygon": PolygonProvider
+        "polygon": PolygonProvider,
+        "local": LocalProvider
+    }
+    _async_providers: Dict[str, Type[AsyncBlockchainProvider]] = {
+        "polygon": AsyncPolygonProvider,
+        "local": AsyncLocalProvider
     }
 
     @classmethod
@@ -33,3 +42,24 @@ class BlockchainFactory:
                 f"Unsupported blockchain provider: {provider_name}")
 
         return provider_class()
+
+    @classmethod
+    def get_async_provider(cls, provider_name: str) -> AsyncBlockchainProvider:
+        """
+        Get an asyncio blockchain provider by name.
+
+        Args:
+            provider_name: The name of the provider to get.
+
+        Returns:
+            An instance of the requested async provider.
+
+        Raises:
+            ValueError: If the provider name is not supported.
+        """
+        provider_class = cls._async_providers.get(provider_name.lower())
+        if not provider_class:
+            raise ValueError(
+                f"Unsupported async blockchain provider: {provider_name}")
+
+        return provider_class()
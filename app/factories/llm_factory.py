@@ -147,18 +147,19 @@ class LLMFactory:
             }
 
 
-def create_openai_adapter(model: str = "gpt-4", api_key: Optional[str] = None) -> LLMAdapter:
+def create_openai_adapter(model: str = "gpt-4", api_key: Optional[str] = None, **kwargs) -> LLMAdapter:
     """
     Função de conveniência para criar adapter OpenAI.
 
     Args:
         model: Modelo OpenAI a usar
         api_key: Chave da API (opcional)
+        **kwargs: Argumentos adicionais do adapter (ex.: http_client)
 
     Returns:
         Adapter OpenAI configurado
     """
-    return LLMFactory.create_llm_adapter("openai", model=model, api_key=api_key)
+    return LLMFactory.create_llm_adapter("openai", model=model, api_key=api_key, **kwargs)
 
 
 def create_best_llm() -> LLMAdapter:
@@ -187,12 +188,13 @@ class EnvironmentLLMFactory:
     """
 
     @staticmethod
-    def create_for_environment(env: str = "development") -> LLMAdapter:
+    def create_for_environment(env: str = "development", **kwargs) -> LLMAdapter:
         """
         Cria adapter apropriado para o ambiente especificado.
 
         Args:
             env: Ambiente (development, production, testing)
+            **kwargs: Argumentos adicionais do adapter OpenAI (ex.: http_client)
 
         Returns:
             Adapter LLM apropriado para o ambiente
@@ -200,7 +202,7 @@ class EnvironmentLLMFactory:
 
         if env.lower() in ["prod", "production"]:
             try:
-                adapter = create_openai_adapter()
+                adapter = create_openai_adapter(**kwargs)
                 if not adapter.is_available():
                     raise RuntimeError("OpenAI não disponível em produção")
                 return adapter
@@ -210,7 +212,7 @@ class EnvironmentLLMFactory:
 
         elif env.lower() in ["dev", "development", "local", "test", "testing"]:
             try:
-                adapter = create_openai_adapter()
+                adapter = create_openai_adapter(**kwargs)
                 if adapter.is_available():
                     return adapter
                 else:
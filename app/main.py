@@ -1,20 +1,85 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 from app.controllers.denuncia import router as denuncia_router
 from app.controllers.auth import router as auth_router
 from app.controllers.analysis import router as analysis_router
+from app.core.config import settings
+from app.core.deps import get_async_blockchain_service, get_blockchain_service, get_llm_adapter
+from app.core.providers import providers
 from app.db.config import Base, engine
 from app.db.seed import seed_users
+from app.db.upgrade import upgrade_schema
+from app.services.anchor_service import create_anchor_worker
+from app.services.blockchain_service import (
+    create_chain_head_worker, create_gas_oracle_worker, create_rpc_probe_worker)
+from app.services.chain_indexer_service import create_chain_indexer_worker
+from app.services.receipt_tracker_service import create_receipt_tracker_worker
+from app.services.wallet_metrics_service import create_wallet_metrics_worker
+from app.utils.background import LeaderWorkers
+from app.utils.process_lock import ProcessLock
 from app.utils.rate_limiter import limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
 
-Base.metadata.create_all(bind=engine)
+# Every uvicorn worker imports this module; the schema is set up by one at a time.
+with ProcessLock(os.path.join(settings.LOCK_DIR, "schema.lock")):
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    seed_users()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the shared providers before the first request needs them.
+    get_async_blockchain_service()
+    get_llm_adapter()
+    try:
+        get_blockchain_service().sync_nonce()
+    except Exception as e:
+        # The nonce is synced again on the first submission.
+        print(f"Erro ao sincronizar nonce: {e}")
+
+    # Workers that refresh in-process caches run in every uvicorn worker.
+    background_workers = [create_wallet_metrics_worker()]
+    if settings.RPC_POOL_PROBE_INTERVAL > 0:
+        background_workers.append(create_rpc_probe_worker())
+    if settings.CHAIN_HEAD_POLL_INTERVAL > 0:
+        background_workers.append(create_chain_head_worker())
+    if settings.GAS_ORACLE_ENABLED:
+        background_workers.append(create_gas_oracle_worker())
+
+    # Workers that write to the database or send transactions run in one.
+    leader_workers = []
+    if settings.CHAIN_INDEXER_ENABLED:
+        leader_workers.append(create_chain_indexer_worker())
+    if settings.ANCHOR_MODE.lower() in ("queue", "batch"):
+        leader_workers.append(create_anchor_worker())
+    if settings.RECEIPT_TRACKER_ENABLED:
+        leader_workers.append(create_receipt_tracker_worker())
+    leader = LeaderWorkers(
+        ProcessLock(os.path.join(settings.LOCK_DIR, "workers.lock")),
+        leader_workers, settings.LEADER_ELECTION_INTERVAL)
+
+    for worker in background_workers:
+        worker.start()
+    leader.start()
+
+    yield
+
+    leader.stop()
+    for worker in background_workers:
+        worker.stop()
+
+    providers.close()
+
 
 app = FastAPI(
     title="Denúncias Anônimas - Backend Blockchain",
     version="2.0.0",
-    description="API para registro e listagem de denúncias anonimas na Blockchain (Polygon) com sistema de autenticação baseado em roles."
+    description="API para registro e listagem de denúncias anonimas na Blockchain (Polygon) com sistema de autenticação baseado em roles.",
+    lifespan=lifespan
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -32,8 +97,6 @@ app.include_router(denuncia_router, prefix="/api", tags=["Denúncias"])
 app.include_router(analysis_router, prefix="/api/analysis",
                    tags=["Análise de Confiabilidade"])
 
-seed_users()
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=True)
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Enum, ForeignKey, Integer, String, Text
+from app.db.config import Base
+import enum
+
+
+class AnchorState(enum.Enum):
+    ANCHOR_PENDING = "ANCHOR_PENDING"
+    ANCHOR_SUBMITTING = "ANCHOR_SUBMITTING"
+    ANCHORED = "ANCHORED"
+    ANCHOR_FAILED = "ANCHOR_FAILED"
+
+
+class AnchorJob(Base):
+    """
+    Durable queue entry for registering a denuncia's hash_dados on the
+    blockchain. One job per denuncia; tx_hash is filled in once the
+    transaction is signed, before it is sent.
+    """
+    __tablename__ = "anchor_queue"
+    denuncia_id = Column(Integer, ForeignKey("denuncias.id"), primary_key=True)
+    hash_dados = Column(Text, nullable=False)
+    categoria = Column(String, nullable=False)
+    state = Column(Enum(AnchorState), default=AnchorState.ANCHOR_PENDING,
+                   nullable=False, index=True)
+    tx_hash = Column(String, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    # Unix time the job was queued, used for the batch time window
+    enqueued_at = Column(Integer, nullable=True)
+    # Unix time of the last claim by a worker, to recover jobs of a crashed one
+    claimed_at = Column(Integer, nullable=True)
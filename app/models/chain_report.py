@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Text
+from app.db.config import Base
+
+
+class ChainReport(Base):
+    """
+    Local mirror of an entry of the DenunciaAnonima.denuncias array.
+    The id is the index of the report on the contract.
+    """
+    __tablename__ = "chain_reports"
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    hash_dados = Column(Text, nullable=False, index=True)
+    data_hora = Column(Integer, nullable=False)
+    categoria = Column(String, nullable=False)
+
+
+class ChainIndexState(Base):
+    """
+    Persisted progress markers of the chain indexer, stored as name/value pairs.
+    """
+    __tablename__ = "chain_index_state"
+    name = Column(String, primary_key=True)
+    value = Column(Integer, nullable=False)
@@ -1,8 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, Float, Enum
+from sqlalchemy import Column, Integer, String, Text, Float, Enum, Index
+from sqlalchemy.orm import validates
 from app.db.config import Base
 import enum
 
 
+def normalize_categoria(categoria: str) -> str:
+    """
+    Key used to filter by categoria regardless of case.
+    """
+    return categoria.lower()
+
+
 class StatusDenuncia(enum.Enum):
     PENDING = "PENDING"
     VERIFIED = "VERIFIED"
@@ -21,11 +29,25 @@ class Denuncia(Base):
     id = Column(Integer, primary_key=True, index=True)
     descricao = Column(Text, nullable=False)
     categoria = Column(String, nullable=False)
+    # normalize_categoria(categoria), kept in sync by _set_categoria_norm
+    categoria_norm = Column(String, nullable=True)
     datetime = Column(String, nullable=True)
     latitude = Column(Float)
     longitude = Column(Float)
-    hash_dados = Column(Text, nullable=False)
+    # Not unique: resubmitting identical data yields the same hash
+    hash_dados = Column(Text, nullable=False, index=True)
     user_uuid = Column(String, nullable=True, index=True)
     status = Column(Enum(StatusDenuncia),
                     default=StatusDenuncia.PENDING, nullable=False)
     severidade = Column(Enum(SeveridadeDenuncia), nullable=True)
+
+    __table_args__ = (
+        Index("ix_denuncias_status_severidade_id", "status", "severidade", "id"),
+        Index("ix_denuncias_categoria_norm_id", "categoria_norm", "id"),
+        Index("ix_denuncias_datetime_severidade", "datetime", "severidade"),
+    )
+
+    @validates("categoria")
+    def _set_categoria_norm(self, key, categoria):
+        self.categoria_norm = normalize_categoria(categoria) if categoria is not None else None
+        return categoria
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Enum, ForeignKey, Integer, String, Text
+from app.db.config import Base
+from app.models.anchor_job import AnchorState
+
+
+class MerkleBatch(Base):
+    """
+    A batch of denuncia hashes anchored on the blockchain as a single
+    Merkle root through registrarLoteMerkle.
+    """
+    __tablename__ = "merkle_batches"
+    id = Column(Integer, primary_key=True, index=True)
+    root = Column(String, nullable=False)
+    size = Column(Integer, nullable=False)
+    state = Column(Enum(AnchorState), default=AnchorState.ANCHOR_SUBMITTING,
+                   nullable=False)
+    tx_hash = Column(String, nullable=True)
+    created_at = Column(Integer, nullable=False)
+
+
+class MerkleProof(Base):
+    """
+    Inclusion proof of a denuncia in its Merkle batch. proof is a JSON list
+    of hex-encoded sibling hashes, from the leaf up to the root.
+    """
+    __tablename__ = "merkle_proofs"
+    denuncia_id = Column(Integer, ForeignKey("denuncias.id"), primary_key=True)
+    batch_id = Column(Integer, ForeignKey("merkle_batches.id"),
+                      nullable=False, index=True)
+    leaf_index = Column(Integer, nullable=False)
+    leaf = Column(String, nullable=False)
+    proof = Column(Text, nullable=False)
@@ -0,0 +1,72 @@
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer, String, Text
+from app.db.config import Base
+import enum
+
+
+class ReconciliationState(enum.Enum):
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class ReconciliationIssueKind(enum.Enum):
+    # Local denuncia whose hash_dados is not on chain
+    MISSING = "MISSING"
+    # On-chain report without a local denuncia
+    ORPHANED = "ORPHANED"
+    # hash_dados registered more than once (on chain or locally)
+    DUPLICATE = "DUPLICATE"
+
+
+class ReconciliationRun(Base):
+    """
+    A comparison of the reports on chain with the local denuncias table.
+    Only denuncias up to local_max_id and reports below chain_total, both
+    read when the run started, are compared.
+    """
+    __tablename__ = "reconciliation_runs"
+    id = Column(Integer, primary_key=True, index=True)
+    state = Column(Enum(ReconciliationState), default=ReconciliationState.RUNNING,
+                   nullable=False)
+    started_at = Column(Integer, nullable=False)
+    finished_at = Column(Integer, nullable=True)
+    chain_total = Column(Integer, nullable=True)
+    local_max_id = Column(Integer, nullable=True)
+    missing = Column(Integer, nullable=True)
+    orphaned = Column(Integer, nullable=True)
+    duplicates = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+
+
+class ReconciliationIssue(Base):
+    """
+    A discrepancy found by a reconciliation run. report_id is the on-chain
+    index and denuncia_id the local row, when there is one; for duplicates
+    they point to the first occurrence and occurrences holds the count.
+    """
+    __tablename__ = "reconciliation_issues"
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("reconciliation_runs.id"),
+                    nullable=False, index=True)
+    kind = Column(Enum(ReconciliationIssueKind), nullable=False)
+    # "chain" or "local"
+    source = Column(String, nullable=False)
+    hash_dados = Column(Text, nullable=False)
+    report_id = Column(Integer, nullable=True)
+    denuncia_id = Column(Integer, nullable=True)
+    occurrences = Column(Integer, nullable=True)
+
+
+class ReconciliationChainReport(Base):
+    """
+    Staging copy of the on-chain reports read by a run, joined against
+    denuncias in SQL and deleted when the run ends.
+    """
+    __tablename__ = "reconciliation_chain_reports"
+    run_id = Column(Integer, primary_key=True)
+    report_id = Column(Integer, primary_key=True)
+    hash_dados = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("ix_reconciliation_chain_reports_run_hash", "run_id", "hash_dados"),
+    )
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Enum, ForeignKey, Integer, String
+from app.db.config import Base
+import enum
+
+
+class TxStatus(enum.Enum):
+    PENDING = "PENDING"
+    MINED = "MINED"
+    CONFIRMED = "CONFIRMED"
+    REVERTED = "REVERTED"
+    DROPPED = "DROPPED"
+
+
+class TxReceipt(Base):
+    """
+    A transaction sent for a denuncia and what is known about its inclusion.
+    Denuncias anchored in the same Merkle batch share a tx_hash.
+    """
+    __tablename__ = "tx_receipts"
+    id = Column(Integer, primary_key=True, index=True)
+    denuncia_id = Column(Integer, ForeignKey("denuncias.id"),
+                         nullable=False, index=True)
+    tx_hash = Column(String, nullable=False, index=True)
+    status = Column(Enum(TxStatus), default=TxStatus.PENDING,
+                    nullable=False, index=True)
+    block_number = Column(Integer, nullable=True)
+    gas_used = Column(Integer, nullable=True)
+    confirmations = Column(Integer, nullable=True)
+    submitted_at = Column(Integer, nullable=False)
+    checked_at = Column(Integer, nullable=True)
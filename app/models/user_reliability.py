@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Float, Index, Integer, String
+from app.db.config import Base
+
+
+class UserReliability(Base):
+    """
+    Status counts of the denuncias of each user_uuid, with the reliability
+    score and percentage derived from them. Kept up to date by
+    DenunciaRepository when denuncias are created or change status, and
+    rebuilt from the denuncias table by app.db.rebuild_reliability.
+    """
+    __tablename__ = "user_reliability"
+    user_uuid = Column(String, primary_key=True)
+    verified = Column(Integer, nullable=False, default=0)
+    rejected = Column(Integer, nullable=False, default=0)
+    pending = Column(Integer, nullable=False, default=0)
+    reliability_score = Column(Float, nullable=False, default=0.0)
+    reliability_percentage = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        Index("ix_user_reliability_score", "reliability_score", "user_uuid"),
+    )
@@ -1,5 +1,20 @@
 from app.repositories.denuncia import DenunciaRepository
 from app.repositories.user import UserRepository
+from app.repositories.chain_report import ChainReportRepository
+from app.repositories.anchor_queue import AnchorQueueRepository
+from app.repositories.merkle import MerkleBatchRepository
+from app.repositories.tx_receipt import TxReceiptRepository
+from app.repositories.reconciliation import ReconciliationRepository
+from app.repositories.user_reliability import UserReliabilityRepository
 from app.repositories.base import BaseRepository
+from app.repositories.async_denuncia import AsyncDenunciaRepository
+from app.repositories.async_user import AsyncUserRepository
+from app.repositories.async_base import AsyncBaseRepository
 
-__all__ = ['DenunciaRepository', 'UserRepository', 'BaseRepository']
\ No newline at end of file
+__all__ = ['DenunciaRepository', 'UserRepository',
+           'ChainReportRepository', 'AnchorQueueRepository',
+           'MerkleBatchRepository', 'TxReceiptRepository',
+           'ReconciliationRepository', 'UserReliabilityRepository',
+           'BaseRepository',
+           'AsyncDenunciaRepository', 'AsyncUserRepository',
+           'AsyncBaseRepository']
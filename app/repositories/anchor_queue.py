@@ -0,0 +1,138 @@
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from app.models.anchor_job import AnchorJob, AnchorState
+from app.models.denuncia import Denuncia
+from app.repositories.base import BaseRepository
+
+
+class AnchorQueueRepository(BaseRepository[AnchorJob]):
+    def __init__(self, db: Session):
+        super().__init__(db, AnchorJob)
+
+    def get_by_denuncia_id(self, denuncia_id: int) -> Optional[AnchorJob]:
+        """
+        Get the anchoring job of a denuncia.
+        """
+        return self.db.query(self.model).filter(
+            self.model.denuncia_id == denuncia_id).first()
+
+    def enqueue(self, denuncia: Denuncia) -> AnchorJob:
+        """
+        Queue a denuncia for anchoring and commit. The denuncia may still be
+        pending in the session, so both rows are stored in one transaction.
+        """
+        try:
+            self.db.flush()
+            job = AnchorJob(
+                denuncia_id=denuncia.id,
+                hash_dados=denuncia.hash_dados,
+                categoria=denuncia.categoria,
+                state=AnchorState.ANCHOR_PENDING,
+                attempts=0,
+                enqueued_at=int(time.time())
+            )
+            self.db.add(job)
+            self.db.commit()
+            self.db.refresh(job)
+            return job
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def get_pending_window(self) -> Tuple[int, Optional[int]]:
+        """
+        Get the number of pending jobs and the enqueue time of the oldest one.
+        """
+        count, oldest = self.db.query(
+            func.count(self.model.denuncia_id), func.min(self.model.enqueued_at)
+        ).filter(self.model.state == AnchorState.ANCHOR_PENDING).one()
+        return count, oldest
+
+    def claim(self, limit: int, claim_timeout: int) -> List[AnchorJob]:
+        """
+        Claim up to `limit` pending jobs, oldest first. Jobs left in
+        ANCHOR_SUBMITTING for longer than claim_timeout seconds (a worker
+        died mid-submission) are claimed again.
+
+        Each job is claimed with a conditional UPDATE, so concurrent workers
+        never send the same job twice.
+        """
+        now = int(time.time())
+        claimable = or_(
+            self.model.state == AnchorState.ANCHOR_PENDING,
+            (self.model.state == AnchorState.ANCHOR_SUBMITTING) &
+            (self.model.claimed_at < now - claim_timeout)
+        )
+        candidates = [
+            row.denuncia_id for row in self.db.query(self.model.denuncia_id)
+            .filter(claimable)
+            .order_by(self.model.denuncia_id)
+            .limit(limit)
+        ]
+
+        claimed = []
+        for denuncia_id in candidates:
+            updated = self.db.query(self.model).filter(
+                self.model.denuncia_id == denuncia_id, claimable
+            ).update({
+                self.model.state: AnchorState.ANCHOR_SUBMITTING,
+                self.model.claimed_at: now,
+                self.model.attempts: self.model.attempts + 1
+            }, synchronize_session=False)
+            self.db.commit()
+            if updated:
+                claimed.append(denuncia_id)
+
+        if not claimed:
+            return []
+        return self.db.query(self.model).filter(
+            self.model.denuncia_id.in_(claimed)
+        ).order_by(self.model.denuncia_id).all()
+
+    def mark_signed(self, job: AnchorJob, tx_hash: str) -> None:
+        """
+        Record the hash of a job's signed transaction before it is sent, so
+        a retry can look for its receipt instead of sending it again.
+        """
+        job.tx_hash = tx_hash
+        self.db.commit()
+
+    def mark_anchored(self, job: AnchorJob, tx_hash: str) -> None:
+        """
+        Record the transaction hash of a sent job.
+        """
+        job.state = AnchorState.ANCHORED
+        job.tx_hash = tx_hash
+        job.last_error = None
+        self.db.commit()
+
+    def mark_all_anchored(self, jobs: List[AnchorJob], tx_hash: str) -> None:
+        """
+        Record the transaction hash shared by a batch of jobs.
+        """
+        for job in jobs:
+            job.state = AnchorState.ANCHORED
+            job.tx_hash = tx_hash
+            job.last_error = None
+        self.db.commit()
+
+    def mark_failed(self, job: AnchorJob, error: str, max_attempts: int) -> None:
+        """
+        Record a failed submission. The job goes back to the queue until it
+        has been tried max_attempts times.
+        """
+        self.mark_all_failed([job], error, max_attempts)
+
+    def mark_all_failed(self, jobs: List[AnchorJob], error: str, max_attempts: int) -> None:
+        """
+        Record a failed submission of several jobs, as in mark_failed.
+        """
+        for job in jobs:
+            job.state = (AnchorState.ANCHOR_FAILED if job.attempts >= max_attempts
+                         else AnchorState.ANCHOR_PENDING)
+            job.last_error = error
+        self.db.commit()
@@ -0,0 +1,53 @@
+from abc import ABC
+from typing import Generic, TypeVar, List, Optional, Type, Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar('T')
+
+
+class AsyncBaseRepository(Generic[T], ABC):
+    """
+    Asyncio counterpart of BaseRepository, on an AsyncSession.
+    """
+
+    def __init__(self, db: AsyncSession, model: Type[T]):
+        self.db = db
+        self.model = model
+
+    async def get_by_id(self, id: Any) -> Optional[T]:
+        return await self.db.scalar(
+            select(self.model).where(self.model.id == id).limit(1))
+
+    async def get_all(self) -> List[T]:
+        return list(await self.db.scalars(select(self.model)))
+
+    async def create(self, obj_in: Any) -> T:
+        db_obj = self.model(
+            **obj_in if isinstance(obj_in, dict) else obj_in.dict())
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def update(self, db_obj: T, obj_in: Any) -> T:
+        obj_data = obj_in if isinstance(
+            obj_in, dict) else obj_in.dict(exclude_unset=True)
+
+        for key, value in obj_data.items():
+            if hasattr(db_obj, key):
+                setattr(db_obj, key, value)
+
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def delete(self, id: Any) -> bool:
+        obj = await self.db.get(self.model, id)
+        if obj:
+            await self.db.delete(obj)
+            await self.db.commit()
+            return True
+        return False
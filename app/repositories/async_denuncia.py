@@ -0,0 +1,185 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.anchor_job import AnchorState
+from app.models.chain_report import ChainReport
+from app.models.denuncia import Denuncia, StatusDenuncia, SeveridadeDenuncia
+from app.models.merkle_batch import MerkleBatch, MerkleProof
+from app.repositories.async_base import AsyncBaseRepository
+from app.repositories.denuncia import HASH_LOOKUP_CHUNK_SIZE, apply_filters
+from app.repositories.user_reliability import status_change_statement
+from app.schemas.denuncia import Denuncia as DenunciaSchema
+
+
+class AsyncDenunciaRepository(AsyncBaseRepository[Denuncia]):
+    """
+    Asyncio counterpart of DenunciaRepository, with the same queries.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, Denuncia)
+
+    async def get_by_hash(self, hash_dados: str) -> Optional[Denuncia]:
+        """
+        Get denuncia by its hash_dados field.
+        """
+        return await self.db.scalar(
+            select(self.model).where(
+                self.model.hash_dados == hash_dados).order_by(self.model.id).limit(1))
+
+    async def get_by_hashes(
+        self,
+        hashes: List[str],
+        status: Optional[StatusDenuncia] = None,
+        categoria: Optional[str] = None,
+        user_uuid: Optional[str] = None,
+        severidade: Optional[SeveridadeDenuncia] = None
+    ) -> Dict[str, Denuncia]:
+        """
+        Get the denuncias of several hash_dados values, filtered, with one
+        IN query per HASH_LOOKUP_CHUNK_SIZE hashes; the first denuncia of
+        each hash is returned.
+        """
+        unique_hashes = list(dict.fromkeys(hashes))
+        denuncias: Dict[str, Denuncia] = {}
+        for start in range(0, len(unique_hashes), HASH_LOOKUP_CHUNK_SIZE):
+            query = select(self.model).where(
+                self.model.hash_dados.in_(unique_hashes[start:start + HASH_LOOKUP_CHUNK_SIZE]))
+            query = apply_filters(query, status, categoria, user_uuid, severidade)
+            for row in await self.db.scalars(query.order_by(self.model.id)):
+                denuncias.setdefault(row.hash_dados, row)
+        return denuncias
+
+    async def get_all_by_categoria(self, categoria: str) -> List[Denuncia]:
+        """
+        Get all denuncias by categoria.
+        """
+        return list(await self.db.scalars(
+            select(self.model).where(self.model.categoria == categoria)))
+
+    async def get_by_user_uuid(self, user_uuid: str) -> List[Denuncia]:
+        """
+        Get all denuncias by user_uuid for anonymous user tracking.
+        """
+        return list(await self.db.scalars(
+            select(self.model).where(self.model.user_uuid == user_uuid)))
+
+    async def update_status(self, denuncia_id: int, new_status: StatusDenuncia) -> Optional[Denuncia]:
+        """
+        Update the status of a denuncia by ID, and the reliability counters
+        of its user in the same transaction. The row is read with FOR
+        UPDATE where the backend supports it, so concurrent updates of the
+        same denuncia apply their counter deltas one after the other.
+        """
+        denuncia = await self.db.scalar(
+            select(self.model).where(self.model.id == denuncia_id)
+            .with_for_update().execution_options(populate_existing=True))
+        if denuncia:
+            await self._apply_status_change(denuncia.user_uuid, denuncia.status, new_status)
+            denuncia.status = new_status
+            await self.db.commit()
+            await self.db.refresh(denuncia)
+        return denuncia
+
+    async def get_all_indexed(
+        self,
+        blockchain_offset: int = 0,
+        status: Optional[StatusDenuncia] = None,
+        categoria: Optional[str] = None,
+        user_uuid: Optional[str] = None,
+        severidade: Optional[SeveridadeDenuncia] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[Denuncia, ChainReport]]:
+        """
+        Get denuncias joined with their indexed on-chain reports, ordered by
+        blockchain ID, with the filters applied before the limit.
+        """
+        query = select(self.model, ChainReport).join(
+            ChainReport, ChainReport.hash_dados == self.model.hash_dados
+        ).where(ChainReport.id >= blockchain_offset)
+        query = apply_filters(query, status, categoria, user_uuid, severidade)
+
+        query = query.order_by(ChainReport.id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [tuple(row) for row in await self.db.execute(query)]
+
+    async def get_all_merkle_anchored(
+        self,
+        after_id: int = 0,
+        status: Optional[StatusDenuncia] = None,
+        categoria: Optional[str] = None,
+        user_uuid: Optional[str] = None,
+        severidade: Optional[SeveridadeDenuncia] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[Denuncia, MerkleProof, MerkleBatch]]:
+        """
+        Get denuncias anchored in a sent Merkle batch, with their proof and
+        batch, ordered by ID after after_id. These have no entry in the
+        contract's report list, so get_all_indexed never returns them.
+        """
+        query = select(self.model, MerkleProof, MerkleBatch).join(
+            MerkleProof, MerkleProof.denuncia_id == self.model.id
+        ).join(
+            MerkleBatch, MerkleBatch.id == MerkleProof.batch_id
+        ).where(
+            MerkleBatch.state == AnchorState.ANCHORED,
+            self.model.id > after_id)
+        query = apply_filters(query, status, categoria, user_uuid, severidade)
+
+        query = query.order_by(self.model.id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [tuple(row) for row in await self.db.execute(query)]
+
+    async def get_all_users_with_denuncias(self) -> List[str]:
+        """
+        Get all unique user_uuids that have denuncias.
+        """
+        result = await self.db.scalars(
+            select(self.model.user_uuid).where(
+                self.model.user_uuid.isnot(None)
+            ).distinct())
+        return [user_uuid for user_uuid in result if user_uuid is not None]
+
+    async def create_from_schema(self, denuncia: DenunciaSchema, hash_dados: str, commit: bool = True) -> Denuncia:
+        """
+        Create denuncia from schema and hash_dados, including optional user_uuid,
+        and count it in the reliability counters of its user.
+        With commit=False the denuncia is only added to the session.
+        """
+        nova_denuncia = Denuncia(
+            descricao=denuncia.descricao,
+            categoria=denuncia.categoria,
+            latitude=denuncia.latitude,
+            longitude=denuncia.longitude,
+            hash_dados=hash_dados,
+            datetime=denuncia.datetime,
+            user_uuid=denuncia.user_uuid,
+            status=StatusDenuncia.PENDING
+        )
+        self.db.add(nova_denuncia)
+        await self._apply_status_change(nova_denuncia.user_uuid, None, nova_denuncia.status)
+        if commit:
+            await self.db.commit()
+            await self.db.refresh(nova_denuncia)
+        return nova_denuncia
+
+    async def _apply_status_change(
+        self,
+        user_uuid: Optional[str],
+        old_status: Optional[StatusDenuncia],
+        new_status: StatusDenuncia
+    ) -> None:
+        """
+        Apply a denuncia status change to the reliability counters, in the
+        session's transaction.
+        """
+        statement = status_change_statement(
+            self.db.get_bind().dialect.name, user_uuid, old_status, new_status)
+        if statement is not None:
+            await self.db.execute(statement)
@@ -0,0 +1,53 @@
+import asyncio
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User, UserRole
+from app.utils.jwt import verify_password, get_password_hash
+
+
+class AsyncUserRepository:
+    """
+    Asyncio counterpart of UserRepository. bcrypt hashing is CPU bound, so
+    it runs in a worker thread instead of blocking the event loop.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return await self.db.scalar(select(User).where(User.id == user_id).limit(1))
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        return await self.db.scalar(select(User).where(User.username == username).limit(1))
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self.db.scalar(select(User).where(User.email == email).limit(1))
+
+    async def create_user(self, username: str, password: str, email: Optional[str] = None, role: UserRole = UserRole.USER) -> User:
+        hashed_password = await asyncio.to_thread(get_password_hash, password)
+        user = User(
+            username=username,
+            email=email,
+            hashed_password=hashed_password,
+            role=role
+        )
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def authenticate(self, username: str, password: str) -> Optional[User]:
+        user = await self.get_by_username(username)
+        if not user or not user.is_active:
+            return None
+        if not await asyncio.to_thread(verify_password, password, user.hashed_password):
+            return None
+        return user
+
+    async def update_user(self, user: User) -> User:
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
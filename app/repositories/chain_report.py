@@ -0,0 +1,76 @@
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.chain_report import ChainReport, ChainIndexState
+from app.repositories.base import BaseRepository
+
+NEXT_REPORT_ID = "next_report_id"
+NEXT_BLOCK = "next_block"
+
+
+class ChainReportRepository(BaseRepository[ChainReport]):
+    def __init__(self, db: Session):
+        super().__init__(db, ChainReport)
+
+    def get_state(self, name: str, default: int = 0) -> int:
+        """
+        Get a persisted indexer marker by name.
+        """
+        state = self.db.query(ChainIndexState).filter(
+            ChainIndexState.name == name).first()
+        return state.value if state else default
+
+    def set_state(self, name: str, value: int) -> None:
+        """
+        Set a persisted indexer marker. Does not commit.
+        """
+        state = self.db.query(ChainIndexState).filter(
+            ChainIndexState.name == name).first()
+        if state:
+            state.value = value
+        else:
+            self.db.add(ChainIndexState(name=name, value=value))
+
+    def get_high_water_mark(self) -> int:
+        """
+        Get the ID of the next report that has not been indexed yet.
+        """
+        return self.get_state(NEXT_REPORT_ID)
+
+    def get_next_block(self, default: int = 0) -> int:
+        """
+        Get the first block whose DenunciaRegistrada logs have not been read yet.
+        """
+        return self.get_state(NEXT_BLOCK, default)
+
+    def add_reports(
+        self,
+        reports: List[Tuple[int, str, int, str]],
+        high_water_mark: int,
+        next_block: Optional[int] = None
+    ) -> None:
+        """
+        Store a chunk of (id, hashDados, dataHora, categoria) reports and advance
+        the high-water mark (and the log block cursor, when given) in the same
+        transaction.
+        """
+        try:
+            self.db.add_all([
+                ChainReport(id=report_id, hash_dados=hash_dados,
+                            data_hora=data_hora, categoria=categoria)
+                for report_id, hash_dados, data_hora, categoria in reports
+            ])
+            self.set_state(NEXT_REPORT_ID, high_water_mark)
+            if next_block is not None:
+                self.set_state(NEXT_BLOCK, next_block)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def get_report(self, report_id: int) -> Optional[ChainReport]:
+        """
+        Get an indexed report by its blockchain ID.
+        """
+        return self.get_by_id(report_id)
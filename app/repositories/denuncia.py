@@ -1,21 +1,83 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
-from app.models.denuncia import Denuncia, StatusDenuncia
+from app.models.chain_report import ChainReport
+from app.models.denuncia import Denuncia, StatusDenuncia, SeveridadeDenuncia, normalize_categoria
 from app.repositories.base import BaseRepository
+from app.repositories.user_reliability import UserReliabilityRepository
 from app.schemas.denuncia import Denuncia as DenunciaSchema
 
+# Hashes per IN (...) query, well below SQLite's bound parameter limit
+HASH_LOOKUP_CHUNK_SIZE = 500
+
+# Columns the severity counts can additionally be grouped by
+SEVERITY_BREAKDOWNS = {
+    "categoria": Denuncia.categoria,
+    "status": Denuncia.status,
+}
+
+
+def apply_filters(
+    query,
+    status: Optional[StatusDenuncia],
+    categoria: Optional[str],
+    user_uuid: Optional[str],
+    severidade: Optional[SeveridadeDenuncia]
+):
+    """
+    Add the listing filters to a Query or select() over denuncias. Each one
+    can be served by an index: (status, severidade, id), (categoria_norm, id)
+    or user_uuid.
+    """
+    if status:
+        query = query.filter(Denuncia.status == status)
+    if categoria:
+        query = query.filter(
+            Denuncia.categoria_norm == normalize_categoria(categoria))
+    if user_uuid:
+        query = query.filter(Denuncia.user_uuid == user_uuid)
+    if severidade:
+        query = query.filter(Denuncia.severidade == severidade)
+    return query
+
 
 class DenunciaRepository(BaseRepository[Denuncia]):
     def __init__(self, db: Session):
         super().__init__(db, Denuncia)
+        self.reliability_repository = UserReliabilityRepository(db)
 
     def get_by_hash(self, hash_dados: str) -> Optional[Denuncia]:
         """
         Get denuncia by its hash_dados field.
         """
-        return self.db.query(self.model).filter(self.model.hash_dados == hash_dados).first()
+        return self.db.query(self.model).filter(
+            self.model.hash_dados == hash_dados).order_by(self.model.id).first()
+
+    def get_by_hashes(
+        self,
+        hashes: List[str],
+        status: Optional[StatusDenuncia] = None,
+        categoria: Optional[str] = None,
+        user_uuid: Optional[str] = None,
+        severidade: Optional[SeveridadeDenuncia] = None
+    ) -> Dict[str, Denuncia]:
+        """
+        Get the denuncias of several hash_dados values with one IN query per
+        HASH_LOOKUP_CHUNK_SIZE hashes, keeping only those that match the
+        filters. When a hash has several denuncias, the first one is
+        returned, as in get_by_hash.
+        """
+        unique_hashes = list(dict.fromkeys(hashes))
+        denuncias: Dict[str, Denuncia] = {}
+        for start in range(0, len(unique_hashes), HASH_LOOKUP_CHUNK_SIZE):
+            query = self.db.query(self.model).filter(
+                self.model.hash_dados.in_(unique_hashes[start:start + HASH_LOOKUP_CHUNK_SIZE]))
+            query = apply_filters(query, status, categoria, user_uuid, severidade)
+            for row in query.order_by(self.model.id).all():
+                denuncias.setdefault(row.hash_dados, row)
+        return denuncias
 
     def get_all_by_categoria(self, categoria: str) -> List[Denuncia]:
         """
@@ -31,15 +93,112 @@ class DenunciaRepository(BaseRepository[Denuncia]):
 
     def update_status(self, denuncia_id: int, new_status: StatusDenuncia) -> Optional[Denuncia]:
         """
-        Update the status of a denuncia by ID.
+        Update the status of a denuncia by ID, and the reliability counters
+        of its user in the same transaction. The row is read with FOR
+        UPDATE where the backend supports it, so concurrent updates of the
+        same denuncia apply their counter deltas one after the other.
         """
-        denuncia = self.get_by_id(denuncia_id)
+        denuncia = self.db.query(self.model).filter(
+            self.model.id == denuncia_id
+        ).populate_existing().with_for_update().first()
         if denuncia:
+            self.reliability_repository.apply_status_change(
+                denuncia.user_uuid, denuncia.status, new_status)
             denuncia.status = new_status
             self.db.commit()
             self.db.refresh(denuncia)
         return denuncia
 
+    def update_statuses(self, new_statuses: Dict[int, StatusDenuncia]) -> Dict[int, StatusDenuncia]:
+        """
+        Update the status of several denuncias in one transaction, with one
+        UPDATE ... WHERE id IN per target status, and the reliability
+        counters of their users with one upsert. Rows are read with FOR
+        UPDATE where the backend supports it, so the counter deltas match
+        the statuses being replaced.
+
+        Returns:
+            The previous status of each denuncia found.
+        """
+        try:
+            rows = self.db.query(
+                self.model.id, self.model.user_uuid, self.model.status
+            ).filter(self.model.id.in_(list(new_statuses))).with_for_update().all()
+
+            ids_by_status: Dict[StatusDenuncia, List[int]] = {}
+            for denuncia_id, _, old_status in rows:
+                if new_statuses[denuncia_id] != old_status:
+                    ids_by_status.setdefault(new_statuses[denuncia_id], []).append(denuncia_id)
+
+            for new_status, ids in ids_by_status.items():
+                self.db.execute(
+                    update(self.model).where(self.model.id.in_(ids)).values(status=new_status))
+
+            self.reliability_repository.apply_status_changes([
+                (user_uuid, old_status, new_statuses[denuncia_id])
+                for denuncia_id, user_uuid, old_status in rows
+            ])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return {denuncia_id: old_status for denuncia_id, _, old_status in rows}
+
+    def get_all_indexed(
+        self,
+        blockchain_offset: int = 0,
+        status: Optional[StatusDenuncia] = None,
+        categoria: Optional[str] = None,
+        user_uuid: Optional[str] = None,
+        severidade: Optional[SeveridadeDenuncia] = None,
+        limit: Optional[int] = None
+    ) -> List[Tuple[Denuncia, ChainReport]]:
+        """
+        Get denuncias joined with their indexed on-chain reports, ordered by
+        blockchain ID. Reports with no local denuncia are left out; filters
+        are applied before the limit.
+        """
+        query = self.db.query(self.model, ChainReport).join(
+            ChainReport, ChainReport.hash_dados == self.model.hash_dados
+        ).filter(ChainReport.id >= blockchain_offset)
+        query = apply_filters(query, status, categoria, user_uuid, severidade)
+
+        query = query.order_by(ChainReport.id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query.all()
+
+    def count_by_severidade(
+        self,
+        breakdown: Optional[str] = None,
+        inicio: Optional[str] = None,
+        fim: Optional[str] = None
+    ) -> List[Tuple]:
+        """
+        Count denuncias per severidade (None when not analysed) with one
+        GROUP BY query, optionally also per a SEVERITY_BREAKDOWNS column.
+        inicio and fim bound the datetime field to the half-open interval
+        [inicio, fim). It is stored as text, so they are compared as text
+        and must already be in its format (2024-01-15T10:30:00Z).
+
+        Returns:
+            (severidade, count) rows, or (value, severidade, count) rows
+            with a breakdown.
+        """
+        columns = [self.model.severidade]
+        if breakdown is not None:
+            columns.insert(0, SEVERITY_BREAKDOWNS[breakdown])
+
+        query = self.db.query(*columns, func.count())
+        if inicio is not None:
+            query = query.filter(self.model.datetime >= inicio)
+        if fim is not None:
+            query = query.filter(self.model.datetime < fim)
+
+        return [tuple(row) for row in query.group_by(*columns).all()]
+
     def get_all_users_with_denuncias(self) -> List[str]:
         """
         Get all unique user_uuids that have denuncias.
@@ -49,9 +208,12 @@ class DenunciaRepository(BaseRepository[Denuncia]):
         ).distinct().all()
         return [row[0] for row in result if row[0] is not None]
 
-    def create_from_schema(self, denuncia: DenunciaSchema, hash_dados: str) -> Denuncia:
+    def create_from_schema(self, denuncia: DenunciaSchema, hash_dados: str, commit: bool = True) -> Denuncia:
         """
-        Create denuncia from schema and hash_dados, including optional user_uuid.
+        Create denuncia from schema and hash_dados, including optional user_uuid,
+        and count it in the reliability counters of its user.
+        With commit=False the denuncia is only added to the session, so the
+        caller can store related rows in the same transaction.
         """
         nova_denuncia = Denuncia(
             descricao=denuncia.descricao,
@@ -64,6 +226,9 @@ class DenunciaRepository(BaseRepository[Denuncia]):
             status=StatusDenuncia.PENDING
         )
         self.db.add(nova_denuncia)
-        self.db.commit()
-        self.db.refresh(nova_denuncia)
+        self.reliability_repository.apply_status_change(
+            nova_denuncia.user_uuid, None, nova_denuncia.status)
+        if commit:
+            self.db.commit()
+            self.db.refresh(nova_denuncia)
         return nova_denuncia
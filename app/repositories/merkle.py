@@ -0,0 +1,84 @@
+import json
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.anchor_job import AnchorJob, AnchorState
+from app.models.merkle_batch import MerkleBatch, MerkleProof
+from app.repositories.base import BaseRepository
+
+
+class MerkleBatchRepository(BaseRepository[MerkleBatch]):
+    def __init__(self, db: Session):
+        super().__init__(db, MerkleBatch)
+
+    def create_batch(
+        self,
+        root: str,
+        jobs: List[AnchorJob],
+        leaves: List[str],
+        proofs: List[List[str]]
+    ) -> MerkleBatch:
+        """
+        Store a batch and the inclusion proof of each of its jobs in one
+        transaction. Proofs left by an earlier batch that never got anchored
+        are replaced.
+        """
+        try:
+            denuncia_ids = [job.denuncia_id for job in jobs]
+            self.db.query(MerkleProof).filter(
+                MerkleProof.denuncia_id.in_(denuncia_ids)
+            ).delete(synchronize_session=False)
+
+            batch = MerkleBatch(
+                root=root,
+                size=len(jobs),
+                state=AnchorState.ANCHOR_SUBMITTING,
+                created_at=int(time.time())
+            )
+            self.db.add(batch)
+            self.db.flush()
+
+            self.db.add_all([
+                MerkleProof(
+                    denuncia_id=job.denuncia_id,
+                    batch_id=batch.id,
+                    leaf_index=leaf_index,
+                    leaf=leaf,
+                    proof=json.dumps(proof)
+                )
+                for leaf_index, (job, leaf, proof) in enumerate(zip(jobs, leaves, proofs))
+            ])
+            self.db.commit()
+            self.db.refresh(batch)
+            return batch
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def mark_anchored(self, batch: MerkleBatch, tx_hash: str) -> None:
+        """
+        Record the transaction hash of a sent batch.
+        """
+        batch.state = AnchorState.ANCHORED
+        batch.tx_hash = tx_hash
+        self.db.commit()
+
+    def mark_failed(self, batch: MerkleBatch) -> None:
+        """
+        Mark a batch as failed and drop its proofs; its jobs go into a new batch.
+        """
+        batch.state = AnchorState.ANCHOR_FAILED
+        self.db.query(MerkleProof).filter(
+            MerkleProof.batch_id == batch.id
+        ).delete(synchronize_session=False)
+        self.db.commit()
+
+    def get_proof(self, denuncia_id: int) -> Optional[Tuple[MerkleProof, MerkleBatch]]:
+        """
+        Get the inclusion proof of a denuncia together with its batch.
+        """
+        return self.db.query(MerkleProof, MerkleBatch).join(
+            MerkleBatch, MerkleBatch.id == MerkleProof.batch_id
+        ).filter(MerkleProof.denuncia_id == denuncia_id).first()
@@ -0,0 +1,189 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import exists, func, insert, literal, null, select
+from sqlalchemy.orm import Session
+
+from app.models.anchor_job import AnchorJob, AnchorState
+from app.models.denuncia import Denuncia
+from app.models.merkle_batch import MerkleBatch, MerkleProof
+from app.models.reconciliation import (
+    ReconciliationChainReport, ReconciliationIssue, ReconciliationIssueKind,
+    ReconciliationRun, ReconciliationState)
+from app.models.tx_receipt import TxReceipt, TxStatus
+from app.repositories.base import BaseRepository
+
+ISSUE_COLUMNS = ["run_id", "kind", "source", "hash_dados",
+                 "report_id", "denuncia_id", "occurrences"]
+
+
+class ReconciliationRepository(BaseRepository[ReconciliationRun]):
+    def __init__(self, db: Session):
+        super().__init__(db, ReconciliationRun)
+
+    def create_run(self) -> ReconciliationRun:
+        """
+        Start a run, recording the last local denuncia it covers, and commit.
+        """
+        local_max_id = self.db.query(func.max(Denuncia.id)).scalar() or 0
+        run = ReconciliationRun(
+            state=ReconciliationState.RUNNING,
+            started_at=int(time.time()),
+            local_max_id=local_max_id)
+        self.db.add(run)
+        self.db.commit()
+        self.db.refresh(run)
+        return run
+
+    def add_chain_reports(self, run_id: int, reports: List[Tuple[int, str]]) -> None:
+        """
+        Stage a chunk of (report_id, hash_dados) on-chain reports and commit.
+        """
+        if not reports:
+            return
+
+        try:
+            self.db.execute(insert(ReconciliationChainReport), [
+                {"run_id": run_id, "report_id": report_id, "hash_dados": hash_dados}
+                for report_id, hash_dados in reports
+            ])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def build_issues(self, run_id: int, local_max_id: int) -> Dict[ReconciliationIssueKind, int]:
+        """
+        Compare the staged reports of a run with the denuncias table and
+        store every discrepancy, with INSERT ... SELECT statements so no row
+        is loaded into memory. Does not commit.
+
+        Denuncias that are still being anchored (queued, or with a pending
+        transaction) and denuncias of anchored Merkle batches are not
+        reported as missing.
+
+        Returns:
+            The number of issues of each kind.
+        """
+        staged = ReconciliationChainReport
+        kind_type = ReconciliationIssue.kind.type
+
+        def issue_columns(kind: ReconciliationIssueKind, source: str):
+            return [literal(run_id), literal(kind, kind_type), literal(source)]
+
+        on_chain = exists().where(
+            staged.run_id == run_id, staged.hash_dados == Denuncia.hash_dados)
+        in_anchored_batch = exists().where(
+            MerkleProof.denuncia_id == Denuncia.id,
+            MerkleBatch.id == MerkleProof.batch_id,
+            MerkleBatch.state == AnchorState.ANCHORED)
+        queued = exists().where(
+            AnchorJob.denuncia_id == Denuncia.id,
+            AnchorJob.state.in_((AnchorState.ANCHOR_PENDING, AnchorState.ANCHOR_SUBMITTING)))
+        in_flight = exists().where(
+            TxReceipt.denuncia_id == Denuncia.id,
+            TxReceipt.status == TxStatus.PENDING)
+        missing = select(
+            *issue_columns(ReconciliationIssueKind.MISSING, "local"),
+            Denuncia.hash_dados, null(), Denuncia.id, null()
+        ).where(
+            Denuncia.id <= local_max_id,
+            ~on_chain, ~in_anchored_batch, ~queued, ~in_flight)
+
+        # An uncorrelated NOT IN is evaluated once into a temporary index of
+        # the local hashes, instead of scanning denuncias per staged report.
+        orphaned = select(
+            *issue_columns(ReconciliationIssueKind.ORPHANED, "chain"),
+            staged.hash_dados, staged.report_id, null(), null()
+        ).where(
+            staged.run_id == run_id,
+            staged.hash_dados.not_in(select(Denuncia.hash_dados)))
+
+        chain_duplicates = select(
+            *issue_columns(ReconciliationIssueKind.DUPLICATE, "chain"),
+            staged.hash_dados, func.min(staged.report_id), null(), func.count()
+        ).where(
+            staged.run_id == run_id
+        ).group_by(staged.hash_dados).having(func.count() > 1)
+
+        local_duplicates = select(
+            *issue_columns(ReconciliationIssueKind.DUPLICATE, "local"),
+            Denuncia.hash_dados, null(), func.min(Denuncia.id), func.count()
+        ).where(
+            Denuncia.id <= local_max_id
+        ).group_by(Denuncia.hash_dados).having(func.count() > 1)
+
+        for query in (missing, orphaned, chain_duplicates, local_duplicates):
+            self.db.execute(
+                insert(ReconciliationIssue).from_select(ISSUE_COLUMNS, query))
+
+        counts = dict(self.db.query(
+            ReconciliationIssue.kind, func.count()
+        ).filter(
+            ReconciliationIssue.run_id == run_id
+        ).group_by(ReconciliationIssue.kind).all())
+        return {kind: counts.get(kind, 0) for kind in ReconciliationIssueKind}
+
+    def complete_run(self, run_id: int, chain_total: int) -> ReconciliationRun:
+        """
+        Build the issues of a run, record its totals and drop its staged
+        reports, in one transaction.
+        """
+        try:
+            run = self.get_by_id(run_id)
+            counts = self.build_issues(run_id, run.local_max_id)
+            run.state = ReconciliationState.COMPLETED
+            run.finished_at = int(time.time())
+            run.chain_total = chain_total
+            run.missing = counts[ReconciliationIssueKind.MISSING]
+            run.orphaned = counts[ReconciliationIssueKind.ORPHANED]
+            run.duplicates = counts[ReconciliationIssueKind.DUPLICATE]
+            self._clear_chain_reports(run_id)
+            self.db.commit()
+            self.db.refresh(run)
+            return run
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def fail_run(self, run_id: int, error: str) -> None:
+        """
+        Mark a run as failed and drop its staged reports.
+        """
+        try:
+            self.db.query(self.model).filter(self.model.id == run_id).update({
+                "state": ReconciliationState.FAILED,
+                "finished_at": int(time.time()),
+                "error": error
+            }, synchronize_session=False)
+            self._clear_chain_reports(run_id)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _clear_chain_reports(self, run_id: int) -> None:
+        self.db.query(ReconciliationChainReport).filter(
+            ReconciliationChainReport.run_id == run_id
+        ).delete(synchronize_session=False)
+
+    def get_latest_run(self) -> Optional[ReconciliationRun]:
+        return self.db.query(self.model).order_by(self.model.id.desc()).first()
+
+    def get_issues(
+        self,
+        run_id: int,
+        kind: Optional[ReconciliationIssueKind] = None,
+        after_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[ReconciliationIssue]:
+        """
+        Get a page of the issues of a run, ordered by ID.
+        """
+        query = self.db.query(ReconciliationIssue).filter(
+            ReconciliationIssue.run_id == run_id)
+        if kind:
+            query = query.filter(ReconciliationIssue.kind == kind)
+        if after_id is not None:
+            query = query.filter(ReconciliationIssue.id > after_id)
+        return query.order_by(ReconciliationIssue.id).limit(limit).all()
@@ -0,0 +1,80 @@
+import time
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.tx_receipt import TxReceipt, TxStatus
+from app.repositories.base import BaseRepository
+
+IN_FLIGHT = (TxStatus.PENDING, TxStatus.MINED)
+
+
+class TxReceiptRepository(BaseRepository[TxReceipt]):
+    def __init__(self, db: Session):
+        super().__init__(db, TxReceipt)
+
+    def track(self, transactions: List[Tuple[int, str]]) -> None:
+        """
+        Start tracking (denuncia_id, tx_hash) pairs as pending and commit.
+        """
+        now = int(time.time())
+        self.db.add_all([
+            TxReceipt(denuncia_id=denuncia_id, tx_hash=tx_hash,
+                      status=TxStatus.PENDING, submitted_at=now)
+            for denuncia_id, tx_hash in transactions
+        ])
+        self.db.commit()
+
+    def get_in_flight(self, limit: int) -> Dict[str, Tuple[TxStatus, int]]:
+        """
+        Get up to `limit` distinct transactions that are pending or not yet
+        confirmed, least recently checked first (never checked ones first,
+        then oldest first), so successive calls rotate through every
+        in-flight transaction however many there are. Rows sharing a tx_hash
+        are always updated together, so they share a status and checked_at.
+
+        Returns:
+            A dict of tx_hash -> (status, submitted_at).
+        """
+        rows = self.db.query(
+            self.model.tx_hash,
+            self.model.status,
+            func.min(self.model.submitted_at)
+        ).filter(
+            self.model.status.in_(IN_FLIGHT)
+        ).group_by(self.model.tx_hash, self.model.status).order_by(
+            func.min(func.coalesce(self.model.checked_at, 0)),
+            func.min(self.model.id)
+        ).limit(limit).all()
+        return {tx_hash: (status, submitted_at)
+                for tx_hash, status, submitted_at in rows}
+
+    def update_transactions(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Apply column updates to every row of each tx_hash in one transaction.
+        """
+        try:
+            for tx_hash, values in updates.items():
+                self.db.query(self.model).filter(
+                    self.model.tx_hash == tx_hash,
+                    self.model.status.in_(IN_FLIGHT)
+                ).update(values, synchronize_session=False)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def get_latest_by_denuncia_ids(self, denuncia_ids: List[int]) -> Dict[int, TxReceipt]:
+        """
+        Get the most recent tracked transaction of each denuncia.
+        """
+        if not denuncia_ids:
+            return {}
+
+        latest_ids = self.db.query(func.max(self.model.id)).filter(
+            self.model.denuncia_id.in_(denuncia_ids)
+        ).group_by(self.model.denuncia_id)
+        rows = self.db.query(self.model).filter(
+            self.model.id.in_(latest_ids)).all()
+        return {row.denuncia_id: row for row in rows}
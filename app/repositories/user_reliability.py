@@ -0,0 +1,263 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.denuncia import Denuncia, StatusDenuncia
+from app.models.user_reliability import UserReliability
+from app.repositories.base import BaseRepository
+
+# Counter column of each status
+STATUS_COLUMNS = {
+    StatusDenuncia.VERIFIED: "verified",
+    StatusDenuncia.REJECTED: "rejected",
+    StatusDenuncia.PENDING: "pending",
+}
+
+# INSERT ... ON CONFLICT of each supported backend
+UPSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def reliability_score(verified, rejected):
+    """
+    Each verified denuncia adds 1 point and each rejected one subtracts 0.5;
+    pending denuncias do not affect the score.
+    """
+    return verified - rejected * 0.5
+
+
+def reliability_percentage(verified, rejected):
+    """
+    Score over the number of processed (verified or rejected) denuncias, as
+    a percentage; 0 when negative or when every denuncia is pending.
+    """
+    processed = verified + rejected
+    score = reliability_score(verified, rejected)
+    return case(
+        (processed > 0, case((score > 0, score / processed * 100), else_=0.0)),
+        else_=0.0)
+
+
+def reliability_level(percentage):
+    """
+    Reliability level of a percentage.
+    """
+    return case(
+        (percentage >= 80, "MUITO_CONFIAVEL"),
+        (percentage >= 60, "CONFIAVEL"),
+        (percentage >= 40, "MODERADA"),
+        (percentage >= 20, "BAIXA"),
+        else_="MUITO_BAIXA")
+
+
+def status_counts():
+    """
+    Aggregate columns counting the denuncias of each status, for a query
+    grouped by user_uuid.
+    """
+    return {
+        column: func.sum(case((Denuncia.status == status, 1), else_=0))
+        for status, column in STATUS_COLUMNS.items()
+    }
+
+
+def status_change_deltas(
+    old_status: Optional[StatusDenuncia],
+    new_status: StatusDenuncia
+) -> Dict[str, int]:
+    """
+    Counter deltas of a denuncia status change; old_status is None for a
+    new denuncia.
+    """
+    deltas = {column: 0 for column in STATUS_COLUMNS.values()}
+    deltas[STATUS_COLUMNS[new_status]] += 1
+    if old_status is not None:
+        deltas[STATUS_COLUMNS[old_status]] -= 1
+    return deltas
+
+
+def counter_deltas_statement(dialect_name: str, deltas_by_user: Dict[str, Dict[str, int]]):
+    """
+    Build the statement adding counter deltas to several users, as one
+    multi-row INSERT ... ON CONFLICT DO UPDATE that also recomputes the
+    derived columns, so concurrent changes of the same user never lose an
+    update. Each user must appear once. Returns None when there is nothing
+    to apply.
+    """
+    if not deltas_by_user:
+        return None
+
+    table = UserReliability.__table__
+    statement = UPSERTS[dialect_name](table).values([
+        {
+            "user_uuid": user_uuid,
+            "reliability_score": reliability_score(
+                literal(deltas["verified"]), literal(deltas["rejected"])),
+            "reliability_percentage": reliability_percentage(
+                literal(deltas["verified"]), literal(deltas["rejected"])),
+            **deltas
+        }
+        for user_uuid, deltas in deltas_by_user.items()
+    ])
+
+    counts = {column: table.c[column] + statement.excluded[column]
+              for column in STATUS_COLUMNS.values()}
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.user_uuid],
+        set_={
+            **counts,
+            "reliability_score": reliability_score(
+                counts["verified"], counts["rejected"]),
+            "reliability_percentage": reliability_percentage(
+                counts["verified"], counts["rejected"])
+        })
+
+
+def status_change_statement(
+    dialect_name: str,
+    user_uuid: Optional[str],
+    old_status: Optional[StatusDenuncia],
+    new_status: StatusDenuncia
+):
+    """
+    Build the statement applying a denuncia status change to the counters of
+    its user; old_status is None for a new denuncia. Returns None when
+    nothing changes (no user_uuid or same status).
+    """
+    if not user_uuid or old_status == new_status:
+        return None
+    return counter_deltas_statement(
+        dialect_name, {user_uuid: status_change_deltas(old_status, new_status)})
+
+
+def rebuild_statements() -> list:
+    """
+    Build the statements replacing every row with counters aggregated from
+    the denuncias table in one INSERT ... SELECT.
+    """
+    counts = status_counts()
+    aggregate = select(
+        Denuncia.user_uuid,
+        *counts.values(),
+        reliability_score(counts["verified"], counts["rejected"]),
+        reliability_percentage(counts["verified"], counts["rejected"])
+    ).where(
+        Denuncia.user_uuid.isnot(None)
+    ).group_by(Denuncia.user_uuid)
+
+    return [
+        delete(UserReliability),
+        insert(UserReliability).from_select(
+            ["user_uuid", *counts, "reliability_score", "reliability_percentage"],
+            aggregate)
+    ]
+
+
+class UserReliabilityRepository(BaseRepository[UserReliability]):
+    def __init__(self, db: Session):
+        super().__init__(db, UserReliability)
+
+    def apply_status_change(
+        self,
+        user_uuid: Optional[str],
+        old_status: Optional[StatusDenuncia],
+        new_status: StatusDenuncia
+    ) -> None:
+        """
+        Apply a denuncia status change to the counters. Does not commit, so
+        it runs in the caller's transaction.
+        """
+        statement = status_change_statement(
+            self.db.get_bind().dialect.name, user_uuid, old_status, new_status)
+        if statement is not None:
+            self.db.execute(statement)
+
+    def apply_status_changes(
+        self,
+        changes: List[Tuple[Optional[str], StatusDenuncia, StatusDenuncia]]
+    ) -> None:
+        """
+        Apply several (user_uuid, old_status, new_status) changes with one
+        statement, summing the deltas of each user. Does not commit.
+        """
+        deltas_by_user: Dict[str, Dict[str, int]] = {}
+        for user_uuid, old_status, new_status in changes:
+            if not user_uuid or old_status == new_status:
+                continue
+            user_deltas = deltas_by_user.setdefault(
+                user_uuid, {column: 0 for column in STATUS_COLUMNS.values()})
+            for column, delta in status_change_deltas(old_status, new_status).items():
+                user_deltas[column] += delta
+
+        statement = counter_deltas_statement(
+            self.db.get_bind().dialect.name, deltas_by_user)
+        if statement is not None:
+            self.db.execute(statement)
+
+    def rebuild(self) -> int:
+        """
+        Recompute every row from the denuncias table and commit.
+
+        Returns:
+            The number of users.
+        """
+        try:
+            for statement in rebuild_statements():
+                self.db.execute(statement)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.db.query(func.count(self.model.user_uuid)).scalar()
+
+    def get_by_user_uuid(self, user_uuid: str) -> Optional[UserReliability]:
+        return self.db.get(self.model, user_uuid)
+
+    def _query_with_level(self):
+        return self.db.query(
+            self.model,
+            reliability_level(self.model.reliability_percentage).label("reliability_level"))
+
+    def get_with_level(self, user_uuid: str) -> Optional[Tuple[UserReliability, str]]:
+        """
+        Get the counters of a user with their reliability level.
+        """
+        return self._query_with_level().filter(
+            self.model.user_uuid == user_uuid).first()
+
+    def get_ranking(self, limit: Optional[int] = None) -> List[Tuple[UserReliability, str]]:
+        """
+        Get users with their reliability level, ordered by score, best
+        first, in one query that reads the score index backwards and stops
+        at the limit.
+        """
+        query = self._query_with_level().order_by(
+            self.model.reliability_score.desc(), self.model.user_uuid.desc())
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    def get_level_distribution(self) -> Dict[str, int]:
+        """
+        Count the users of each reliability level.
+        """
+        level = reliability_level(self.model.reliability_percentage)
+        return dict(self.db.query(level, func.count()).group_by(level).all())
+
+    def get_totals(self) -> Dict[str, int]:
+        """
+        Get the number of users and the sum of each counter.
+        """
+        users, verified, rejected, pending = self.db.query(
+            func.count(self.model.user_uuid),
+            func.coalesce(func.sum(self.model.verified), 0),
+            func.coalesce(func.sum(self.model.rejected), 0),
+            func.coalesce(func.sum(self.model.pending), 0)
+        ).one()
+        return {"users": users, "verified": verified,
+                "rejected": rejected, "pending": pending}
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from app.models.denuncia import StatusDenuncia, SeveridadeDenuncia
 
 
@@ -32,6 +32,15 @@ class DenunciaStatusUpdate(BaseModel):
     status: StatusDenuncia
 
 
+class DenunciaStatusBatchItem(BaseModel):
+    id: int
+    status: StatusDenuncia
+
+
+class DenunciaStatusBatchUpdate(BaseModel):
+    updates: List[DenunciaStatusBatchItem]
+
+
 class SeveridadeAnalysis(BaseModel):
     severidade: SeveridadeDenuncia
     pontuacao: float
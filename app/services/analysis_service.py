@@ -1,13 +1,15 @@
 from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.repositories.denuncia import DenunciaRepository
-from app.models.denuncia import StatusDenuncia
+from app.repositories.user_reliability import UserReliabilityRepository
+
+RELIABILITY_LEVELS = ["MUITO_CONFIAVEL", "CONFIAVEL", "MODERADA", "BAIXA", "MUITO_BAIXA"]
 
 
 class AnalysisService:
     """
     Service for analyzing user reliability based on their denuncias.
+    Reads the per-user counters of the user_reliability table, kept up to
+    date when denuncias are created or change status.
     """
 
     def __init__(self, db: Session):
@@ -17,7 +19,7 @@ class AnalysisService:
         Args:
             db: Database session.
         """
-        self.repository = DenunciaRepository(db)
+        self.repository = UserReliabilityRepository(db)
 
     def get_user_reliability(self, user_uuid: str) -> Dict[str, Any]:
         """
@@ -29,9 +31,9 @@ class AnalysisService:
         Returns:
             Dictionary containing reliability metrics and statistics.
         """
-        user_denuncias = self.repository.get_by_user_uuid(user_uuid)
+        row = self.repository.get_with_level(user_uuid)
 
-        if not user_denuncias:
+        if not row or not (row[0].verified + row[0].rejected + row[0].pending):
             return {
                 "user_uuid": user_uuid,
                 "total_denuncias": 0,
@@ -41,45 +43,17 @@ class AnalysisService:
                 "message": "Usuário não possui denúncias registradas"
             }
 
-        status_counts = {
-            "PENDING": 0,
-            "VERIFIED": 0,
-            "REJECTED": 0
-        }
+        reliability, reliability_level = row
+        verified_count = reliability.verified
+        rejected_count = reliability.rejected
+        pending_count = reliability.pending
+        total_denuncias = verified_count + rejected_count + pending_count
 
-        for denuncia in user_denuncias:
-            status_counts[denuncia.status.value] += 1
-
-        total_denuncias = len(user_denuncias)
-
-        # Calculate reliability score
-        # Verified denuncias add positive points
-        # Rejected denuncias subtract points
-        # Pending denuncias are neutral but show activity
-        verified_count = status_counts["VERIFIED"]
-        rejected_count = status_counts["REJECTED"]
-        pending_count = status_counts["PENDING"]
-
-        # Reliability calculation:
-        # - Each verified denuncia adds 1 point
-        # - Each rejected denuncia subtracts 0.5 points
-        # - Pending denuncias don't affect the score but are counted
-        reliability_score = verified_count - (rejected_count * 0.5)
-
-        # Calculate reliability percentage (max score = total verified)
-        # If user has only rejected denuncias, reliability can be negative
-        if total_denuncias > 0:
-            max_possible_score = verified_count + rejected_count  # Only processed denuncias
-            if max_possible_score > 0:
-                reliability_percentage = max(
-                    0, (reliability_score / max_possible_score) * 100)
-            else:
-                reliability_percentage = 0.0  # Only pending denuncias
-        else:
-            reliability_percentage = 0.0
-
-        # Determine reliability level
-        reliability_level = self._get_reliability_level(reliability_percentage)
+        # Score, percentage and level are computed in SQL (see
+        # app.repositories.user_reliability): each verified denuncia adds 1
+        # point, each rejected one subtracts 0.5, pending ones are neutral.
+        reliability_score = reliability.reliability_score
+        reliability_percentage = reliability.reliability_percentage
 
         return {
             "user_uuid": user_uuid,
@@ -88,9 +62,9 @@ class AnalysisService:
             "reliability_percentage": f"{reliability_percentage:.2f}%",
             "reliability_level": reliability_level,
             "status_breakdown": {
-                "verified": status_counts["VERIFIED"],
-                "rejected": status_counts["REJECTED"],
-                "pending": status_counts["PENDING"]
+                "verified": verified_count,
+                "rejected": rejected_count,
+                "pending": pending_count
             },
             "processed_denuncias": verified_count + rejected_count,
             "analysis": {
@@ -99,27 +73,6 @@ class AnalysisService:
             }
         }
 
-    def _get_reliability_level(self, percentage: float) -> str:
-        """
-        Determine reliability level based on percentage.
-
-        Args:
-            percentage: Reliability percentage.
-
-        Returns:
-            String describing the reliability level.
-        """
-        if percentage >= 80:
-            return "MUITO_CONFIAVEL"
-        elif percentage >= 60:
-            return "CONFIAVEL"
-        elif percentage >= 40:
-            return "MODERADA"
-        elif percentage >= 20:
-            return "BAIXA"
-        else:
-            return "MUITO_BAIXA"
-
     def get_users_reliability_ranking(self, limit: Optional[int] = 10) -> Dict[str, Any]:
         """
         Get a ranking of users by their reliability scores.
@@ -130,37 +83,66 @@ class AnalysisService:
         Returns:
             Dictionary containing the ranking and statistics.
         """
-        all_users = self.repository.get_all_users_with_denuncias()
+        ranking = self.repository.get_ranking(limit)
 
-        if not all_users:
+        if not ranking:
             return {
                 "message": "Nenhum usuário com denúncias encontrado",
                 "ranking": [],
                 "total_users": 0
             }
 
-        user_reliabilities = []
-        for user_uuid in all_users:
-            reliability_data = self.get_user_reliability(user_uuid)
-            if reliability_data["total_denuncias"] > 0:
-                user_reliabilities.append({
-                    "user_uuid": user_uuid,
-                    "reliability_score": reliability_data["reliability_score"],
-                    "reliability_percentage": reliability_data["reliability_percentage"],
-                    "reliability_level": reliability_data["reliability_level"],
-                    "total_denuncias": reliability_data["total_denuncias"],
-                    "verified": reliability_data["status_breakdown"]["verified"],
-                    "rejected": reliability_data["status_breakdown"]["rejected"]
-                })
-
-        user_reliabilities.sort(
-            key=lambda x: x["reliability_score"], reverse=True)
-
-        if limit:
-            user_reliabilities = user_reliabilities[:limit]
+        user_reliabilities = [
+            {
+                "user_uuid": reliability.user_uuid,
+                "reliability_score": round(reliability.reliability_score, 2),
+                "reliability_percentage": f"{reliability.reliability_percentage:.2f}%",
+                "reliability_level": reliability_level,
+                "total_denuncias": reliability.verified + reliability.rejected + reliability.pending,
+                "verified": reliability.verified,
+                "rejected": reliability.rejected
+            }
+            for reliability, reliability_level in ranking
+        ]
 
         return {
             "ranking": user_reliabilities,
             "total_users": len(user_reliabilities),
             "generated_at": "now"
         }
+
+    def get_reliability_overview(self) -> Dict[str, Any]:
+        """
+        Get the number of users of each reliability level and the totals of
+        the system, with two aggregate queries.
+
+        Returns:
+            Dictionary containing the distribution and the system statistics.
+        """
+        totals = self.repository.get_totals()
+
+        if not totals["users"]:
+            return {
+                "message": "Nenhum dado disponível para análise",
+                "total_users": 0,
+                "reliability_distribution": {}
+            }
+
+        distribution = self.repository.get_level_distribution()
+        total_verified = totals["verified"]
+        total_rejected = totals["rejected"]
+        processed = total_verified + total_rejected
+
+        return {
+            "total_users_with_denuncias": totals["users"],
+            "reliability_distribution": {
+                level: distribution.get(level, 0) for level in RELIABILITY_LEVELS
+            },
+            "system_stats": {
+                "total_denuncias": total_verified + total_rejected + totals["pending"],
+                "total_verified": total_verified,
+                "total_rejected": total_rejected,
+                "global_verification_rate": f"{(total_verified / processed * 100):.2f}%" if processed > 0 else "N/A",
+                "global_rejection_rate": f"{(total_rejected / processed * 100):.2f}%" if processed > 0 else "N/A"
+            }
+        }
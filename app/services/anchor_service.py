@@ -0,0 +1,189 @@
+import json
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.config import SessionLocal
+from app.models.anchor_job import AnchorJob
+from app.models.denuncia import Denuncia
+from app.models.merkle_batch import MerkleBatch, MerkleProof
+from app.repositories.anchor_queue import AnchorQueueRepository
+from app.repositories.merkle import MerkleBatchRepository
+from app.services.blockchain_service import BlockchainService
+from app.services.receipt_tracker_service import ReceiptTrackerService
+from app.utils.background import PeriodicWorker
+from app.utils.merkle import build_tree, hash_leaf
+
+
+def build_proof(proof: MerkleProof, batch: MerkleBatch) -> Dict[str, Any]:
+    """
+    Build the API representation of the inclusion proof of a denuncia in
+    its Merkle batch.
+    """
+    return {
+        "denuncia_id": proof.denuncia_id,
+        "leaf": proof.leaf,
+        "leaf_index": proof.leaf_index,
+        "proof": json.loads(proof.proof),
+        "root": batch.root,
+        "batch_id": batch.id,
+        "batch_size": batch.size,
+        "status": batch.state.value,
+        "tx_hash": batch.tx_hash
+    }
+
+
+class AnchorService:
+    """
+    Service that registers queued denuncia hashes on the blockchain, so
+    POST /api/denuncia doesn't wait on the RPC node. With ANCHOR_MODE=batch,
+    queued hashes are anchored together as a single Merkle root.
+    """
+
+    def __init__(self, db: Session, blockchain_service: BlockchainService):
+        """
+        Initialize the anchor service.
+
+        Args:
+            db: Database session.
+            blockchain_service: Blockchain service used to send transactions.
+        """
+        self.repository = AnchorQueueRepository(db)
+        self.merkle_repository = MerkleBatchRepository(db)
+        self.receipt_tracker = ReceiptTrackerService(db, blockchain_service)
+        self.blockchain_service = blockchain_service
+
+    def enqueue(self, denuncia: Denuncia) -> AnchorJob:
+        """
+        Queue a denuncia for anchoring.
+        """
+        return self.repository.enqueue(denuncia)
+
+    def get_job(self, denuncia_id: int) -> Optional[AnchorJob]:
+        """
+        Get the anchoring job of a denuncia.
+        """
+        return self.repository.get_by_denuncia_id(denuncia_id)
+
+    def get_proof(self, denuncia_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the Merkle inclusion proof of a batch-anchored denuncia.
+        """
+        result = self.merkle_repository.get_proof(denuncia_id)
+        if result is None:
+            return None
+
+        return build_proof(*result)
+
+    def process_pending(self) -> int:
+        """
+        Claim queued jobs and anchor them, one transaction per job or one
+        Merkle root per batch depending on ANCHOR_MODE.
+
+        Returns:
+            The number of jobs anchored.
+        """
+        if settings.ANCHOR_MODE.lower() == "batch":
+            return self.process_batch()
+
+        jobs = self.repository.claim(
+            settings.ANCHOR_QUEUE_BATCH_SIZE, settings.ANCHOR_CLAIM_TIMEOUT)
+
+        anchored = 0
+        for job in jobs:
+            try:
+                tx_hash = self._get_mined_tx_hash(job)
+                if tx_hash is None:
+                    tx_hash = self.blockchain_service.register_denuncia(
+                        job.hash_dados, job.categoria,
+                        lambda signed_hash, job=job: self.repository.mark_signed(job, signed_hash))
+            except Exception as e:
+                print(
+                    f"Erro ao ancorar denúncia {job.denuncia_id} (tentativa {job.attempts}): {e}")
+                self.repository.mark_failed(
+                    job, str(e), settings.ANCHOR_MAX_ATTEMPTS)
+                continue
+
+            self.repository.mark_anchored(job, tx_hash)
+            self.receipt_tracker.track([(job.denuncia_id, tx_hash)])
+            anchored += 1
+        return anchored
+
+    def _get_mined_tx_hash(self, job: AnchorJob) -> Optional[str]:
+        """
+        Get the hash of a transaction sent for the job by an earlier attempt
+        (failed after broadcast, or a worker that died mid-submission) if it
+        was mined successfully, so the denuncia is not registered twice.
+        """
+        if not job.tx_hash:
+            return None
+
+        receipt = self.blockchain_service.get_transaction_receipts(
+            [job.tx_hash]).get(job.tx_hash)
+        if receipt is not None and receipt["status"] == 1:
+            return job.tx_hash
+        return None
+
+    def process_batch(self) -> int:
+        """
+        Anchor the queued jobs as one Merkle batch once ANCHOR_BATCH_SIZE
+        jobs are waiting or the oldest has waited ANCHOR_BATCH_WINDOW seconds.
+
+        Returns:
+            The number of jobs anchored.
+        """
+        pending, oldest = self.repository.get_pending_window()
+        if not pending:
+            return 0
+        if (pending < settings.ANCHOR_BATCH_SIZE and oldest is not None
+                and time.time() - oldest < settings.ANCHOR_BATCH_WINDOW):
+            return 0
+
+        jobs = self.repository.claim(
+            settings.ANCHOR_BATCH_SIZE, settings.ANCHOR_CLAIM_TIMEOUT)
+        if not jobs:
+            return 0
+
+        leaves = [hash_leaf(job.hash_dados) for job in jobs]
+        root, proofs = build_tree(leaves)
+        batch = self.merkle_repository.create_batch(
+            root.hex(), jobs,
+            [leaf.hex() for leaf in leaves],
+            [[sibling.hex() for sibling in proof] for proof in proofs])
+
+        try:
+            tx_hash = self.blockchain_service.register_merkle_root(root, len(jobs))
+        except Exception as e:
+            print(f"Erro ao ancorar lote Merkle {batch.id} ({len(jobs)} denúncias): {e}")
+            self.merkle_repository.mark_failed(batch)
+            self.repository.mark_all_failed(
+                jobs, str(e), settings.ANCHOR_MAX_ATTEMPTS)
+            return 0
+
+        self.merkle_repository.mark_anchored(batch, tx_hash)
+        self.repository.mark_all_anchored(jobs, tx_hash)
+        self.receipt_tracker.track([(job.denuncia_id, tx_hash) for job in jobs])
+        return len(jobs)
+
+
+def run_anchor_worker() -> None:
+    """
+    Drain one batch of the anchor queue with its own database session.
+    """
+    db = SessionLocal()
+    try:
+        anchored = AnchorService(db, BlockchainService()).process_pending()
+        if anchored:
+            print(f"Fila de ancoragem: {anchored} denúncias registradas na blockchain")
+    finally:
+        db.close()
+
+
+def create_anchor_worker() -> PeriodicWorker:
+    """
+    Create the background worker that drains the anchor queue.
+    """
+    return PeriodicWorker(
+        "anchor-queue", run_anchor_worker, settings.ANCHOR_QUEUE_INTERVAL)
@@ -0,0 +1,49 @@
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.factories.blockchain_factory import BlockchainFactory
+from app.strategies.async_blockchain_provider import AsyncBlockchainProvider
+
+
+class AsyncBlockchainService:
+    """
+    Asyncio counterpart of BlockchainService for chain reads.
+    Uses the Strategy Pattern through AsyncBlockchainProvider implementations.
+    """
+
+    def __init__(self, provider_name: str = settings.BLOCKCHAIN_PROVIDER):
+        """
+        Initialize the async blockchain service with a provider.
+
+        Args:
+            provider_name: The name of the blockchain provider to use.
+        """
+        self.provider: AsyncBlockchainProvider = BlockchainFactory.get_async_provider(
+            provider_name)
+
+    async def get_total_denuncias(self) -> int:
+        """
+        Get the total number of denuncias on the blockchain.
+        """
+        return await self.provider.get_total_reports()
+
+    async def get_denuncia(self, denuncia_id: int) -> Tuple[str, int, str]:
+        """
+        Get a denuncia from the blockchain by ID.
+        Returns a tuple of (hashDados, dataHora, categoria).
+        """
+        return await self.provider.get_report(denuncia_id)
+
+    async def get_denuncias(self, denuncia_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several denuncias from the blockchain concurrently.
+        Returns a list of tuples (hashDados, dataHora, categoria).
+        """
+        return await self.provider.get_reports(denuncia_ids)
+
+    async def get_all_denuncias(self, blockchain_offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str, int, str]]:
+        """
+        Get all denuncias from the blockchain, or at most `limit` of them.
+        Returns a list of tuples (id, hashDados, dataHora, categoria).
+        """
+        return await self.provider.get_all_reports(blockchain_offset, limit)
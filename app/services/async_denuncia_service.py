@@ -0,0 +1,257 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.repositories.async_denuncia import AsyncDenunciaRepository
+from app.services.anchor_service import AnchorService
+from app.services.async_blockchain_service import AsyncBlockchainService
+from app.services.blockchain_service import BlockchainService
+from app.services.denuncia_service import (
+    build_create_response, build_ipfs_data, build_merkle_response, build_response, get_page_start,
+    get_scan_chunk_size)
+from app.services.receipt_tracker_service import ReceiptTrackerService
+from app.schemas.denuncia import Denuncia as DenunciaSchema
+from app.models.denuncia import Denuncia, StatusDenuncia, SeveridadeDenuncia
+from app.adapters.llm_adapter import LLMAdapter
+from app.adapters.storage_adapter import StorageAdapter
+from app.adapters.ipfs_adapter import IPFSAdapter
+from app.utils.pagination import MERKLE_CURSOR, encode_cursor
+
+
+class AsyncDenunciaService:
+    """
+    Service for the hot endpoints, creating and listing denuncias, on an
+    AsyncSession. Database and chain reads are awaited on the event loop;
+    only blocking calls (transaction signing, LLM, IPFS) go to a worker
+    thread.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        blockchain_service: BlockchainService,
+        async_blockchain_service: AsyncBlockchainService,
+        llm_adapter: Optional[LLMAdapter] = None,
+        use_ipfs: bool = False
+    ):
+        """
+        Initialize the async denuncia service.
+
+        Args:
+            db: Async database session.
+            blockchain_service: Shared blockchain service, used for writes.
+            async_blockchain_service: Shared async blockchain service, used
+                for reads.
+            llm_adapter: Shared LLM adapter for severity analysis.
+            use_ipfs: Whether to use IPFS for additional storage.
+        """
+        self.db = db
+        self.repository = AsyncDenunciaRepository(db)
+        self.blockchain_service = blockchain_service
+        self.async_blockchain_service = async_blockchain_service
+        self.llm_adapter = llm_adapter
+        self.storage_adapter: Optional[StorageAdapter] = None
+
+        if use_ipfs:
+            try:
+                self.storage_adapter = IPFSAdapter()
+            except Exception as e:
+                print(f"IPFS not available: {str(e)}")
+
+    async def create_denuncia(self, denuncia: DenunciaSchema) -> Dict[str, Any]:
+        """
+        Create a new denuncia, as DenunciaService.create_denuncia.
+        The anchor queue and receipt tracker repositories run on this
+        session through run_sync, in the same transactions as before.
+        """
+        hash_dados = self.blockchain_service.generate_hash(denuncia.dict())
+
+        if settings.ANCHOR_MODE.lower() in ("queue", "batch"):
+            tx_hash = None
+            db_denuncia = await self.repository.create_from_schema(
+                denuncia, hash_dados, commit=False)
+            await self.db.run_sync(lambda session: AnchorService(
+                session, self.blockchain_service).enqueue(db_denuncia))
+            await self.db.refresh(db_denuncia)
+        else:
+            tx_hash = await asyncio.to_thread(
+                self.blockchain_service.register_denuncia, hash_dados, denuncia.categoria)
+            db_denuncia = await self.repository.create_from_schema(denuncia, hash_dados)
+            await self.db.run_sync(lambda session: ReceiptTrackerService(
+                session, self.blockchain_service).track([(db_denuncia.id, tx_hash)]))
+
+        try:
+            user_denuncias = None
+            if db_denuncia.user_uuid:
+                user_denuncias = await self.repository.get_by_user_uuid(db_denuncia.user_uuid)
+            analysis = await asyncio.to_thread(
+                self._analyze_severity, db_denuncia, user_denuncias)
+
+            db_denuncia.severidade = analysis['severidade']
+            await self.db.commit()
+            await self.db.refresh(db_denuncia)
+        except Exception as e:
+            print(f"Erro na análise de severidade: {str(e)}")
+
+        ipfs_cid = None
+        if self.storage_adapter:
+            try:
+                ipfs_cid = await asyncio.to_thread(
+                    self.storage_adapter.store,
+                    build_ipfs_data(denuncia, db_denuncia, hash_dados, tx_hash))
+            except Exception as e:
+                print(f"Failed to store data on IPFS: {str(e)}")
+
+        return build_create_response(db_denuncia, hash_dados, tx_hash, ipfs_cid)
+
+    def _analyze_severity(self, denuncia: Denuncia, user_denuncias: Optional[List[Denuncia]]) -> Dict[str, Any]:
+        from app.services.severity_analysis_service import SeverityAnalysisService
+        severity_service = SeverityAnalysisService(None, llm_adapter=self.llm_adapter)
+        return severity_service.analyze_severity(denuncia, user_denuncias)
+
+    async def get_all_denuncias(
+        self,
+        status: Optional[StatusDenuncia] = None,
+        categoria: Optional[str] = None,
+        blockchain_offset: Optional[int] = 0,
+        user_uuid: Optional[str] = None,
+        severidade: Optional[SeveridadeDenuncia] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get denuncias from the blockchain, or from the local chain_reports
+        mirror when the chain indexer is enabled, enriched with database
+        data. Supports filtering by status, categoria, user_uuid and
+        severidade.
+
+        Denuncias anchored in Merkle batches (ANCHOR_MODE=batch) are not in
+        the contract's report list; they follow the chain reports, ordered
+        by ID and marked with anchor_type MERKLE and their proof.
+
+        Filters are applied before the page is cut, so every page but the
+        last holds `limit` denuncias. Pass the returned next_cursor to get
+        the following page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        start, merkle_after_id = get_page_start(blockchain_offset, cursor)
+
+        results = []
+        if start is not None:
+            results = await self._get_chain_denuncias(
+                status, categoria, start, user_uuid, severidade, limit)
+
+        if limit is None or len(results) <= limit:
+            results.extend(
+                build_merkle_response(*row)
+                for row in await self.repository.get_all_merkle_anchored(
+                    merkle_after_id, status, categoria, user_uuid, severidade,
+                    limit + 1 - len(results) if limit is not None else None))
+
+        return await self._build_page(results, limit)
+
+    async def _get_chain_denuncias(
+        self,
+        status: Optional[StatusDenuncia],
+        categoria: Optional[str],
+        start: int,
+        user_uuid: Optional[str],
+        severidade: Optional[SeveridadeDenuncia],
+        limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        List up to limit + 1 denuncias registered in the contract's report
+        list from blockchain ID start on.
+        """
+        if settings.CHAIN_INDEXER_ENABLED:
+            return await self._get_indexed_denuncias(
+                status, categoria, start, user_uuid, severidade, limit)
+
+        results = []
+        chunk_size = get_scan_chunk_size(limit)
+        while limit is None or len(results) <= limit:
+            blockchain_denuncias = await self.async_blockchain_service.get_all_denuncias(
+                start, chunk_size)
+            if not blockchain_denuncias:
+                break
+
+            results.extend(await self._enrich_blockchain_denuncias(
+                blockchain_denuncias, status, categoria, user_uuid, severidade))
+            start = blockchain_denuncias[-1][0] + 1
+
+            if chunk_size is None:
+                break
+
+        return results
+
+    async def _build_page(self, results: List[Dict[str, Any]], limit: Optional[int]) -> Dict[str, Any]:
+        """
+        Cut a page from results holding up to limit + 1 denuncias; the extra
+        one only signals that another page exists. The chain_status of the
+        page's denuncias is filled in with a single query.
+        """
+        next_cursor = None
+        if limit is not None and len(results) > limit:
+            results = results[:limit]
+            if "merkle_proof" in results[-1]:
+                next_cursor = encode_cursor(results[-1]["id"], MERKLE_CURSOR)
+            else:
+                next_cursor = encode_cursor(results[-1]["blockchain_id"])
+
+        denuncia_ids = [result["id"] for result in results]
+        chain_statuses = await self.db.run_sync(lambda session: ReceiptTrackerService(
+            session, self.blockchain_service).get_chain_statuses(denuncia_ids))
+        for result in results:
+            result["chain_status"] = chain_statuses.get(result["id"])
+
+        return {
+            "denuncias": results,
+            "next_cursor": next_cursor
+        }
+
+    async def _get_indexed_denuncias(
+        self,
+        status: Optional[StatusDenuncia],
+        categoria: Optional[str],
+        blockchain_offset: int,
+        user_uuid: Optional[str],
+        severidade: Optional[SeveridadeDenuncia],
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List denuncias from the local chain_reports mirror, fetching one row
+        past the limit so callers can tell whether another page exists.
+        """
+        return [
+            build_response(local_denuncia, chain_report.id, chain_report.data_hora)
+            for local_denuncia, chain_report in await self.repository.get_all_indexed(
+                blockchain_offset, status, categoria, user_uuid, severidade,
+                limit + 1 if limit is not None else None)
+        ]
+
+    async def _enrich_blockchain_denuncias(
+        self,
+        blockchain_denuncias: List[Tuple[int, str, int, str]],
+        status: Optional[StatusDenuncia],
+        categoria: Optional[str],
+        user_uuid: Optional[str],
+        severidade: Optional[SeveridadeDenuncia]
+    ) -> List[Dict[str, Any]]:
+        """
+        Join reports read from the chain with local denuncias and apply
+        filters. The local denuncias of the whole chunk are fetched in bulk,
+        and the filters are applied by that query.
+        """
+        local_denuncias = await self.repository.get_by_hashes(
+            [hash_dados for _, hash_dados, _, _ in blockchain_denuncias],
+            status, categoria, user_uuid, severidade)
+
+        return [
+            build_response(local_denuncias[hash_dados], denuncia_id, data_hora)
+            for denuncia_id, hash_dados, data_hora, _ in blockchain_denuncias
+            if hash_dados in local_denuncias
+        ]
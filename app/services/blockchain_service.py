@@ -1,8 +1,10 @@
 import hashlib
-from typing import Dict, Any, List, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
+from app.core.config import settings
 from app.factories.blockchain_factory import BlockchainFactory
 from app.strategies.blockchain_provider import BlockchainProvider
+from app.utils.background import PeriodicWorker
 
 
 class BlockchainService:
@@ -11,7 +13,7 @@ class BlockchainService:
     Uses the Strategy Pattern through BlockchainProvider implementations.
     """
 
-    def __init__(self, provider_name: str = "polygon"):
+    def __init__(self, provider_name: str = settings.BLOCKCHAIN_PROVIDER):
         """
         Initialize the blockchain service with a provider.
 
@@ -38,12 +40,21 @@ class BlockchainService:
 
         return hashlib.sha256(dados_concatenados.encode()).hexdigest()
 
-    def register_denuncia(self, hash_dados: str, categoria: str) -> str:
+    def register_denuncia(self, hash_dados: str, categoria: str,
+                          on_signed: Optional[Callable[[str], None]] = None) -> str:
         """
         Register a denuncia on the blockchain.
+        on_signed gets the transaction hash before the transaction is sent.
         Returns the transaction hash.
         """
-        return self.provider.register_report(hash_dados, categoria)
+        return self.provider.register_report(hash_dados, categoria, on_signed)
+
+    def register_merkle_root(self, root: bytes, count: int) -> str:
+        """
+        Anchor the Merkle root of a batch of denuncia hashes on the blockchain.
+        Returns the transaction hash.
+        """
+        return self.provider.register_merkle_root(root, count)
 
     def get_total_denuncias(self) -> int:
         """
@@ -58,12 +69,69 @@ class BlockchainService:
         """
         return self.provider.get_report(denuncia_id)
 
-    def get_all_denuncias(self, blockchain_offset: int = 0) -> List[Tuple[int, str, int, str]]:
+    def get_denuncias(self, denuncia_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several denuncias from the blockchain in batched reads.
+        Returns a list of tuples (hashDados, dataHora, categoria).
+        """
+        return self.provider.get_reports(denuncia_ids)
+
+    def get_all_denuncias(self, blockchain_offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str, int, str]]:
+        """
+        Get all denuncias from the blockchain, or at most `limit` of them.
+        Returns a list of tuples (id, hashDados, dataHora, categoria).
+        """
+        return self.provider.get_all_reports(blockchain_offset, limit)
+
+    def get_block_number(self) -> int:
+        """
+        Get the latest block number from the provider.
+        """
+        return self.provider.get_block_number()
+
+    def sync_nonce(self) -> None:
+        """
+        Sync the provider's local transaction nonce with the blockchain.
+        """
+        self.provider.sync_nonce()
+
+    def refresh_gas_oracle(self) -> None:
+        """
+        Refresh the provider's cached fee and gas limit model.
+        """
+        self.provider.refresh_gas_oracle()
+
+    def probe_rpc_endpoints(self) -> None:
+        """
+        Re-check the provider's ejected RPC endpoints.
+        """
+        self.provider.probe_rpc_endpoints()
+
+    def get_rpc_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Get the provider's per-endpoint RPC routing metrics.
+        """
+        return self.provider.get_rpc_metrics()
+
+    def refresh_chain_head(self) -> None:
+        """
+        Refresh the provider's cached chain head state.
         """
-        Get all denuncias from the blockchain.
+        self.provider.refresh_chain_head()
+
+    def get_denuncia_logs(self, from_block: int, to_block: int) -> List[Tuple[int, str, int, str]]:
+        """
+        Get denuncias announced by DenunciaRegistrada events in a block range.
         Returns a list of tuples (id, hashDados, dataHora, categoria).
         """
-        return self.provider.get_all_reports(blockchain_offset)
+        return self.provider.get_report_logs(from_block, to_block)
+
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> Dict[str, Optional[Dict[str, int]]]:
+        """
+        Get the receipts of several transactions in a single round-trip.
+        Returns a dict of tx_hash -> receipt, or None when not mined yet.
+        """
+        return self.provider.get_transaction_receipts(tx_hashes)
 
     def get_balance(self) -> float:
         """
@@ -76,3 +144,27 @@ class BlockchainService:
         Estimate the report cost from the provider.
         """
         return self.provider.estimate_report_cost()
+
+
+def create_chain_head_worker() -> PeriodicWorker:
+    """
+    Create the background worker that keeps the chain head cache warm.
+    """
+    return PeriodicWorker(
+        "chain-head", BlockchainService().refresh_chain_head, settings.CHAIN_HEAD_POLL_INTERVAL)
+
+
+def create_gas_oracle_worker() -> PeriodicWorker:
+    """
+    Create the background worker that samples fee history and gas estimates.
+    """
+    return PeriodicWorker(
+        "gas-oracle", BlockchainService().refresh_gas_oracle, settings.GAS_ORACLE_INTERVAL)
+
+
+def create_rpc_probe_worker() -> PeriodicWorker:
+    """
+    Create the background worker that re-checks ejected RPC endpoints.
+    """
+    return PeriodicWorker(
+        "rpc-probe", BlockchainService().probe_rpc_endpoints, settings.RPC_POOL_PROBE_INTERVAL)
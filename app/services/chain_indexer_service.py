@@ -0,0 +1,119 @@
+from typing import List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.config import SessionLocal
+from app.repositories.chain_report import ChainReportRepository
+from app.services.blockchain_service import BlockchainService
+from app.utils.background import PeriodicWorker
+
+
+class ChainIndexerService:
+    """
+    Service that mirrors the append-only DenunciaAnonima.denuncias array into
+    the local chain_reports table, so listings don't need to read the chain.
+    """
+
+    def __init__(self, db: Session, blockchain_service: BlockchainService):
+        """
+        Initialize the chain indexer service.
+
+        Args:
+            db: Database session.
+            blockchain_service: Blockchain service used to read new reports.
+        """
+        self.repository = ChainReportRepository(db)
+        self.blockchain_service = blockchain_service
+
+    def sync(self) -> int:
+        """
+        Index every report past the persisted high-water mark, reading either
+        the contract array or DenunciaRegistrada logs (CHAIN_INDEXER_SOURCE).
+
+        Returns:
+            The number of reports indexed.
+        """
+        if settings.CHAIN_INDEXER_SOURCE.lower() == "logs":
+            return self._sync_from_logs()
+
+        return self._sync_from_array()
+
+    def _sync_from_array(self) -> int:
+        """
+        Read reports past the high-water mark with batched obterDenuncia calls.
+        Each chunk is stored together with the new mark, so an interrupted
+        sync resumes where it stopped.
+        """
+        high_water_mark = self.repository.get_high_water_mark()
+        total = self.blockchain_service.get_total_denuncias()
+        chunk_size = max(1, settings.CHAIN_INDEXER_CHUNK_SIZE)
+
+        indexed = 0
+        for start in range(high_water_mark, total, chunk_size):
+            end = min(start + chunk_size, total)
+            self.repository.add_reports(self._read_from_array(start, end), end)
+            indexed += end - start
+
+        return indexed
+
+    def _sync_from_logs(self) -> int:
+        """
+        Read reports from DenunciaRegistrada logs, one eth_getLogs call per
+        window of LOGS_BLOCK_WINDOW blocks. IDs without an event (reports from
+        deployments that predate it) are filled in from the contract array.
+        """
+        next_id = self.repository.get_high_water_mark()
+        next_block = self.repository.get_next_block(
+            settings.CONTRACT_DEPLOY_BLOCK)
+        head = self.blockchain_service.get_block_number()
+        window = max(1, settings.LOGS_BLOCK_WINDOW)
+
+        indexed = 0
+        for from_block in range(next_block, head + 1, window):
+            to_block = min(from_block + window - 1, head)
+
+            reports = []
+            for report in self.blockchain_service.get_denuncia_logs(from_block, to_block):
+                if report[0] < next_id:
+                    continue
+                if report[0] > next_id:
+                    reports.extend(self._read_from_array(next_id, report[0]))
+                reports.append(report)
+                next_id = report[0] + 1
+
+            self.repository.add_reports(reports, next_id, to_block + 1)
+            indexed += len(reports)
+
+        return indexed + self._sync_from_array()
+
+    def _read_from_array(self, start: int, end: int) -> List[Tuple[int, str, int, str]]:
+        """
+        Read reports [start, end) from the contract array.
+        """
+        report_ids = list(range(start, end))
+        return [
+            (report_id, data[0], data[1], data[2])
+            for report_id, data in zip(report_ids, self.blockchain_service.get_denuncias(report_ids))
+        ]
+
+
+def run_chain_indexer() -> None:
+    """
+    Run a single indexer tick with its own database session.
+    """
+    db = SessionLocal()
+    try:
+        indexed = ChainIndexerService(db, BlockchainService()).sync()
+        if indexed:
+            print(f"Indexador: {indexed} denúncias indexadas da blockchain")
+    finally:
+        db.close()
+
+
+def create_chain_indexer_worker() -> PeriodicWorker:
+    """
+    Create the background worker that keeps chain_reports up to date.
+    """
+    return PeriodicWorker(
+        "chain-indexer", run_chain_indexer, settings.CHAIN_INDEXER_INTERVAL)
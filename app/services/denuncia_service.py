@@ -1,13 +1,134 @@
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.repositories.chain_report import ChainReportRepository
 from app.repositories.denuncia import DenunciaRepository
+from app.repositories.merkle import MerkleBatchRepository
+from app.services.anchor_service import AnchorService, build_proof
+from app.services.async_blockchain_service import AsyncBlockchainService
 from app.services.blockchain_service import BlockchainService
+from app.services.receipt_tracker_service import ReceiptTrackerService
 from app.schemas.denuncia import Denuncia as DenunciaSchema
-from app.models.denuncia import StatusDenuncia, SeveridadeDenuncia
+from app.models.anchor_job import AnchorState
+from app.models.merkle_batch import MerkleBatch, MerkleProof
+from app.models.denuncia import Denuncia, StatusDenuncia
+from app.adapters.llm_adapter import LLMAdapter
 from app.adapters.storage_adapter import StorageAdapter
 from app.adapters.ipfs_adapter import IPFSAdapter
+from app.utils.pagination import MERKLE_CURSOR, decode_listing_cursor
+
+
+def build_ipfs_data(
+    denuncia: DenunciaSchema,
+    db_denuncia: Denuncia,
+    hash_dados: str,
+    tx_hash: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build the additional data of a new denuncia stored on IPFS.
+    """
+    return {
+        "id": db_denuncia.id,
+        "descricao": denuncia.descricao,
+        "categoria": denuncia.categoria,
+        "latitude": denuncia.latitude,
+        "longitude": denuncia.longitude,
+        "datetime": str(denuncia.datetime),
+        "hash_dados": hash_dados,
+        "tx_hash": tx_hash,
+        "status": db_denuncia.status.value
+    }
+
+
+def build_create_response(
+    db_denuncia: Denuncia,
+    hash_dados: str,
+    tx_hash: Optional[str],
+    ipfs_cid: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build the response of a new denuncia: the transaction when it was
+    sent synchronously, the queued denuncia otherwise.
+    """
+    if tx_hash is None:
+        response = {
+            "status": AnchorState.ANCHOR_PENDING.value,
+            "denuncia_id": db_denuncia.id,
+            "hash_dados": hash_dados
+        }
+    else:
+        response = {
+            "status": "sucesso",
+            "tx_hash": tx_hash,
+            "hash_dados": hash_dados
+        }
+
+    if ipfs_cid:
+        response["ipfs_cid"] = ipfs_cid
+
+    return response
+
+
+def build_response(local_denuncia: Denuncia, denuncia_id: Optional[int], data_hora: Optional[int]) -> Dict[str, Any]:
+    """
+    Build the API representation of a local denuncia registered in the
+    contract's report list.
+    """
+    return {
+        "id": local_denuncia.id,
+        "descricao": local_denuncia.descricao,
+        "categoria": local_denuncia.categoria,
+        "latitude": getattr(local_denuncia, "latitude", None),
+        "longitude": getattr(local_denuncia, "longitude", None),
+        "datetime": local_denuncia.datetime,
+        "status": local_denuncia.status.value,
+        "hash_dados": local_denuncia.hash_dados,
+        "user_uuid": getattr(local_denuncia, "user_uuid", None),
+        "severidade": local_denuncia.severidade.value if local_denuncia.severidade else None,
+        "blockchain_id": denuncia_id,
+        "blockchain_timestamp": data_hora,
+        "anchor_type": "REPORT"
+    }
+
+
+def build_merkle_response(local_denuncia: Denuncia, proof: MerkleProof, batch: MerkleBatch) -> Dict[str, Any]:
+    """
+    Build the API representation of a local denuncia anchored in a Merkle
+    batch. Only the batch root is on chain, so there is no blockchain ID;
+    the inclusion proof is returned instead.
+    """
+    response = build_response(local_denuncia, None, None)
+    response["anchor_type"] = "MERKLE"
+    response["merkle_proof"] = build_proof(proof, batch)
+    return response
+
+
+def get_page_start(blockchain_offset: Optional[int], cursor: Optional[str]) -> Tuple[Optional[int], int]:
+    """
+    Get where a page starts from the cursor or the offset: the first
+    blockchain ID to read (None once the chain reports have been listed)
+    and the ID after which Merkle-anchored denuncias are listed.
+    """
+    decoded = decode_listing_cursor(cursor)
+    if decoded is None:
+        return blockchain_offset or 0, 0
+
+    kind, position = decoded
+    if kind == MERKLE_CURSOR:
+        return None, position
+    return position + 1, 0
+
+
+def get_scan_chunk_size(limit: Optional[int]) -> Optional[int]:
+    """
+    Number of chain reports read per step while filling a page.
+    """
+    if limit is None:
+        return None
+    return max(limit + 1, settings.BLOCKCHAIN_BATCH_SIZE)
 
 
 class DenunciaService:
@@ -15,7 +136,15 @@ class DenunciaService:
     Service for managing denuncias, combining blockchain and database operations.
     """
 
-    def __init__(self, db: Session, blockchain_provider: str = "polygon", use_ipfs: bool = False):
+    def __init__(
+        self,
+        db: Session,
+        blockchain_provider: str = settings.BLOCKCHAIN_PROVIDER,
+        use_ipfs: bool = False,
+        blockchain_service: Optional[BlockchainService] = None,
+        async_blockchain_service: Optional[AsyncBlockchainService] = None,
+        llm_adapter: Optional[LLMAdapter] = None
+    ):
         """
         Initialize the denuncia service.
 
@@ -23,10 +152,23 @@ class DenunciaService:
             db: Database session.
             blockchain_provider: The blockchain provider to use.
             use_ipfs: Whether to use IPFS for additional storage.
+            blockchain_service: Shared blockchain service; built from
+                blockchain_provider when not given.
+            async_blockchain_service: Shared async blockchain service; built
+                from blockchain_provider when not given.
+            llm_adapter: Shared LLM adapter for severity analysis; chosen by
+                SeverityAnalysisService when not given.
         """
         self.repository = DenunciaRepository(db)
-        self.blockchain_service = BlockchainService(
+        self.chain_report_repository = ChainReportRepository(db)
+        self.merkle_repository = MerkleBatchRepository(db)
+        self.blockchain_service = blockchain_service or BlockchainService(
+            provider_name=blockchain_provider)
+        self.async_blockchain_service = async_blockchain_service or AsyncBlockchainService(
             provider_name=blockchain_provider)
+        self.llm_adapter = llm_adapter
+        self.receipt_tracker = ReceiptTrackerService(
+            db, self.blockchain_service)
         self.storage_adapter: Optional[StorageAdapter] = None
 
         if use_ipfs:
@@ -39,19 +181,30 @@ class DenunciaService:
         """
         Create a new denuncia:
         1. Generate hash from denuncia data
-        2. Register hash on blockchain
+        2. Register hash on blockchain, or queue it when ANCHOR_MODE is "queue"
+           or "batch"
         3. Store denuncia in database
         4. If IPFS is enabled, store additional data on IPFS
         """
         denuncia_dict = denuncia.dict()
         hash_dados = self.blockchain_service.generate_hash(denuncia_dict)
-        tx_hash = self.blockchain_service.register_denuncia(
-            hash_dados, denuncia.categoria)
-        db_denuncia = self.repository.create_from_schema(denuncia, hash_dados)
+
+        if settings.ANCHOR_MODE.lower() in ("queue", "batch"):
+            tx_hash = None
+            db_denuncia = self.repository.create_from_schema(
+                denuncia, hash_dados, commit=False)
+            AnchorService(self.repository.db, self.blockchain_service).enqueue(db_denuncia)
+            self.repository.db.refresh(db_denuncia)
+        else:
+            tx_hash = self.blockchain_service.register_denuncia(
+                hash_dados, denuncia.categoria)
+            db_denuncia = self.repository.create_from_schema(denuncia, hash_dados)
+            self.receipt_tracker.track([(db_denuncia.id, tx_hash)])
 
         try:
             from app.services.severity_analysis_service import SeverityAnalysisService
-            severity_service = SeverityAnalysisService(self.repository.db)
+            severity_service = SeverityAnalysisService(
+                self.repository.db, llm_adapter=self.llm_adapter)
             analysis = severity_service.analyze_severity(db_denuncia)
 
             db_denuncia.severidade = analysis['severidade']
@@ -63,32 +216,41 @@ class DenunciaService:
         ipfs_cid = None
         if self.storage_adapter:
             try:
-                additional_data = {
-                    "id": db_denuncia.id,
-                    "descricao": denuncia.descricao,
-                    "categoria": denuncia.categoria,
-                    "latitude": denuncia.latitude,
-                    "longitude": denuncia.longitude,
-                    "datetime": str(denuncia.datetime),
-                    "hash_dados": hash_dados,
-                    "tx_hash": tx_hash,
-                    "status": db_denuncia.status.value
-                }
-
-                ipfs_cid = self.storage_adapter.store(additional_data)
+                ipfs_cid = self.storage_adapter.store(build_ipfs_data(
+                    denuncia, db_denuncia, hash_dados, tx_hash))
             except Exception as e:
                 print(f"Failed to store data on IPFS: {str(e)}")
 
-        response = {
-            "status": "sucesso",
-            "tx_hash": tx_hash,
-            "hash_dados": hash_dados
+        return build_create_response(db_denuncia, hash_dados, tx_hash, ipfs_cid)
+
+    def get_anchor_status(self, denuncia_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the anchoring state of a queued denuncia.
+        """
+        job = AnchorService(self.repository.db, self.blockchain_service).get_job(denuncia_id)
+        if job is None:
+            return None
+
+        return {
+            "denuncia_id": job.denuncia_id,
+            "hash_dados": job.hash_dados,
+            "status": job.state.value,
+            "tx_hash": job.tx_hash,
+            "attempts": job.attempts,
+            "last_error": job.last_error
         }
 
-        if ipfs_cid:
-            response["ipfs_cid"] = ipfs_cid
+    def get_merkle_proof(self, denuncia_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the Merkle inclusion proof of a denuncia anchored in a batch.
+        """
+        proof = AnchorService(self.repository.db, self.blockchain_service).get_proof(denuncia_id)
+        if proof is None:
+            return None
 
-        return response
+        denuncia = self.repository.get_by_id(denuncia_id)
+        proof["hash_dados"] = denuncia.hash_dados
+        return proof
 
     def update_denuncia_status(self, denuncia_id: int, new_status: StatusDenuncia) -> Optional[Dict[str, Any]]:
         """
@@ -111,53 +273,45 @@ class DenunciaService:
             }
         return None
 
-    def get_all_denuncias(
-        self,
-        status: Optional[StatusDenuncia] = None,
-        categoria: Optional[str] = None,
-        blockchain_offset: Optional[int] = 0,
-        user_uuid: Optional[str] = None,
-        severidade: Optional[SeveridadeDenuncia] = None
-    ) -> List[Dict[str, Any]]:
+    def update_denuncia_statuses(self, updates: List[Tuple[int, StatusDenuncia]]) -> List[Dict[str, Any]]:
         """
-        Get all denuncias from blockchain and enrich with database data.
-        Supports filtering by status, categoria, user_uuid, and severidade.
+        Update the status of several denuncias in a single transaction.
+
+        Returns:
+            One outcome per pair, in request order: UPDATED, UNCHANGED (the
+            denuncia already had that status) or NOT_FOUND.
+
+        Raises:
+            ValueError: If the batch is empty, larger than
+                STATUS_BATCH_MAX_SIZE or repeats an ID.
         """
-        blockchain_denuncias = self.blockchain_service.get_all_denuncias(
-            blockchain_offset)
+        if not updates:
+            raise ValueError("Informe ao menos uma denúncia.")
+        if len(updates) > settings.STATUS_BATCH_MAX_SIZE:
+            raise ValueError(
+                f"No máximo {settings.STATUS_BATCH_MAX_SIZE} denúncias por lote.")
 
-        results = []
-        for denuncia_id, hash_dados, data_hora, categoria_blockchain in blockchain_denuncias:
-            local_denuncia = self.repository.get_by_hash(hash_dados)
-
-            if local_denuncia:
-                if status and local_denuncia.status != status:
-                    continue
-
-                if categoria and local_denuncia.categoria.lower() != categoria.lower():
-                    continue
-
-                if user_uuid and local_denuncia.user_uuid != user_uuid:
-                    continue
-
-                if severidade and local_denuncia.severidade != severidade:
-                    continue
-
-                results.append({
-                    "id": local_denuncia.id,
-                    "descricao": local_denuncia.descricao,
-                    "categoria": local_denuncia.categoria,
-                    "latitude": getattr(local_denuncia, "latitude", None),
-                    "longitude": getattr(local_denuncia, "longitude", None),
-                    "datetime": local_denuncia.datetime,
-                    "status": local_denuncia.status.value,
-                    "hash_dados": local_denuncia.hash_dados,
-                    "user_uuid": getattr(local_denuncia, "user_uuid", None),
-                    "severidade": local_denuncia.severidade.value if local_denuncia.severidade else None,
-                    "blockchain_id": denuncia_id,
-                    "blockchain_timestamp": data_hora
-                })
+        new_statuses = dict(updates)
+        if len(new_statuses) != len(updates):
+            raise ValueError("Cada denúncia deve aparecer uma única vez no lote.")
+
+        old_statuses = self.repository.update_statuses(new_statuses)
 
+        results = []
+        for denuncia_id, new_status in updates:
+            old_status = old_statuses.get(denuncia_id)
+            if old_status is None:
+                outcome = "NOT_FOUND"
+            elif old_status == new_status:
+                outcome = "UNCHANGED"
+            else:
+                outcome = "UPDATED"
+            results.append({
+                "id": denuncia_id,
+                "status": new_status.value,
+                "previous_status": old_status.value if old_status else None,
+                "outcome": outcome
+            })
         return results
 
     def get_denuncia_by_blockchain_id(self, denuncia_id: int) -> Optional[Dict[str, Any]]:
@@ -165,37 +319,85 @@ class DenunciaService:
         Get a specific denuncia by its blockchain ID.
         """
         try:
-            total = self.blockchain_service.get_total_denuncias()
-            if denuncia_id < 0 or denuncia_id >= total:
-                return None
-
-            hash_dados, data_hora, categoria = self.blockchain_service.get_denuncia(
-                denuncia_id)
-
-            local_denuncia = self.repository.get_by_hash(hash_dados)
-
-            if local_denuncia:
-                return {
-                    "id": local_denuncia.id,
-                    "descricao": local_denuncia.descricao,
-                    "categoria": local_denuncia.categoria,
-                    "latitude": getattr(local_denuncia, "latitude", None),
-                    "longitude": getattr(local_denuncia, "longitude", None),
-                    "datetime": local_denuncia.datetime,
-                    "status": local_denuncia.status.value,
-                    "hash_dados": local_denuncia.hash_dados,
-                    "user_uuid": getattr(local_denuncia, "user_uuid", None),
-                    "severidade": local_denuncia.severidade.value if local_denuncia.severidade else None,
-                    "blockchain_id": denuncia_id,
-                    "blockchain_timestamp": data_hora
-                }
-            else:
-                return {
-                    "blockchain_id": denuncia_id,
-                    "hash_dados": hash_dados,
-                    "blockchain_timestamp": data_hora,
-                    "categoria": categoria
-                }
+            chain_data = self._get_indexed_report(denuncia_id)
+
+            if chain_data is None:
+                total = self.blockchain_service.get_total_denuncias()
+                if denuncia_id < 0 or denuncia_id >= total:
+                    return None
+
+                chain_data = self.blockchain_service.get_denuncia(denuncia_id)
+
+            return self._build_detail_response(denuncia_id, *chain_data)
+        except Exception as e:
+            print(f"Error getting denuncia: {str(e)}")
+            return None
+
+    async def get_denuncia_by_blockchain_id_async(self, denuncia_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Asyncio variant of get_denuncia_by_blockchain_id.
+        """
+        try:
+            chain_data = await asyncio.to_thread(self._get_indexed_report, denuncia_id)
+
+            if chain_data is None:
+                total = await self.async_blockchain_service.get_total_denuncias()
+                if denuncia_id < 0 or denuncia_id >= total:
+                    return None
+
+                chain_data = await self.async_blockchain_service.get_denuncia(denuncia_id)
+
+            return await asyncio.to_thread(self._build_detail_response, denuncia_id, *chain_data)
         except Exception as e:
             print(f"Error getting denuncia: {str(e)}")
             return None
+
+    def get_merkle_anchored_denuncia(self, denuncia_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a denuncia anchored in a Merkle batch by its local ID, with its
+        inclusion proof. Returns None until its batch has been sent.
+        """
+        result = self.merkle_repository.get_proof(denuncia_id)
+        if result is None or result[1].state != AnchorState.ANCHORED:
+            return None
+
+        response = build_merkle_response(
+            self.repository.get_by_id(denuncia_id), *result)
+        response["chain_status"] = self.receipt_tracker.get_chain_statuses(
+            [denuncia_id]).get(denuncia_id)
+        return response
+
+    def _get_indexed_report(self, denuncia_id: int) -> Optional[Tuple[str, int, str]]:
+        """
+        Get (hashDados, dataHora, categoria) from the local mirror, if indexed.
+        """
+        if not settings.CHAIN_INDEXER_ENABLED:
+            return None
+
+        chain_report = self.chain_report_repository.get_report(denuncia_id)
+        if chain_report is None:
+            return None
+
+        return chain_report.hash_dados, chain_report.data_hora, chain_report.categoria
+
+    def _build_detail_response(self, denuncia_id: int, hash_dados: str, data_hora: int, categoria: str) -> Dict[str, Any]:
+        """
+        Build the detail response of an on-chain report, enriched with the
+        local denuncia when one exists.
+        """
+        local_denuncia = self.repository.get_by_hashes([hash_dados]).get(hash_dados)
+
+        if local_denuncia:
+            response = build_response(local_denuncia, denuncia_id, data_hora)
+            response["chain_status"] = self.receipt_tracker.get_chain_statuses(
+                [local_denuncia.id]).get(local_denuncia.id)
+            return response
+
+        return {
+            "blockchain_id": denuncia_id,
+            "hash_dados": hash_dados,
+            "blockchain_timestamp": data_hora,
+            "categoria": categoria,
+            "anchor_type": "REPORT",
+            "chain_status": None
+        }
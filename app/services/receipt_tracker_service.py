@@ -0,0 +1,145 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.config import SessionLocal
+from app.models.tx_receipt import TxReceipt, TxStatus
+from app.repositories.tx_receipt import TxReceiptRepository
+from app.services.blockchain_service import BlockchainService
+from app.utils.background import PeriodicWorker
+
+
+class ReceiptTrackerService:
+    """
+    Service that follows the transactions sent for denuncias until they are
+    confirmed, reverted or dropped. Every poll fetches the receipts of up to
+    RECEIPT_TRACKER_BATCH_SIZE in-flight transactions with a single batched
+    JSON-RPC request, least recently checked first, so every transaction is
+    polled in turn.
+    """
+
+    def __init__(self, db: Session, blockchain_service: BlockchainService):
+        """
+        Initialize the receipt tracker service.
+
+        Args:
+            db: Database session.
+            blockchain_service: Blockchain service used to read receipts.
+        """
+        self.repository = TxReceiptRepository(db)
+        self.blockchain_service = blockchain_service
+
+    def track(self, transactions: List[Tuple[int, str]]) -> None:
+        """
+        Start tracking (denuncia_id, tx_hash) pairs. Does nothing when the
+        tracker is disabled.
+        """
+        if settings.RECEIPT_TRACKER_ENABLED and transactions:
+            self.repository.track(transactions)
+
+    def poll(self, head_block: int) -> int:
+        """
+        Fetch the receipts of in-flight transactions and record their state
+        at head_block.
+
+        Returns:
+            The number of transactions whose state was updated.
+        """
+        in_flight = self.repository.get_in_flight(
+            settings.RECEIPT_TRACKER_BATCH_SIZE)
+        if not in_flight:
+            return 0
+
+        receipts = self.blockchain_service.get_transaction_receipts(
+            list(in_flight))
+
+        now = int(time.time())
+        updates: Dict[str, Dict[str, Any]] = {}
+        for tx_hash, (status, submitted_at) in in_flight.items():
+            values = self._get_receipt_values(
+                receipts.get(tx_hash), status, submitted_at, head_block, now)
+            values[TxReceipt.checked_at] = now
+            updates[tx_hash] = values
+
+        self.repository.update_transactions(updates)
+        return len(updates)
+
+    def get_chain_statuses(self, denuncia_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the chain_status of several denuncias with one query. Denuncias
+        without a tracked transaction are left out.
+        """
+        return {
+            denuncia_id: self._build_chain_status(receipt)
+            for denuncia_id, receipt in self.repository.get_latest_by_denuncia_ids(denuncia_ids).items()
+        }
+
+    @staticmethod
+    def _get_receipt_values(
+        receipt: Optional[Dict[str, int]],
+        status: TxStatus,
+        submitted_at: int,
+        head_block: int,
+        now: int
+    ) -> Dict[Any, Any]:
+        if receipt is None:
+            if status == TxStatus.MINED:
+                # The block holding it was reorged out; wait for re-inclusion.
+                return {TxReceipt.status: TxStatus.PENDING, TxReceipt.block_number: None,
+                        TxReceipt.gas_used: None, TxReceipt.confirmations: None}
+            if now - submitted_at > settings.TX_DROP_TIMEOUT:
+                return {TxReceipt.status: TxStatus.DROPPED}
+            return {}
+
+        confirmations = max(0, head_block - receipt["block_number"] + 1)
+        if receipt["status"] == 0:
+            new_status = TxStatus.REVERTED
+        elif confirmations >= settings.TX_CONFIRMATIONS:
+            new_status = TxStatus.CONFIRMED
+        else:
+            new_status = TxStatus.MINED
+
+        return {
+            TxReceipt.status: new_status,
+            TxReceipt.block_number: receipt["block_number"],
+            TxReceipt.gas_used: receipt["gas_used"],
+            TxReceipt.confirmations: confirmations
+        }
+
+    @staticmethod
+    def _build_chain_status(receipt: TxReceipt) -> Dict[str, Any]:
+        return {
+            "status": receipt.status.value,
+            "tx_hash": receipt.tx_hash,
+            "block_number": receipt.block_number,
+            "gas_used": receipt.gas_used,
+            "confirmations": receipt.confirmations
+        }
+
+
+def create_receipt_tracker_worker() -> PeriodicWorker:
+    """
+    Create the background worker that polls transaction receipts. Receipts
+    are only fetched when the chain head has moved since the last poll, so
+    there is at most one batched request per block.
+    """
+    blockchain_service = BlockchainService()
+    last_polled_block: Optional[int] = None
+
+    def run_receipt_tracker() -> None:
+        nonlocal last_polled_block
+        head_block = blockchain_service.get_block_number()
+        if head_block == last_polled_block:
+            return
+
+        db = SessionLocal()
+        try:
+            ReceiptTrackerService(db, blockchain_service).poll(head_block)
+            last_polled_block = head_block
+        finally:
+            db.close()
+
+    return PeriodicWorker(
+        "receipt-tracker", run_receipt_tracker, settings.RECEIPT_TRACKER_INTERVAL)
@@ -0,0 +1,144 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.config import SessionLocal
+from app.models.reconciliation import ReconciliationIssueKind, ReconciliationRun
+from app.repositories.reconciliation import ReconciliationRepository
+from app.services.blockchain_service import BlockchainService
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+class ReconciliationService:
+    """
+    Service that checks the denuncias table against the reports on chain.
+
+    On-chain reports are streamed in chunks of RECONCILE_CHUNK_SIZE into a
+    staging table and compared with denuncias by SQL joins, so memory use
+    stays at one chunk whatever the number of reports. Every discrepancy
+    (missing, orphaned or duplicate hash_dados) is stored with the run.
+    """
+
+    def __init__(self, db: Session, blockchain_service: BlockchainService):
+        """
+        Initialize the reconciliation service.
+
+        Args:
+            db: Database session.
+            blockchain_service: Blockchain service used to read reports.
+        """
+        self.repository = ReconciliationRepository(db)
+        self.blockchain_service = blockchain_service
+
+    def start(self) -> ReconciliationRun:
+        """
+        Create a run without executing it yet.
+        """
+        return self.repository.create_run()
+
+    def run(self, run_id: Optional[int] = None, chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Execute a run, creating it first when run_id is not given.
+
+        Returns:
+            The summary of the finished run.
+        """
+        if run_id is None:
+            run_id = self.start().id
+        chunk_size = max(1, chunk_size or settings.RECONCILE_CHUNK_SIZE)
+
+        try:
+            total = self.blockchain_service.get_total_denuncias()
+            for start in range(0, total, chunk_size):
+                report_ids = list(range(start, min(start + chunk_size, total)))
+                reports = self.blockchain_service.get_denuncias(report_ids)
+                self.repository.add_chain_reports(run_id, [
+                    (report_id, report[0])
+                    for report_id, report in zip(report_ids, reports)
+                ])
+
+            run = self.repository.complete_run(run_id, total)
+        except Exception as e:
+            self.repository.fail_run(run_id, str(e))
+            raise
+
+        return self._serialize_run(run)
+
+    def get_run(self, run_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the summary of a run, or of the latest one when run_id is not given.
+        """
+        if run_id is None:
+            run = self.repository.get_latest_run()
+        else:
+            run = self.repository.get_by_id(run_id)
+        return self._serialize_run(run) if run else None
+
+    def get_issues(
+        self,
+        run_id: int,
+        kind: Optional[ReconciliationIssueKind] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a page of the issues of a run.
+
+        Returns:
+            {"issues": [...], "next_cursor": ...}; next_cursor is None on the
+            last page.
+        """
+        after_id = decode_cursor(cursor) if cursor else None
+        issues = self.repository.get_issues(run_id, kind, after_id, limit + 1)
+
+        next_cursor = None
+        if len(issues) > limit:
+            issues = issues[:limit]
+            next_cursor = encode_cursor(issues[-1].id)
+
+        return {
+            "issues": [
+                {
+                    "kind": issue.kind.value,
+                    "source": issue.source,
+                    "hash_dados": issue.hash_dados,
+                    "blockchain_id": issue.report_id,
+                    "denuncia_id": issue.denuncia_id,
+                    "occurrences": issue.occurrences
+                }
+                for issue in issues
+            ],
+            "next_cursor": next_cursor
+        }
+
+    @staticmethod
+    def _serialize_run(run: ReconciliationRun) -> Dict[str, Any]:
+        return {
+            "run_id": run.id,
+            "state": run.state.value,
+            "started_at": run.started_at,
+            "finished_at": run.finished_at,
+            "chain_total": run.chain_total,
+            "local_max_id": run.local_max_id,
+            "missing": run.missing,
+            "orphaned": run.orphaned,
+            "duplicates": run.duplicates,
+            "error": run.error
+        }
+
+
+def run_reconciliation(run_id: int) -> None:
+    """
+    Execute a reconciliation run created by the admin endpoint, with its own
+    database session. Errors are recorded on the run.
+    """
+    db = SessionLocal()
+    try:
+        summary = ReconciliationService(db, BlockchainService()).run(run_id)
+        print(f"Reconciliação {run_id}: {summary['missing']} ausentes, "
+              f"{summary['orphaned']} órfãs, {summary['duplicates']} duplicadas")
+    except Exception as e:
+        print(f"Erro na reconciliação {run_id}: {e}")
+    finally:
+        db.close()
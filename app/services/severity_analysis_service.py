@@ -2,6 +2,7 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from app.models.denuncia import Denuncia
 from app.repositories.denuncia import DenunciaRepository
+from app.adapters.llm_adapter import LLMAdapter
 from app.factories.llm_factory import LLMFactory, EnvironmentLLMFactory
 from app.prompts.severity_analysis_prompts import format_severity_prompt
 
@@ -11,12 +12,14 @@ class SeverityAnalysisService:
     Serviço para análise automática de severidade das denúncias usando LLM.
     """
 
-    def __init__(self, db: Session, llm_provider: str = "auto"):
+    def __init__(self, db: Optional[Session], llm_provider: str = "auto", llm_adapter: Optional[LLMAdapter] = None):
         self.db = db
         self.repository = DenunciaRepository(db)
 
         try:
-            if llm_provider == "auto":
+            if llm_adapter is not None:
+                self.llm_adapter = llm_adapter
+            elif llm_provider == "auto":
                 self.llm_adapter = EnvironmentLLMFactory.create_for_environment(
                     "development")
             else:
@@ -29,12 +32,14 @@ class SeverityAnalysisService:
             raise RuntimeError(
                 f"Erro ao configurar LLM '{llm_provider}': {str(e)}. Análise de severidade requer LLM.")
 
-    def analyze_severity(self, denuncia: Denuncia) -> Dict[str, Any]:
+    def analyze_severity(self, denuncia: Denuncia, user_denuncias: Optional[List[Denuncia]] = None) -> Dict[str, Any]:
         """
         Analisa a severidade de uma denúncia usando LLM.
 
         Args:
             denuncia: Objeto Denuncia para análise
+            user_denuncias: Denúncias do usuário já carregadas; consultadas
+                no banco quando não informadas
 
         Returns:
             Dictionary com análise completa de severidade
@@ -52,8 +57,9 @@ class SeverityAnalysisService:
 
         historico_usuario = "Não disponível"
         if denuncia.user_uuid:
-            user_denuncias = self.repository.get_by_user_uuid(
-                denuncia.user_uuid)
+            if user_denuncias is None:
+                user_denuncias = self.repository.get_by_user_uuid(
+                    denuncia.user_uuid)
             if user_denuncias:
                 verified_count = sum(
                     1 for d in user_denuncias if d.status.value == 'VERIFIED')
@@ -148,19 +154,75 @@ class SeverityAnalysisService:
             'resultados': resultados
         }
 
-    def get_severity_statistics(self) -> Dict[str, Any]:
+    def get_severity_statistics(
+        self,
+        inicio: Optional[str] = None,
+        fim: Optional[str] = None,
+        por_categoria: bool = False,
+        por_status: bool = False
+    ) -> Dict[str, Any]:
         """
-        Obtém estatísticas sobre a distribuição de severidade das denúncias.
+        Obtém estatísticas sobre a distribuição de severidade das denúncias,
+        contadas pelo banco com GROUP BY severidade. inicio e fim devem
+        estar no formato armazenado (2024-01-15T10:30:00Z).
+
+        Args:
+            inicio: Considera apenas denúncias com datetime >= inicio
+            fim: Considera apenas denúncias com datetime < fim
+            por_categoria: Inclui a distribuição de cada categoria
+            por_status: Inclui a distribuição de cada status
         """
-        all_denuncias = self.db.query(Denuncia).all()
+        severity_counts = self._count_severities(
+            self.repository.count_by_severidade(inicio=inicio, fim=fim))
+        total_denuncias = sum(severity_counts.values())
 
-        if not all_denuncias:
+        if total_denuncias == 0:
             return {
                 "message": "Nenhuma denúncia encontrada",
                 "total_denuncias": 0,
                 "distribuicao_severidade": {}
             }
 
+        total_com_severidade = total_denuncias - severity_counts["NAO_ANALISADA"]
+
+        result = {
+            "total_denuncias": total_denuncias,
+            "total_com_severidade": total_com_severidade,
+            "total_sem_severidade": severity_counts["NAO_ANALISADA"],
+            "distribuicao_severidade": self._build_distribution(severity_counts),
+            "prioridade_critica": severity_counts["CRITICA"],
+            "requer_atencao_urgente": severity_counts["CRITICA"] + severity_counts["ALTA"],
+            "taxa_cobertura_analise": round((total_com_severidade / total_denuncias) * 100, 2)
+        }
+
+        if inicio is not None or fim is not None:
+            result["periodo"] = {"inicio": inicio, "fim": fim}
+        if por_categoria:
+            result["por_categoria"] = self._get_breakdown("categoria", inicio, fim)
+        if por_status:
+            result["por_status"] = self._get_breakdown("status", inicio, fim)
+
+        return result
+
+    def _get_breakdown(self, breakdown: str, inicio: Optional[str], fim: Optional[str]) -> Dict[str, Any]:
+        """
+        Distribuição de severidade de cada valor da coluna breakdown.
+        """
+        rows_by_value: Dict[str, list] = {}
+        for value, severidade, count in self.repository.count_by_severidade(breakdown, inicio, fim):
+            key = value.value if hasattr(value, "value") else value
+            rows_by_value.setdefault(key, []).append((severidade, count))
+
+        return {
+            key: self._build_distribution(self._count_severities(rows))
+            for key, rows in rows_by_value.items()
+        }
+
+    @staticmethod
+    def _count_severities(rows) -> Dict[str, int]:
+        """
+        Converte linhas (severidade, contagem) na contagem de cada nível.
+        """
         severity_counts = {
             "CRITICA": 0,
             "ALTA": 0,
@@ -168,36 +230,19 @@ class SeverityAnalysisService:
             "BAIXA": 0,
             "NAO_ANALISADA": 0
         }
+        for severidade, count in rows:
+            severity_counts[severidade.value if severidade else "NAO_ANALISADA"] += count
+        return severity_counts
 
-        for denuncia in all_denuncias:
-            if denuncia.severidade:
-                severity_counts[denuncia.severidade.value] += 1
-            else:
-                severity_counts["NAO_ANALISADA"] += 1
-
-        total_com_severidade = sum(
-            v for k, v in severity_counts.items() if k != "NAO_ANALISADA")
-        total_denuncias = len(all_denuncias)
-
-        percentuais = {}
-        for severidade, count in severity_counts.items():
-            if total_denuncias > 0:
-                percentuais[severidade] = round(
-                    (count / total_denuncias) * 100, 2)
-            else:
-                percentuais[severidade] = 0.0
-
+    @staticmethod
+    def _build_distribution(severity_counts: Dict[str, int]) -> Dict[str, Any]:
+        total = sum(severity_counts.values())
         return {
-            "total_denuncias": total_denuncias,
-            "total_com_severidade": total_com_severidade,
-            "total_sem_severidade": severity_counts["NAO_ANALISADA"],
-            "distribuicao_severidade": {
-                "contagem": severity_counts,
-                "percentuais": percentuais
-            },
-            "prioridade_critica": severity_counts["CRITICA"],
-            "requer_atencao_urgente": severity_counts["CRITICA"] + severity_counts["ALTA"],
-            "taxa_cobertura_analise": round((total_com_severidade / total_denuncias) * 100, 2) if total_denuncias > 0 else 0.0
+            "contagem": severity_counts,
+            "percentuais": {
+                severidade: round((count / total) * 100, 2) if total > 0 else 0.0
+                for severidade, count in severity_counts.items()
+            }
         }
 
     def get_llm_info(self) -> Dict[str, Any]:
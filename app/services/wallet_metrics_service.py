@@ -0,0 +1,95 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.services.blockchain_service import BlockchainService
+from app.utils.background import PeriodicWorker
+
+
+class WalletMetricsCache:
+    """
+    Process-wide snapshot of the blockchain account balance and the
+    estimated cost of a report, refreshed by a background worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+
+    def set(self, balance: float, cost_per_report: float) -> None:
+        with self._lock:
+            self._snapshot = {
+                "balance": balance,
+                "cost_per_report": cost_per_report,
+                "updated_at": datetime.now(timezone.utc)
+            }
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return dict(self._snapshot) if self._snapshot else None
+
+
+wallet_metrics_cache = WalletMetricsCache()
+
+
+class WalletMetricsService:
+    """
+    Service for the account metrics shown on the admin status endpoint.
+    Reads are served from the cache, so polling them costs no RPC calls.
+    """
+
+    def __init__(self, blockchain_service: BlockchainService, cache: WalletMetricsCache = wallet_metrics_cache):
+        """
+        Initialize the wallet metrics service.
+
+        Args:
+            blockchain_service: Blockchain service used to refresh the metrics.
+            cache: Cache holding the latest snapshot.
+        """
+        self.blockchain_service = blockchain_service
+        self.cache = cache
+
+    def refresh(self) -> None:
+        """
+        Read the balance and cost estimate from the blockchain and cache them.
+        On failure the previous snapshot is kept, and it goes stale.
+        """
+        balance = self.blockchain_service.get_balance()
+        cost_per_report = self.blockchain_service.estimate_report_cost()
+        self.cache.set(balance, cost_per_report)
+
+    def get_status(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached account status, or None if it hasn't been read yet.
+        """
+        snapshot = self.cache.get()
+        if snapshot is None:
+            return None
+
+        balance = snapshot["balance"]
+        cost_per_report = snapshot["cost_per_report"]
+        if cost_per_report > 0:
+            remaining_reports = int(balance / cost_per_report)
+        else:
+            remaining_reports = float('inf')
+
+        stale_after = snapshot["updated_at"] + timedelta(
+            seconds=settings.WALLET_METRICS_MAX_AGE)
+        return {
+            "account_balance_matic": balance,
+            "estimated_cost_per_report_matic": cost_per_report,
+            "estimated_remaining_reports": remaining_reports,
+            "updated_at": snapshot["updated_at"].isoformat(),
+            "stale_after": stale_after.isoformat(),
+            "stale": datetime.now(timezone.utc) > stale_after
+        }
+
+
+def create_wallet_metrics_worker() -> PeriodicWorker:
+    """
+    Create the background worker that refreshes the wallet metrics cache.
+    """
+    return PeriodicWorker(
+        "wallet-metrics", WalletMetricsService(BlockchainService()).refresh,
+        settings.WALLET_METRICS_INTERVAL)
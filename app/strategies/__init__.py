@@ -1,4 +1,10 @@
 from app.strategies.blockchain_provider import BlockchainProvider
 from app.strategies.polygon_provider import PolygonProvider
+from app.strategies.async_blockchain_provider import AsyncBlockchainProvider
+from app.strategies.async_polygon_provider import AsyncPolygonProvider
+from app.strategies.local_provider import LocalProvider
+from app.strategies.async_local_provider import AsyncLocalProvider
 
-__all__ = ['BlockchainProvider', 'PolygonProvider']
+__all__ = ['BlockchainProvider', 'PolygonProvider',
+           'AsyncBlockchainProvider', 'AsyncPolygonProvider',
+           'LocalProvider', 'AsyncLocalProvider']
@@ -0,0 +1,68 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Tuple, List, Optional
+
+
+class AsyncBlockchainProvider(ABC):
+    """
+    Abstract base class for asyncio blockchain providers.
+    Mirrors the read side of BlockchainProvider with awaitable methods, so
+    chain calls don't hold a threadpool worker while waiting on the RPC node.
+    """
+
+    @abstractmethod
+    async def get_total_reports(self) -> int:
+        """
+        Get the total number of reports on the blockchain.
+
+        Returns:
+            The total number of reports.
+        """
+        pass
+
+    @abstractmethod
+    async def get_report(self, report_id: int) -> Tuple[str, int, str]:
+        """
+        Get a report from the blockchain by ID.
+
+        Args:
+            report_id: The ID of the report to get.
+
+        Returns:
+            A tuple of (hash_data, timestamp, category).
+        """
+        pass
+
+    async def get_reports(self, report_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several reports from the blockchain concurrently.
+
+        Args:
+            report_ids: The IDs of the reports to get.
+
+        Returns:
+            A list of (hash_data, timestamp, category) tuples, in the same
+            order as report_ids.
+        """
+        return list(await asyncio.gather(
+            *(self.get_report(report_id) for report_id in report_ids)))
+
+    async def get_all_reports(self, blockchain_offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str, int, str]]:
+        """
+        Get all reports from the blockchain.
+
+        Args:
+            blockchain_offset: The ID of the first report to return.
+            limit: Maximum number of reports to return (all when None).
+
+        Returns:
+            A list of tuples (id, hash_data, timestamp, category).
+        """
+        total = await self.get_total_reports()
+        end = total if limit is None else min(total, blockchain_offset + limit)
+        report_ids = list(range(blockchain_offset, end))
+        reports = await self.get_reports(report_ids)
+        return [
+            (report_id, data[0], data[1], data[2])
+            for report_id, data in zip(report_ids, reports)
+        ]
@@ -0,0 +1,32 @@
+from typing import List, Tuple
+
+from app.blockchain.local_chain import local_chain
+from app.strategies.async_blockchain_provider import AsyncBlockchainProvider
+
+
+class AsyncLocalProvider(AsyncBlockchainProvider):
+    """
+    Asyncio counterpart of LocalProvider. Latency is awaited, so it
+    behaves like a node answering concurrent requests.
+    """
+
+    async def get_total_reports(self) -> int:
+        """
+        Get the total number of reports on the local chain.
+        """
+        await local_chain.simulate_async()
+        return local_chain.obter_total_denuncias()
+
+    async def get_report(self, report_id: int) -> Tuple[str, int, str]:
+        """
+        Get a report from the local chain by ID.
+        """
+        await local_chain.simulate_async()
+        return local_chain.obter_denuncia(report_id)
+
+    async def get_reports(self, report_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several reports in a single simulated round-trip.
+        """
+        await local_chain.simulate_async()
+        return [local_chain.obter_denuncia(report_id) for report_id in report_ids]
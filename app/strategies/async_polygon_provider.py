@@ -0,0 +1,61 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+from app.blockchain.polygon import async_contract, chain_head, report_cache
+from app.core.config import settings
+from app.strategies.async_blockchain_provider import AsyncBlockchainProvider
+from app.strategies.polygon_provider import PolygonProvider
+
+
+class AsyncPolygonProvider(AsyncBlockchainProvider):
+    """
+    Polygon blockchain provider implementation backed by AsyncWeb3.
+    Every RPC call goes through a process-wide semaphore, so fan-outs from
+    concurrent requests never exceed settings.BLOCKCHAIN_MAX_CONCURRENCY
+    in-flight calls against the node.
+    """
+
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _sync_provider = PolygonProvider()
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(
+                max(1, settings.BLOCKCHAIN_MAX_CONCURRENCY))
+        return cls._semaphore
+
+    async def get_total_reports(self) -> int:
+        """
+        Get the total number of reports on the Polygon blockchain.
+        Served from the chain head cache when it is fresh.
+        """
+        head = chain_head.get_fresh()
+        if head is not None:
+            return head[1]
+
+        async with self._get_semaphore():
+            return await async_contract.functions.obterTotalDenuncias().call()
+
+    async def get_report(self, report_id: int) -> Tuple[str, int, str]:
+        """
+        Get a report from the Polygon blockchain by ID.
+        Reports already in the local report cache are not fetched again.
+        """
+        if report_cache is not None:
+            cached = report_cache.get(report_id)
+            if cached is not None:
+                return cached
+
+        async with self._get_semaphore():
+            return await async_contract.functions.obterDenuncia(report_id).call()
+
+    async def get_reports(self, report_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several reports from the Polygon blockchain through
+        PolygonProvider.get_reports, so listings read the confirmed reports
+        from the local report cache and fetch the rest in JSON-RPC batches
+        instead of one 'obterDenuncia' call per report.
+        """
+        async with self._get_semaphore():
+            return await asyncio.to_thread(self._sync_provider.get_reports, report_ids)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Any, List
+from typing import Callable, Tuple, Any, Dict, List, Optional
 
 
 class BlockchainProvider(ABC):
@@ -9,13 +9,30 @@ class BlockchainProvider(ABC):
     """
 
     @abstractmethod
-    def register_report(self, hash_data: str, category: str) -> str:
+    def register_report(self, hash_data: str, category: str,
+                        on_signed: Optional[Callable[[str], None]] = None) -> str:
         """
         Register a report on the blockchain.
 
         Args:
             hash_data: The hash of the report data.
             category: The category of the report.
+            on_signed: Called with the transaction hash once the transaction
+                is signed, before it is sent.
+
+        Returns:
+            The transaction hash.
+        """
+        pass
+
+    @abstractmethod
+    def register_merkle_root(self, root: bytes, count: int) -> str:
+        """
+        Anchor the Merkle root of a batch of report hashes on the blockchain.
+
+        Args:
+            root: The 32-byte Merkle root.
+            count: The number of report hashes in the batch.
 
         Returns:
             The transaction hash.
@@ -45,16 +62,114 @@ class BlockchainProvider(ABC):
         """
         pass
 
+    def get_reports(self, report_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several reports from the blockchain.
+
+        Providers that can pack many reads into a single round-trip should
+        override this; the default falls back to one get_report per ID.
+
+        Args:
+            report_ids: The IDs of the reports to get.
+
+        Returns:
+            A list of (hash_data, timestamp, category) tuples, in the same
+            order as report_ids.
+        """
+        return [self.get_report(report_id) for report_id in report_ids]
+
     @abstractmethod
-    def get_all_reports(self, blockchain_offset: int = 0) -> List[Tuple[int, str, int, str]]:
+    def get_all_reports(self, blockchain_offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str, int, str]]:
         """
         Get all reports from the blockchain.
 
+        Args:
+            blockchain_offset: The ID of the first report to return.
+            limit: Maximum number of reports to return (all when None).
+
         Returns:
             A list of tuples (id, hash_data, timestamp, category).
         """
         pass
 
+    @abstractmethod
+    def get_block_number(self) -> int:
+        """
+        Get the number of the latest block.
+
+        Returns:
+            The latest block number.
+        """
+        pass
+
+    def sync_nonce(self) -> None:
+        """
+        Sync any locally managed transaction nonce with the blockchain.
+        Called at startup; providers that don't manage nonces don't need to
+        override it.
+        """
+        pass
+
+    def refresh_gas_oracle(self) -> None:
+        """
+        Refresh any cached fee and gas limit model. Called periodically by
+        the gas oracle worker; providers without one don't need to override it.
+        """
+        pass
+
+    def probe_rpc_endpoints(self) -> None:
+        """
+        Re-check any RPC endpoints that were taken out of rotation. Called
+        periodically by the RPC probe worker; providers without an endpoint
+        pool don't need to override it.
+        """
+        pass
+
+    def get_rpc_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Get the health and routing counters of each RPC endpoint.
+        Providers without an endpoint pool return an empty list.
+        """
+        return []
+
+    def refresh_chain_head(self) -> None:
+        """
+        Refresh any cached chain head state (block number, total reports).
+        Called periodically by the chain head poller; providers without a
+        cache don't need to override it.
+        """
+        pass
+
+    @abstractmethod
+    def get_report_logs(self, from_block: int, to_block: int) -> List[Tuple[int, str, int, str]]:
+        """
+        Get the reports announced by DenunciaRegistrada events in a block range
+        (inclusive), with a single log query.
+
+        Args:
+            from_block: First block of the range.
+            to_block: Last block of the range.
+
+        Returns:
+            A list of tuples (id, hash_data, timestamp, category), ordered by ID.
+        """
+        pass
+
+    @abstractmethod
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> Dict[str, Optional[Dict[str, int]]]:
+        """
+        Get the receipts of several transactions in a single round-trip.
+
+        Args:
+            tx_hashes: The hashes of the transactions.
+
+        Returns:
+            A dict of tx_hash -> receipt, where a receipt has block_number,
+            gas_used and status (1 success, 0 reverted), or None if the
+            transaction has not been mined.
+        """
+        pass
+
     @abstractmethod
     def get_balance(self) -> float:
         """
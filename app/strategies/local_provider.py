@@ -0,0 +1,99 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.blockchain.local_chain import GAS_PRICE_WEI, local_chain
+from app.strategies.blockchain_provider import BlockchainProvider
+
+
+class LocalProvider(BlockchainProvider):
+    """
+    In-process blockchain provider backed by the LocalChain emulation of the
+    DenunciaAnonima contract. Needs no node or network, for local
+    development and benchmarks.
+    """
+
+    def register_report(self, hash_data: str, category: str,
+                        on_signed: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Register a report on the local chain. Registration is atomic here,
+        so there is no signed-but-unsent transaction to report to on_signed.
+        """
+        local_chain.simulate()
+        return local_chain.registrar_denuncia(hash_data, category)
+
+    def register_merkle_root(self, root: bytes, count: int) -> str:
+        """
+        Anchor a Merkle root of report hashes on the local chain.
+        """
+        local_chain.simulate()
+        return local_chain.registrar_lote_merkle(root, count)
+
+    def get_total_reports(self) -> int:
+        """
+        Get the total number of reports on the local chain.
+        """
+        local_chain.simulate()
+        return local_chain.obter_total_denuncias()
+
+    def get_report(self, report_id: int) -> Tuple[str, int, str]:
+        """
+        Get a report from the local chain by ID.
+        """
+        local_chain.simulate()
+        return local_chain.obter_denuncia(report_id)
+
+    def get_reports(self, report_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several reports in a single simulated round-trip, like a batched
+        JSON-RPC request.
+        """
+        local_chain.simulate()
+        return [local_chain.obter_denuncia(report_id) for report_id in report_ids]
+
+    def get_all_reports(self, blockchain_offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str, int, str]]:
+        """
+        Get all reports from the local chain.
+        """
+        local_chain.simulate()
+        end = None if limit is None else blockchain_offset + limit
+        if end is None:
+            end = local_chain.obter_total_denuncias()
+        reports = local_chain.obter_denuncias(blockchain_offset, end)
+        return [
+            (blockchain_offset + i, data[0], data[1], data[2])
+            for i, data in enumerate(reports)
+        ]
+
+    def get_block_number(self) -> int:
+        """
+        Get the latest block number of the local chain.
+        """
+        local_chain.simulate()
+        return local_chain.get_block_number()
+
+    def get_report_logs(self, from_block: int, to_block: int) -> List[Tuple[int, str, int, str]]:
+        """
+        Get the reports announced by DenunciaRegistrada events in a block range.
+        """
+        local_chain.simulate()
+        return local_chain.get_denuncia_logs(from_block, to_block)
+
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> Dict[str, Optional[Dict[str, int]]]:
+        """
+        Get transaction receipts in a single simulated round-trip.
+        """
+        local_chain.simulate()
+        return {tx_hash: local_chain.get_receipt(tx_hash) for tx_hash in tx_hashes}
+
+    def get_balance(self) -> float:
+        """
+        Get the balance of the local sending account.
+        """
+        local_chain.simulate()
+        return local_chain.get_balance() / 10**18
+
+    def estimate_report_cost(self) -> float:
+        """
+        Estimate the cost of a single 'registrarDenuncia' transaction.
+        """
+        local_chain.simulate()
+        return local_chain.estimate_denuncia_gas("0" * 64, "estimativa") * GAS_PRICE_WEI / 10**18
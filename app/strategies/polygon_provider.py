@@ -1,6 +1,7 @@
-from typing import Tuple, List
+from typing import Any, Callable, Dict, Tuple, List, Optional
 
-from app.blockchain.polygon import w3, contract
+from app.blockchain.polygon import (
+    w3, contract, chain_head, gas_oracle, nonce_manager, report_cache, rpc_pool, rpc_provider)
 from app.core.config import settings
 from app.strategies.blockchain_provider import BlockchainProvider
 
@@ -10,52 +11,237 @@ class PolygonProvider(BlockchainProvider):
     Polygon blockchain provider implementation.
     """
 
-    def register_report(self, hash_data: str, category: str) -> str:
+    def register_report(self, hash_data: str, category: str,
+                        on_signed: Optional[Callable[[str], None]] = None) -> str:
         """
         Register a report on the Polygon blockchain.
+        The nonce comes from the shared local nonce manager, so concurrent
+        submissions never collide, and fees and gas limit from the gas
+        oracle cache. on_signed gets the hash of the signed transaction
+        before it is broadcast.
         """
-        nonce = w3.eth.get_transaction_count(settings.PUBLIC_ADDRESS)
+        max_priority_fee, max_fee = gas_oracle.get_fees()
 
-        txn = contract.functions.registrarDenuncia(hash_data, category).build_transaction({
-            'nonce': nonce,
-            'gas': 300000,
-            'maxPriorityFeePerGas': w3.to_wei('25', 'gwei'),
-            'maxFeePerGas': w3.to_wei('50', 'gwei'),
-        })
+        with nonce_manager.reserve() as nonce:
+            txn = contract.functions.registrarDenuncia(hash_data, category).build_transaction({
+                'nonce': nonce,
+                'gas': gas_oracle.get_gas_limit("registrarDenuncia", len(category.encode())),
+                'maxPriorityFeePerGas': max_priority_fee,
+                'maxFeePerGas': max_fee,
+            })
 
-        signed_txn = w3.eth.account.sign_transaction(
-            txn, private_key=settings.PRIVATE_KEY)
+            signed_txn = w3.eth.account.sign_transaction(
+                txn, private_key=settings.PRIVATE_KEY)
+            if on_signed is not None:
+                on_signed(w3.to_hex(signed_txn.hash))
 
-        tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
 
         return w3.to_hex(tx_hash)
 
+    def register_merkle_root(self, root: bytes, count: int) -> str:
+        """
+        Anchor a Merkle root of report hashes through registrarLoteMerkle.
+        """
+        max_priority_fee, max_fee = gas_oracle.get_fees()
+
+        with nonce_manager.reserve() as nonce:
+            txn = contract.functions.registrarLoteMerkle(root, count).build_transaction({
+                'nonce': nonce,
+                'gas': gas_oracle.get_gas_limit("registrarLoteMerkle"),
+                'maxPriorityFeePerGas': max_priority_fee,
+                'maxFeePerGas': max_fee,
+            })
+
+            signed_txn = w3.eth.account.sign_transaction(
+                txn, private_key=settings.PRIVATE_KEY)
+
+            tx_hash = w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+
+        return w3.to_hex(tx_hash)
+
+    def refresh_gas_oracle(self) -> None:
+        """
+        Sample the latest fee history and fill missing gas estimates.
+        """
+        gas_oracle.refresh()
+
+    def probe_rpc_endpoints(self) -> None:
+        """
+        Probe the ejected endpoints of the RPC pool and restore those that answer.
+        """
+        rpc_provider.probe()
+
+    def get_rpc_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Get the latency, error rate and routing counters of the RPC pool.
+        """
+        return rpc_pool.get_metrics()
+
+    def sync_nonce(self) -> None:
+        """
+        Sync the local nonce counter from the node's pending transaction count.
+        """
+        nonce_manager.sync()
+
     def get_total_reports(self) -> int:
         """
         Get the total number of reports on the Polygon blockchain.
+        Served from the chain head cache while the block number is unchanged.
+        """
+        return self.get_chain_head()[1]
+
+    def get_chain_head(self) -> Tuple[int, int]:
+        """
+        Get (block_number, total_reports), asking the node only when the
+        cached head is older than CHAIN_HEAD_MAX_AGE.
+        """
+        head = chain_head.get_fresh()
+        if head is not None:
+            return head
+
+        return chain_head.update(w3.eth.block_number, self._get_total_reports_at)
+
+    def refresh_chain_head(self) -> None:
         """
-        return contract.functions.obterTotalDenuncias().call()
+        Refresh the chain head cache; the total is re-read only on a new block.
+        """
+        chain_head.update(w3.eth.block_number, self._get_total_reports_at)
+
+    @staticmethod
+    def _get_total_reports_at(block_number: int) -> int:
+        return contract.functions.obterTotalDenuncias().call(
+            block_identifier=block_number)
 
     def get_report(self, report_id: int) -> Tuple[str, int, str]:
         """
         Get a report from the Polygon blockchain by ID.
+        Reports already in the local report cache are not fetched again.
+        """
+        if report_cache is not None:
+            cached = report_cache.get(report_id)
+            if cached is not None:
+                return cached
+
+        report = tuple(contract.functions.obterDenuncia(report_id).call())
+        self._cache_reports({report_id: report})
+        return report
+
+    def get_reports(self, report_ids: List[int]) -> List[Tuple[str, int, str]]:
+        """
+        Get several reports from the Polygon blockchain. Reports past the
+        local cache tail are fetched packing the 'obterDenuncia' calls into
+        JSON-RPC batches of settings.BLOCKCHAIN_BATCH_SIZE requests each.
         """
-        return contract.functions.obterDenuncia(report_id).call()
+        reports: Dict[int, Tuple[str, int, str]] = {}
+        if report_cache is not None and report_ids:
+            start = min(report_ids)
+            end = min(max(report_ids) + 1, len(report_cache))
+            reports.update(
+                zip(range(start, end), report_cache.get_range(start, end)))
+
+        missing_ids = [
+            report_id for report_id in report_ids if report_id not in reports]
+        chunk_size = max(1, settings.BLOCKCHAIN_BATCH_SIZE)
+        fetched: Dict[int, Tuple[str, int, str]] = {}
+
+        for start in range(0, len(missing_ids), chunk_size):
+            chunk = missing_ids[start:start + chunk_size]
+            with w3.batch_requests() as batch:
+                for report_id in chunk:
+                    batch.add(contract.functions.obterDenuncia(report_id))
+                fetched.update(
+                    (report_id, tuple(report)) for report_id, report in zip(chunk, batch.execute()))
+
+        self._cache_reports(fetched)
+        reports.update(fetched)
+        return [reports[report_id] for report_id in report_ids]
+
+    def _cache_reports(self, reports: Dict[int, Tuple[str, int, str]]) -> None:
+        """
+        Append fetched reports that extend the cache tail, as long as they are
+        REPORT_CACHE_CONFIRMATIONS blocks deep and can't be reorged away.
+        The confirmed total comes from the heads recorded by the chain head
+        poller, so no extra RPC call is made here.
+        """
+        if report_cache is None:
+            return
+
+        tail = len(report_cache)
+        if tail not in reports:
+            return
+
+        confirmed_total = chain_head.get_confirmed_total()
+        end = tail
+        while end in reports and end < confirmed_total:
+            end += 1
+
+        if end > tail:
+            report_cache.append(
+                tail, [reports[report_id] for report_id in range(tail, end)])
 
-    def get_all_reports(self, blockchain_offset: int = 0) -> List[Tuple[int, str, int, str]]:
+    def get_all_reports(self, blockchain_offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str, int, str]]:
         """
-        Get all reports from the Polygon blockchain.
+        Get all reports from the Polygon blockchain, or at most `limit`
+        reports starting at blockchain_offset.
         """
         total = self.get_total_reports()
-        reports = []
 
         print(f"Total de denuncias: {total}")
 
-        for i in range(blockchain_offset, total):
-            data = self.get_report(i)
-            reports.append((i, data[0], data[1], data[2]))
+        end = total if limit is None else min(total, blockchain_offset + limit)
+        report_ids = list(range(blockchain_offset, end))
+        return [
+            (report_id, data[0], data[1], data[2])
+            for report_id, data in zip(report_ids, self.get_reports(report_ids))
+        ]
 
-        return reports
+    def get_block_number(self) -> int:
+        """
+        Get the number of the latest Polygon block, from the chain head cache.
+        """
+        return self.get_chain_head()[0]
+
+    def get_report_logs(self, from_block: int, to_block: int) -> List[Tuple[int, str, int, str]]:
+        """
+        Get the reports announced by DenunciaRegistrada events in a block range
+        with one eth_getLogs call.
+        """
+        events = contract.events.DenunciaRegistrada.get_logs(
+            from_block=from_block, to_block=to_block)
+
+        return sorted(
+            (event["args"]["id"], event["args"]["hashDados"],
+             event["args"]["dataHora"], event["args"]["categoria"])
+            for event in events
+        )
+
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> Dict[str, Optional[Dict[str, int]]]:
+        """
+        Get transaction receipts with one batched eth_getTransactionReceipt
+        JSON-RPC request.
+        """
+        if not tx_hashes:
+            return {}
+
+        responses = w3.provider.make_batch_request(
+            [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes])
+        if not isinstance(responses, list):
+            raise ValueError(f"Batch receipt request failed: {responses.get('error')}")
+
+        receipts = {}
+        for tx_hash, response in zip(tx_hashes, responses):
+            if "error" in response:
+                raise ValueError(
+                    f"Error getting receipt of {tx_hash}: {response['error']}")
+
+            receipt = response.get("result")
+            receipts[tx_hash] = {
+                "block_number": int(receipt["blockNumber"], 16),
+                "gas_used": int(receipt["gasUsed"], 16),
+                "status": int(receipt["status"], 16)
+            } if receipt else None
+        return receipts
 
     def get_balance(self) -> float:
         """
@@ -68,21 +254,19 @@ class PolygonProvider(BlockchainProvider):
     def estimate_report_cost(self) -> float:
         """
         Estimate the cost of a single 'registrarDenuncia' transaction.
+        Errors are raised rather than replaced by a guess, so cached metrics
+        keep their last real value.
         """
-        try:
-            dummy_hash = "0x" + "0" * 64
-            dummy_category = "estimativa"
+        dummy_hash = "0x" + "0" * 64
+        dummy_category = "estimativa"
 
-            gas_estimate = contract.functions.registrarDenuncia(dummy_hash, dummy_category).estimate_gas({
-                'from': settings.PUBLIC_ADDRESS
-            })
+        gas_estimate = contract.functions.registrarDenuncia(dummy_hash, dummy_category).estimate_gas({
+            'from': settings.PUBLIC_ADDRESS
+        })
 
-            gas_price = w3.eth.gas_price
+        gas_price = w3.eth.gas_price
 
-            cost_wei = gas_estimate * gas_price
-            cost_matic = w3.from_wei(cost_wei, 'ether')
+        cost_wei = gas_estimate * gas_price
+        cost_matic = w3.from_wei(cost_wei, 'ether')
 
-            return float(cost_matic)
-        except Exception as e:
-            print(f"Error estimating gas: {e}")
-            return 0.01
+        return float(cost_matic)
@@ -0,0 +1,97 @@
+import os
+import threading
+from typing import Callable, List, Optional
+
+from app.utils.process_lock import ProcessLock
+
+
+class PeriodicWorker:
+    """
+    Runs a callable every `interval` seconds on a daemon thread.
+    Used for background jobs started and stopped by the application lifespan.
+    """
+
+    def __init__(self, name: str, target: Callable[[], None], interval: float):
+        """
+        Args:
+            name: Name of the worker, used for the thread name and logs.
+            target: Callable executed on every tick.
+            interval: Seconds to wait between the end of a tick and the next one.
+        """
+        self.name = name
+        self.target = target
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Start the worker thread. The first tick runs immediately.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Signal the worker to stop and wait for the current tick to finish.
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.target()
+            except Exception as e:
+                print(f"Erro no worker {self.name}: {str(e)}")
+
+            self._stop_event.wait(self.interval)
+
+
+class LeaderWorkers:
+    """
+    Runs a group of PeriodicWorkers in a single process among several (the
+    workers of a uvicorn server), elected by holding a ProcessLock. The
+    other processes retry every `interval` seconds and take over when the
+    leader exits.
+    """
+
+    def __init__(self, lock: ProcessLock, workers: List[PeriodicWorker], interval: float):
+        """
+        Args:
+            lock: Lock held by the leader for as long as it runs.
+            workers: Workers started only in the leader.
+            interval: Seconds between election attempts of the other processes.
+        """
+        self.lock = lock
+        self.workers = workers
+        self.is_leader = False
+        self._election = PeriodicWorker("leader-election", self._elect, interval)
+
+    def start(self) -> None:
+        self._election.start()
+
+    def stop(self) -> None:
+        self._election.stop()
+        if self.is_leader:
+            for worker in self.workers:
+                worker.stop()
+            self.lock.release()
+            self.is_leader = False
+
+    def _elect(self) -> None:
+        if self.is_leader or not self.lock.acquire(blocking=False):
+            return
+
+        self.is_leader = True
+        print(f"Processo {os.getpid()} executa os workers: "
+              f"{', '.join(worker.name for worker in self.workers)}")
+        for worker in self.workers:
+            worker.start()
@@ -0,0 +1,68 @@
+from typing import List, Tuple
+
+from eth_utils import keccak
+
+
+def hash_leaf(hash_dados: str) -> bytes:
+    """
+    Get the Merkle leaf of a denuncia: keccak256 of the raw bytes of its
+    hex-encoded hash_dados.
+    """
+    return keccak(bytes.fromhex(hash_dados))
+
+
+def hash_pair(a: bytes, b: bytes) -> bytes:
+    """
+    Hash two sibling nodes. Pairs are sorted before hashing, so a proof is
+    just the list of siblings (compatible with OpenZeppelin's MerkleProof).
+    """
+    return keccak(a + b if a <= b else b + a)
+
+
+def build_tree(leaves: List[bytes]) -> Tuple[bytes, List[List[bytes]]]:
+    """
+    Build a Merkle tree over the given leaves. A node without a sibling is
+    promoted to the next level unchanged.
+
+    Returns:
+        A tuple of (root, proofs), where proofs[i] lists the siblings on the
+        path from leaves[i] to the root.
+    """
+    if not leaves:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+
+    proofs: List[List[bytes]] = [[] for _ in leaves]
+    # Indexes of the original leaves under each node of the current level
+    members = [[i] for i in range(len(leaves))]
+    level = list(leaves)
+
+    while len(level) > 1:
+        next_level = []
+        next_members = []
+        for i in range(0, len(level), 2):
+            if i + 1 == len(level):
+                next_level.append(level[i])
+                next_members.append(members[i])
+                continue
+
+            left, right = level[i], level[i + 1]
+            for leaf_index in members[i]:
+                proofs[leaf_index].append(right)
+            for leaf_index in members[i + 1]:
+                proofs[leaf_index].append(left)
+            next_level.append(hash_pair(left, right))
+            next_members.append(members[i] + members[i + 1])
+        level = next_level
+        members = next_members
+
+    return level[0], proofs
+
+
+def verify_proof(leaf: bytes, proof: List[bytes], root: bytes) -> bool:
+    """
+    Check that a leaf belongs to the tree with the given root.
+    """
+    node = leaf
+    for sibling in proof:
+        node = hash_pair(node, sibling)
+    return node == root
@@ -0,0 +1,51 @@
+import base64
+import binascii
+from typing import Optional, Tuple
+
+# Cursor prefixes: a blockchain ID, or the local ID of a Merkle-anchored denuncia
+CHAIN_CURSOR = "b"
+MERKLE_CURSOR = "m"
+
+
+def encode_cursor(position: int, kind: str = CHAIN_CURSOR) -> str:
+    """
+    Encode the last position of a page as an opaque cursor.
+    """
+    return base64.urlsafe_b64encode(f"{kind}:{position}".encode()).decode().rstrip("=")
+
+
+def decode_listing_cursor(cursor: Optional[str]) -> Optional[Tuple[str, int]]:
+    """
+    Decode a cursor produced by encode_cursor into its kind (CHAIN_CURSOR or
+    MERKLE_CURSOR) and position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if not cursor:
+        return None
+
+    try:
+        decoded = base64.urlsafe_b64decode(
+            cursor + "=" * (-len(cursor) % 4)).decode()
+        kind, position = decoded.split(":", 1)
+        if kind not in (CHAIN_CURSOR, MERKLE_CURSOR):
+            raise ValueError
+        return kind, int(position)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise ValueError("Cursor inválido")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode a cursor produced by encode_cursor back into a blockchain ID.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    decoded = decode_listing_cursor(cursor)
+    if decoded is None:
+        return None
+    if decoded[0] != CHAIN_CURSOR:
+        raise ValueError("Cursor inválido")
+    return decoded[1]
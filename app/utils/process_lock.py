@@ -0,0 +1,65 @@
+import os
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: a single process is assumed
+    fcntl = None
+
+
+class ProcessLock:
+    """
+    Advisory lock on a file, shared by the processes of one host (the
+    workers of a uvicorn server). The lock is released by the OS when the
+    holding process exits, so a crashed holder never leaves it stale.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Lock file, created (with its directory) when missing.
+        """
+        self.path = path
+        self._file: Optional[int] = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Take the lock, waiting for it when blocking is True.
+
+        Returns:
+            True if the lock is held by this process.
+        """
+        if self._file is not None:
+            return True
+        if fcntl is None:
+            self._file = -1
+            return True
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            os.close(fd)
+            return False
+
+        self._file = fd
+        return True
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            os.close(self._file)
+        self._file = None
+
+    def __enter__(self) -> "ProcessLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
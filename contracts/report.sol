@@ -8,10 +8,30 @@ contract DenunciaAnonima {
         string categoria;
     }
 
+    struct LoteMerkle {
+        bytes32 raiz;
+        uint256 quantidade;
+        uint256 dataHora;
+    }
+
     Denuncia[] public denuncias;
+    LoteMerkle[] public lotes;
+
+    event DenunciaRegistrada(uint256 indexed id, string hashDados, uint256 dataHora, string categoria);
+    event LoteMerkleRegistrado(uint256 indexed id, bytes32 raiz, uint256 quantidade, uint256 dataHora);
 
     function registrarDenuncia(string memory _hashDados, string memory _categoria) public {
         denuncias.push(Denuncia(_hashDados, block.timestamp, _categoria));
+        emit DenunciaRegistrada(denuncias.length - 1, _hashDados, block.timestamp, _categoria);
+    }
+
+    function registrarLoteMerkle(bytes32 _raiz, uint256 _quantidade) public {
+        lotes.push(LoteMerkle(_raiz, _quantidade, block.timestamp));
+        emit LoteMerkleRegistrado(lotes.length - 1, _raiz, _quantidade, block.timestamp);
+    }
+
+    function obterTotalLotes() public view returns(uint256) {
+        return lotes.length;
     }
 
     function obterTotalDenuncias() public view returns(uint256) {
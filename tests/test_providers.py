@@ -0,0 +1,27 @@
+import threading
+
+from app.core import deps
+from app.core.config import settings
+from app.core.providers import ProviderRegistry
+
+
+def test_get_llm_adapter_with_api_key_does_not_deadlock(monkeypatch):
+    """
+    The OpenAI factory asks the registry for the shared httpx client while
+    the adapter is being created; that must not block on the registry lock.
+    """
+    registry = ProviderRegistry()
+    monkeypatch.setattr(deps, "providers", registry)
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    result = {}
+    worker = threading.Thread(
+        target=lambda: result.setdefault("adapter", deps.get_llm_adapter()),
+        daemon=True)
+    worker.start()
+    worker.join(timeout=10)
+
+    assert not worker.is_alive(), "get_llm_adapter() deadlocked"
+    assert result["adapter"] is not None
+    registry.close()